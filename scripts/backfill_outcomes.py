@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+VantaStonk — Outcome backfill
+
+Fills price_1d / price_3d / price_7d for every pending
+recommendation_outcomes row (spec §9.3). One history request per ticker,
+served through the local bar cache.
+
+Usage:
+    python scripts/backfill_outcomes.py
+"""
+
+import sys
+import os
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import open_db
+from src.integrations.bar_cache import BarCache
+from src.integrations.schwab_client import SchwabClient
+from src.workflows.backfill_outcomes import backfill_outcomes
+
+
+def main():
+    client = SchwabClient()
+    if not client.connect():
+        print("Failed to connect to Schwab API. Check your .env credentials.")
+        sys.exit(1)
+
+    conn = open_db(profile="scan_writer")
+    bar_cache = BarCache(client, conn)
+    report = backfill_outcomes(conn, bar_cache)
+    conn.close()
+
+    print(f"Pending outcomes: {report.pending} across {report.tickers} tickers")
+    print(f"  Updated: {report.updated} "
+          f"(1d: {report.filled['price_1d']}, 3d: {report.filled['price_3d']}, 7d: {report.filled['price_7d']})")
+    print(f"  History: {bar_cache.hits} cached, {bar_cache.fetches} fetched")
+    for ticker, err in report.errors.items():
+        print(f"  History failed for {ticker} — {err}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+VantaStonk — ai_samples_raw storage benchmark
+
+Writes the same synthetic AI samples (ROTATING_PROMPTS × models × runs,
+with model-style ticker-list responses) into the legacy plain-TEXT layout
+(baseline schema) and the current interned + zlib layout, then reports DB
+size and read throughput for each.
+
+Usage:
+    python scripts/bench_ai_samples.py
+    python scripts/bench_ai_samples.py --runs 365 --reads 5
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import SCHEMA_PATH, get_connection, open_db, save_ai_samples_raw, get_ai_samples_since
+from src.signals.prompts import ROTATING_PROMPTS
+
+MODELS = ["grok", "gpt-5", "claude-4.7"]
+SYMBOLS = ["ABCD", "WXYZ", "PLTR", "SOFI", "RKLB", "MARA", "IONQ", "HIMS", "CELH", "ASTS",
+           "OKLO", "SMR", "ACHR", "JOBY", "LUNR", "RXRX", "TMDX", "VKTX", "CAVA", "DUOL"]
+
+
+def synthetic_rows(runs: int, seed: int = 7) -> list[tuple]:
+    rng = random.Random(seed)
+    rows = []
+    for day in range(runs):
+        captured_at = f"2026-{1 + day // 28 % 12:02d}-{1 + day % 28:02d}T06:00:00"
+        for prompt in ROTATING_PROMPTS[:5]:
+            for model in MODELS:
+                picks = rng.sample(SYMBOLS, 8)
+                body = "\n".join(
+                    f"{i}. **${t}** — {rng.choice(['Under-followed', 'Near-term catalyst', 'Relative strength', 'Short squeeze setup'])}: "
+                    f"{rng.choice(['revenue inflecting', 'FDA decision pending', 'new contract win', 'margin expansion'])} "
+                    f"with {rng.randint(5, 60)}% upside if the thesis plays out."
+                    for i, t in enumerate(picks, 1)
+                )
+                rows.append((captured_at, model, prompt.prompt_id, prompt.text, body, picks, 0.01))
+    return rows
+
+
+def db_bytes(path: str) -> int:
+    return sum(p.stat().st_size for p in (Path(path), Path(f"{path}-wal")) if p.exists())
+
+
+def bench_legacy(path: str, rows: list[tuple], reads: int) -> dict:
+    conn = get_connection(path)
+    conn.executescript(Path(SCHEMA_PATH).read_text())   # baseline: plain TEXT columns
+    conn.executemany("""
+        INSERT INTO ai_samples_raw
+            (captured_at, model, prompt_id, prompt_text, response_text, tickers_extracted, token_cost_usd)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, ((c, m, pid, pt, rt, json.dumps(te), cost) for c, m, pid, pt, rt, te, cost in rows))
+    conn.commit()
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    start = time.perf_counter()
+    for _ in range(reads):
+        out = [dict(r) for r in conn.execute(
+            "SELECT * FROM ai_samples_raw WHERE captured_at >= ? ORDER BY captured_at DESC", ("",))]
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return {"bytes": db_bytes(path), "rows_per_sec": len(out) * reads / elapsed}
+
+
+def bench_current(path: str, rows: list[tuple], reads: int) -> dict:
+    conn = open_db(path)
+    save_ai_samples_raw(conn, rows)
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    start = time.perf_counter()
+    for _ in range(reads):
+        out = get_ai_samples_since(conn, "")
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return {"bytes": db_bytes(path), "rows_per_sec": len(out) * reads / elapsed}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ai_samples_raw storage layouts")
+    parser.add_argument("--runs", type=int, default=180, help="Daily runs to synthesize")
+    parser.add_argument("--reads", type=int, default=3, help="Full-table reads to time")
+    args = parser.parse_args()
+
+    rows = synthetic_rows(args.runs)
+    text_bytes = sum(len(pt) + len(rt) for _, _, _, pt, rt, _, _ in rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = bench_legacy(str(Path(tmp) / "legacy.db"), rows, args.reads)
+        current = bench_current(str(Path(tmp) / "current.db"), rows, args.reads)
+
+    print(f"\n{len(rows):,} samples, {text_bytes / 1024:,.0f} KiB of prompt+response text")
+    print(f"{'LAYOUT':<22} {'DB SIZE':>12} {'READ ROWS/s':>14}")
+    print("-" * 50)
+    for name, r in (("plain TEXT (legacy)", legacy), ("interned + zlib", current)):
+        print(f"{name:<22} {r['bytes'] / 1024:>9,.0f} KiB {r['rows_per_sec']:>14,.0f}")
+    print(f"\nsize ratio: {current['bytes'] / legacy['bytes']:.2f}x, "
+          f"read throughput ratio: {current['rows_per_sec'] / legacy['rows_per_sec']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
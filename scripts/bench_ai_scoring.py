@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+VantaStonk — AI sampling score aggregation benchmark
+
+Times compute_ai_sampling_score called once per ticker (a filter over all
+mentions each time, O(tickers × mentions)) against the one-pass
+score_all_ai_sampling (O(mentions)) at growing universe sizes, and checks
+the two agree exactly.
+
+Usage:
+    python scripts/bench_ai_scoring.py
+    python scripts/bench_ai_scoring.py --sizes 100 1000 5000 --per-ticker 15
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.signals.ai_sampling import (
+    MODEL_WEIGHTS, MentionRecord, compute_ai_sampling_score, score_all_ai_sampling,
+)
+
+
+def synthetic_mentions(tickers: int, per_ticker: int, seed: int = 5) -> list[MentionRecord]:
+    rng = random.Random(seed)
+    names = [f"T{i:05d}" for i in range(tickers)]
+    models = list(MODEL_WEIGHTS)
+    return [
+        MentionRecord(ticker=rng.choice(names), model=rng.choice(models),
+                      rank=rng.randint(0, 14), is_fresh=rng.random() < 0.1)
+        for _ in range(tickers * per_ticker)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark AI sampling score aggregation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000, 2000])
+    parser.add_argument("--per-ticker", type=int, default=10, help="Mentions per ticker on average")
+    args = parser.parse_args()
+
+    print(f"\n{'TICKERS':>8} {'MENTIONS':>10} {'PER-TICKER (ms)':>16} {'ONE-PASS (ms)':>14} {'SPEEDUP':>8}")
+    print("-" * 62)
+    for n in args.sizes:
+        mentions = synthetic_mentions(n, args.per_ticker)
+        tickers = list(dict.fromkeys(m.ticker for m in mentions))
+
+        start = time.perf_counter()
+        legacy = {t: compute_ai_sampling_score(t, mentions) for t in tickers}
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        single = score_all_ai_sampling(mentions)
+        single_s = time.perf_counter() - start
+
+        if single != legacy:
+            sys.exit(f"mismatch at {n} tickers")
+        print(f"{n:>8,} {len(mentions):>10,} {legacy_s * 1000:>16,.1f} {single_s * 1000:>14,.2f} "
+              f"{legacy_s / single_s:>7,.0f}x")
+    print("\nOne-pass time should grow ~linearly with mentions; per-ticker grows ~quadratically.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+VantaStonk — Vectorized signal scoring benchmark
+
+Scores synthetic universes (velocity → score, RVOL → score, composite with
+~20% missing AI components) with the scalar functions in a Python loop and
+with the NumPy batch variants, checks they agree, and reports throughput.
+
+Usage:
+    python scripts/bench_batch_scoring.py
+    python scripts/bench_batch_scoring.py --sizes 100 1000 10000 100000 --repeat 5
+"""
+
+import sys
+import os
+import math
+import time
+import argparse
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.signals.batch import (
+    compute_velocity_batch, score_velocity_batch, compute_rvol_batch,
+    score_volume_anomaly_batch, compose_with_fallback_batch,
+)
+from src.signals.composite import compose_with_fallback
+from src.signals.social_velocity import compute_velocity, score_velocity
+from src.signals.volume_anomaly import compute_rvol, score_volume_anomaly
+
+
+def synthetic_inputs(n: int, seed: int = 9) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return {
+        "mentions": rng.integers(0, 300, n).astype(float),
+        "mentions_avg": rng.uniform(0, 40, n),
+        "volume": rng.uniform(0, 5e6, n),
+        "volume_avg": rng.uniform(0, 2e6, n),
+        "ai": np.where(rng.random(n) < 0.2, np.nan, rng.random(n)),
+    }
+
+
+def scalar_loop(d: dict) -> list[float]:
+    ai = d["ai"].tolist()
+    rows = zip(d["mentions"].tolist(), d["mentions_avg"].tolist(),
+               d["volume"].tolist(), d["volume_avg"].tolist(), ai)
+    return [
+        compose_with_fallback(
+            None if math.isnan(a) else a,
+            score_velocity(compute_velocity(m, ma)),
+            score_volume_anomaly(compute_rvol(v, va)),
+        )
+        for m, ma, v, va, a in rows
+    ]
+
+
+def batch(d: dict) -> np.ndarray:
+    return compose_with_fallback_batch(
+        d["ai"],
+        score_velocity_batch(compute_velocity_batch(d["mentions"], d["mentions_avg"])),
+        score_volume_anomaly_batch(compute_rvol_batch(d["volume"], d["volume_avg"])),
+    )
+
+
+def best_of(fn, d: dict, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(d)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs NumPy signal scoring")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N timings")
+    args = parser.parse_args()
+
+    print(f"\n{'TICKERS':>8} {'SCALAR (ms)':>12} {'NUMPY (ms)':>11} {'SPEEDUP':>8}")
+    print("-" * 42)
+    for n in args.sizes:
+        d = synthetic_inputs(n)
+        if batch(d).tolist() != scalar_loop(d):
+            sys.exit(f"mismatch at {n} tickers")
+        scalar_s = best_of(scalar_loop, d, args.repeat)
+        batch_s = best_of(batch, d, args.repeat)
+        print(f"{n:>8,} {scalar_s * 1000:>12.2f} {batch_s * 1000:>11.3f} {scalar_s / batch_s:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+VantaStonk — SQLite connection profile benchmark
+
+Runs the same synthetic scan workload against a throwaway database under
+each connection profile in CONNECTION_PROFILES and prints the timings:
+
+- write:  per-ticker snapshot + score + component inserts, one commit each
+          (the shape of the pre-unit_of_work scan loop)
+- bulk:   the same rows in a single unit_of_work
+- read:   recent-components + price-history lookups for every ticker
+
+Usage:
+    python scripts/bench_db_profiles.py
+    python scripts/bench_db_profiles.py --tickers 500 --rounds 3
+"""
+
+import sys
+import os
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.scoring import ScoreInputs, rank
+from src.db import (
+    CONNECTION_PROFILES, init_db, get_connection, unit_of_work,
+    upsert_tickers, save_price_snapshots, save_scores, save_prompt_pulse_components_bulk,
+    get_recent_components, get_price_history,
+)
+
+
+def _rows(tickers: list[str], scan: int):
+    ts = f"2026-05-15T06:{scan:02d}:00"
+    snapshots = [(t, 100.0 + i, 1000 * i) for i, t in enumerate(tickers)]
+    ranked = rank([ScoreInputs(ticker=t, catalyst=0.5, prompt_pulse=0.5, freshness=0.5, peer=0.5,
+                               volume=0.5, macro=0.5) for t in tickers])
+    components = [(t, ts, "premarket", 0.5, 0.5, 0.5, 0.5) for t in tickers]
+    return snapshots, ranked, components
+
+
+def bench_profile(profile: str, db_path: str, tickers: list[str], rounds: int) -> dict:
+    write_profile = "default" if CONNECTION_PROFILES[profile].read_only else profile
+    conn = get_connection(db_path, write_profile)
+    upsert_tickers(conn, tickers)
+
+    start = time.perf_counter()
+    for scan in range(rounds):
+        snapshots, ranked, components = _rows(tickers, scan)
+        for snap, score, comp in zip(snapshots, ranked, components):
+            save_price_snapshots(conn, [snap])
+            save_scores(conn, [score])
+            save_prompt_pulse_components_bulk(conn, [comp])
+    write_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for scan in range(rounds):
+        snapshots, ranked, components = _rows(tickers, rounds + scan)
+        with unit_of_work(conn):
+            save_price_snapshots(conn, snapshots)
+            save_scores(conn, ranked)
+            save_prompt_pulse_components_bulk(conn, components)
+    bulk_s = time.perf_counter() - start
+    conn.close()
+
+    reader = get_connection(db_path, profile)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for t in tickers:
+            get_recent_components(reader, t)
+            get_price_history(reader, t)
+    read_s = time.perf_counter() - start
+    reader.close()
+
+    return {"profile": profile, "write_s": write_s, "bulk_s": bulk_s, "read_s": read_s}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SQLite connection profiles")
+    parser.add_argument("--tickers", type=int, default=200, help="Tickers per synthetic scan")
+    parser.add_argument("--rounds", type=int, default=3, help="Scans per phase")
+    args = parser.parse_args()
+
+    tickers = [f"T{i:04d}" for i in range(args.tickers)]
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = {profile: str(Path(tmp) / f"{profile}.db") for profile in CONNECTION_PROFILES}
+        for db_path in paths.values():
+            init_db(db_path)
+        print(f"\n{'PROFILE':<14} {'WRITE(s)':>10} {'BULK(s)':>10} {'READ(s)':>10}")
+        print("-" * 48)
+        for profile, db_path in paths.items():
+            r = bench_profile(profile, db_path, tickers, args.rounds)
+            print(f"{r['profile']:<14} {r['write_s']:>10.3f} {r['bulk_s']:>10.3f} {r['read_s']:>10.3f}")
+    print("\n(reader profile writes through the default profile; only its READ column is its own)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+VantaStonk — Ticker extraction benchmark
+
+Times the legacy regex extractor (extract_tickers + extract_ranked_tickers)
+against the single-pass TickerExtractor over a corpus of AI responses:
+stored ai_samples_raw rows when the DB has enough of them, otherwise a
+synthetic corpus in the same style.
+
+Usage:
+    python scripts/bench_ticker_extract.py
+    python scripts/bench_ticker_extract.py --symbols data/nasdaqlisted.txt --min-corpus 5000
+"""
+
+import sys
+import os
+import time
+import random
+import argparse
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import DB_PATH, open_db, get_ai_samples_since
+from src.signals.ai_sampling import TickerExtractor, extract_tickers, extract_ranked_tickers
+
+SYMBOLS = ["ABCD", "WXYZ", "PLTR", "SOFI", "RKLB", "MARA", "IONQ", "HIMS", "CELH", "ASTS",
+           "OKLO", "SMR", "ACHR", "JOBY", "LUNR", "RXRX", "TMDX", "VKTX", "CAVA", "DUOL"]
+
+
+def synthetic_corpus(n: int, seed: int = 11) -> list[str]:
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        picks = rng.sample(SYMBOLS, 8)
+        lines = [f"Here are my TOP picks for THE week (NOT advice, DYOR):"]
+        lines += [
+            f"{i}. {'$' if rng.random() < 0.5 else ''}{t} — {rng.choice(['FDA', 'Q3 EPS', 'AI', 'CEO'])} "
+            f"catalyst; {rng.choice(['IPO lockup ends', 'ATH breakout', 'short interest 20%'])} vs {rng.choice(SYMBOLS)}."
+            for i, t in enumerate(picks, 1)
+        ]
+        out.append("\n".join(lines))
+    return out
+
+
+def time_it(fn, corpus: list[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in corpus:
+            fn(text)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ticker extraction")
+    parser.add_argument("--db", default=DB_PATH, help="DB to read stored responses from")
+    parser.add_argument("--symbols", help="Cached symbol list (default: tickers table + corpus symbols)")
+    parser.add_argument("--min-corpus", type=int, default=2000, help="Use synthetic responses below this many stored")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    corpus = []
+    if Path(args.db).exists():
+        conn = open_db(args.db)
+        corpus = [r["response_text"] for r in get_ai_samples_since(conn, "") if r["response_text"]]
+        extractor = TickerExtractor.from_file(args.symbols) if args.symbols else TickerExtractor.from_db(conn)
+        conn.close()
+    else:
+        extractor = TickerExtractor.from_file(args.symbols) if args.symbols else TickerExtractor([])
+    source = "stored"
+    if len(corpus) < args.min_corpus:
+        corpus, source = synthetic_corpus(args.min_corpus), "synthetic"
+        if not args.symbols:
+            extractor = TickerExtractor(extractor.symbols | set(SYMBOLS))
+
+    mb = sum(len(t) for t in corpus) * args.repeat / 1e6
+    legacy = time_it(lambda t: (extract_tickers(t), extract_ranked_tickers(t)), corpus, args.repeat)
+    single = time_it(extractor.mentions, corpus, args.repeat)
+
+    n = len(corpus) * args.repeat
+    print(f"\n{len(corpus):,} {source} responses × {args.repeat}, {len(extractor.symbols):,} known symbols")
+    print(f"{'EXTRACTOR':<28} {'RESP/s':>10} {'MB/s':>8}")
+    print("-" * 48)
+    print(f"{'legacy (2 regex + per-line)':<28} {n / legacy:>10,.0f} {mb / legacy:>8.1f}")
+    print(f"{'TickerExtractor (1 pass)':<28} {n / single:>10,.0f} {mb / single:>8.1f}")
+    print(f"\nspeedup: {legacy / single:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+VantaStonk — Laptop/desktop DB sync
+
+Exports rows changed since the last sync to a peer as a small gzipped
+changeset, or imports one from the other machine. Move the file however
+you like (USB, scp, a shared folder).
+
+Usage:
+    python scripts/db_sync.py export --peer desktop            # → data/sync/<host>_to_desktop_<ts>.json.gz
+    python scripts/db_sync.py import data/sync/laptop_to_desktop_20260515T0700.json.gz
+    python scripts/db_sync.py export --peer desktop --full     # first sync: everything
+"""
+
+import sys
+import os
+import time
+import socket
+import argparse
+from datetime import datetime
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import DB_PATH, open_db
+from src.db_sync import export_changes, import_changes
+
+SYNC_DIR = "data/sync"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VantaStonk incremental DB sync")
+    parser.add_argument("--db", default=DB_PATH, help="Path to the SQLite database")
+    sub = parser.add_subparsers(dest="command", required=True)
+    exp = sub.add_parser("export", help="Write a changeset for a peer")
+    exp.add_argument("--peer", required=True, help="Name of the receiving machine")
+    exp.add_argument("--out", help="Changeset path (default: data/sync/<host>_to_<peer>_<ts>.json.gz)")
+    exp.add_argument("--full", action="store_true", help="Export every synced row, not just changes")
+    imp = sub.add_parser("import", help="Apply a changeset from a peer")
+    imp.add_argument("path", help="Changeset file")
+    args = parser.parse_args()
+
+    conn = open_db(args.db, profile="scan_writer")
+    start = time.perf_counter()
+    if args.command == "export":
+        out = args.out or os.path.join(
+            SYNC_DIR, f"{socket.gethostname()}_to_{args.peer}_{datetime.now():%Y%m%dT%H%M%S}.json.gz")
+        stats = export_changes(conn, args.peer, out, full=args.full)
+        size = stats.pop("bytes")
+        print(f"Exported to {out} ({size / 1024:,.1f} KiB)")
+    else:
+        stats = import_changes(conn, args.path)
+        print(f"Imported {args.path}")
+    for table, n in stats.items():
+        print(f"  {table}: {n} rows")
+    print(f"  done in {(time.perf_counter() - start) * 1000:,.0f} ms")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -25,13 +25,15 @@ from pathlib import Path
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.integrations.schwab_client import SchwabClient
+from src.integrations.schwab_client import SchwabClient, prices_5d_from_bars
+from src.integrations.bar_cache import BarCache
 from src.core.scoring import ScoreInputs, rank
 from src.core.filters import PriceContext, filter_universe
 from src.core.prompt_pulse import estimate_discoverability
 from src.workflows.run_glance import build_glance, format_glance_markdown
 from src.workflows.run_shorties import ShortCandidate, is_overextended, build_shorties, format_shorties_markdown
-from src.db import get_connection, init_db, save_price_snapshot, save_score, upsert_ticker, save_recommendation
+from src.db import open_db
+from src.db_writer import DbWriter, TickerRecord, PriceSnapshotRecord, ScoreRecord, RecommendationRecord
 
 
 DEFAULT_WATCHLIST = "data/watchlist.json"
@@ -69,132 +71,158 @@ def run_morning_scan(client: SchwabClient, watchlist: dict) -> str:
     tickers = watchlist["tickers"]
     print(f"Scanning {len(tickers)} tickers...")
 
-    # Initialize DB
-    init_db()
-    conn = get_connection()
-
-    # 1. Pull batch quotes
-    print("Pulling quotes...")
-    quotes = client.get_quotes(tickers)
-    print(f"  Got quotes for {len(quotes)}/{len(tickers)} tickers")
-
-    # 2. Build PriceContexts for filtering
-    price_contexts = []
-    for ticker in tickers:
-        quote = quotes.get(ticker)
-        if not quote:
-            print(f"  Skipping {ticker} — no quote data")
-            continue
-
-        # Get 5-day price
-        current_price, price_5d_ago = client.get_5day_prices(ticker)
-        if current_price is None:
-            current_price = quote.last_price
-            price_5d_ago = quote.close_price
-
-        price_contexts.append(PriceContext(
-            ticker=ticker,
-            price_current=current_price,
-            price_5d_ago=price_5d_ago,
-            price_open_today=quote.open_price,
-        ))
-
-        # Save snapshot
-        upsert_ticker(conn, ticker)
-        save_price_snapshot(conn, ticker, current_price, quote.volume)
-
-    # 3. Run chasing filters
-    print("Running filters...")
-    passed, rejected = filter_universe(price_contexts)
-    print(f"  Passed: {len(passed)}, Rejected (chasing): {len(rejected)}")
-
-    # 4. Score passed candidates
-    print("Scoring candidates...")
-    score_inputs = []
-    for f_result in passed:
-        ticker = f_result.ticker
-        quote = quotes[ticker]
-        discoverability = estimate_discoverability(
-            ticker=ticker,
-            company_name=ticker,
-            market_cap_millions=0,
-            sector="unknown",
+    # Open DB (applies pending schema migrations; a no-op check when current)
+    conn = open_db(profile="scan_writer")
+    # Scan results are written behind by a dedicated thread; flushed at stage boundaries
+    writer = DbWriter()
+
+    scan_failed = True
+    try:
+        # 1. Pull batch quotes
+        print("Pulling quotes...")
+        quotes = client.get_quotes(tickers)
+        print(f"  Got quotes for {len(quotes)}/{len(tickers)} tickers")
+
+        # 2a. Pull 5-day history for every quoted ticker in one concurrent batch
+        # (served from the local bar cache; only missing bars hit Schwab)
+        print("Pulling 5-day history...")
+        bar_cache = BarCache(client, conn)
+        history, history_errors = bar_cache.get_price_history_bulk(
+            [t for t in tickers if t in quotes], days=10, frequency="daily",
         )
-
-        score_inputs.append(ScoreInputs(
-            ticker=ticker,
-            catalyst=0.5,
-            prompt_pulse=discoverability,
-            freshness=0.5,
-            peer=0.5,
-            volume=min(1.0, quote.volume / 10_000_000) if quote.volume else 0.3,
-            macro=0.5,
-            is_chasing=False,
-        ))
-
-    ranked = rank(score_inputs)
-    for r in ranked:
-        save_score(conn, r.ticker, r)
-
-    # 5. Build Glance picks (top scorers get momentum slots)
-    picks_meta = {}
-    for i, r in enumerate(ranked[:4]):
-        quote = quotes[r.ticker]
-        ctx = next(p for p in price_contexts if p.ticker == r.ticker)
-        move_5d = ((ctx.price_current - ctx.price_5d_ago) / ctx.price_5d_ago * 100) if ctx.price_5d_ago else 0
-
-        if i < 2:
-            category = "momentum"
-        elif i == 2:
-            category = "macro_tilt"
-        else:
-            category = "lotto"
-
-        picks_meta[r.ticker] = {
-            "category": category,
-            "setup": f"Score {r.total:.2f} ({r.grade}) — 5d move {move_5d:+.1f}%",
-            "why_now": f"Volume {quote.volume:,} | Prompt Pulse {r.breakdown.get('prompt_pulse', 0):.2f}",
-            "catalyst": "Evaluate manually — AI research phase needed",
-            "not_priced_in": "Requires manual assessment",
-            "risk": f"{'High' if abs(move_5d) > 3 else 'Moderate' if abs(move_5d) > 1 else 'Low'} volatility",
-        }
-
-    glance_output = build_glance(ranked, picks_meta)
-    glance_output.rejected = rejected
-    glance_md = format_glance_markdown(glance_output)
-
-    # 6. Build Shorties from rejected (chasing) candidates
-    short_candidates = []
-    for f_result in rejected:
-        ctx = next(p for p in price_contexts if p.ticker == f_result.ticker)
-        over, move_pct = is_overextended(ctx.price_current, ctx.price_5d_ago, threshold_pct=5.0)
-        if over:
-            short_candidates.append(ShortCandidate(
-                ticker=f_result.ticker,
-                why_short=f_result.reasons[0] if f_result.reasons else "Overextended",
-                catalyst="Chasing filter triggered",
-                risk="Could continue higher on momentum/squeeze",
-                overextension_pct=move_pct,
-                category="fade",
+        for ticker, err in history_errors.items():
+            print(f"  History failed for {ticker} — {err}")
+        print(f"  History: {bar_cache.hits} cached, {bar_cache.fetches} fetched")
+        print(f"  Schwab throttle: {client.limiter.format_stats()}")
+
+        # 2. Build PriceContexts for filtering
+        price_contexts = []
+        for ticker in tickers:
+            quote = quotes.get(ticker)
+            if not quote:
+                print(f"  Skipping {ticker} — no quote data")
+                continue
+
+            # Get 5-day price
+            current_price, price_5d_ago = prices_5d_from_bars(history.get(ticker, []))
+            if current_price is None:
+                current_price = quote.last_price
+                price_5d_ago = quote.close_price
+
+            price_contexts.append(PriceContext(
+                ticker=ticker,
+                price_current=current_price,
+                price_5d_ago=price_5d_ago,
+                price_open_today=quote.open_price,
             ))
 
-    shorties_output = build_shorties(short_candidates)
-    shorties_md = format_shorties_markdown(shorties_output)
+            writer.submit(TickerRecord(ticker))
+            writer.submit(PriceSnapshotRecord(ticker, current_price, quote.volume))
+
+        # Snapshots are durable before scoring starts
+        writer.flush()
+
+        # 3. Run chasing filters
+        print("Running filters...")
+        passed, rejected = filter_universe(price_contexts)
+        print(f"  Passed: {len(passed)}, Rejected (chasing): {len(rejected)}")
+
+        # 4. Score passed candidates
+        print("Scoring candidates...")
+        score_inputs = []
+        for f_result in passed:
+            ticker = f_result.ticker
+            quote = quotes[ticker]
+            discoverability = estimate_discoverability(
+                ticker=ticker,
+                company_name=ticker,
+                market_cap_millions=0,
+                sector="unknown",
+            )
+
+            score_inputs.append(ScoreInputs(
+                ticker=ticker,
+                catalyst=0.5,
+                prompt_pulse=discoverability,
+                freshness=0.5,
+                peer=0.5,
+                volume=min(1.0, quote.volume / 10_000_000) if quote.volume else 0.3,
+                macro=0.5,
+                is_chasing=False,
+            ))
 
-    # 7. Save recommendations to DB
-    for pick in glance_output.picks:
-        save_recommendation(
-            conn, pick.ticker, "glance", pick.category, pick.setup,
-            pick.why_now, pick.catalyst, pick.not_priced_in, pick.risk,
-            pick.score_result.total if pick.score_result else None,
+        ranked = rank(score_inputs)
+        writer.submit_many(ScoreRecord(r) for r in ranked)
+
+        # 5. Build Glance picks (top scorers get momentum slots)
+        picks_meta = {}
+        for i, r in enumerate(ranked[:4]):
+            quote = quotes[r.ticker]
+            ctx = next(p for p in price_contexts if p.ticker == r.ticker)
+            move_5d = ((ctx.price_current - ctx.price_5d_ago) / ctx.price_5d_ago * 100) if ctx.price_5d_ago else 0
+
+            if i < 2:
+                category = "momentum"
+            elif i == 2:
+                category = "macro_tilt"
+            else:
+                category = "lotto"
+
+            picks_meta[r.ticker] = {
+                "category": category,
+                "setup": f"Score {r.total:.2f} ({r.grade}) — 5d move {move_5d:+.1f}%",
+                "why_now": f"Volume {quote.volume:,} | Prompt Pulse {r.breakdown.get('prompt_pulse', 0):.2f}",
+                "catalyst": "Evaluate manually — AI research phase needed",
+                "not_priced_in": "Requires manual assessment",
+                "risk": f"{'High' if abs(move_5d) > 3 else 'Moderate' if abs(move_5d) > 1 else 'Low'} volatility",
+            }
+
+        glance_output = build_glance(ranked, picks_meta)
+        glance_output.rejected = rejected
+        glance_md = format_glance_markdown(glance_output)
+
+        # 6. Build Shorties from rejected (chasing) candidates
+        short_candidates = []
+        for f_result in rejected:
+            ctx = next(p for p in price_contexts if p.ticker == f_result.ticker)
+            over, move_pct = is_overextended(ctx.price_current, ctx.price_5d_ago, threshold_pct=5.0)
+            if over:
+                short_candidates.append(ShortCandidate(
+                    ticker=f_result.ticker,
+                    why_short=f_result.reasons[0] if f_result.reasons else "Overextended",
+                    catalyst="Chasing filter triggered",
+                    risk="Could continue higher on momentum/squeeze",
+                    overextension_pct=move_pct,
+                    category="fade",
+                ))
+
+        shorties_output = build_shorties(short_candidates)
+        shorties_md = format_shorties_markdown(shorties_output)
+
+        # 7. Save recommendations to DB
+        writer.submit_many(
+            RecommendationRecord(ticker=pick.ticker, module="glance", category=pick.category, setup=pick.setup,
+                                 why_now=pick.why_now, catalyst=pick.catalyst, not_priced_in=pick.not_priced_in,
+                                 risk=pick.risk, score_total=pick.score_result.total if pick.score_result else None)
+            for pick in glance_output.picks
         )
-    for sc in short_candidates:
-        save_recommendation(
-            conn, sc.ticker, "shorties", sc.category, sc.why_short,
-            catalyst=sc.catalyst, risk=sc.risk, score_total=sc.overextension_pct,
+        writer.submit_many(
+            RecommendationRecord(ticker=sc.ticker, module="shorties", category=sc.category, setup=sc.why_short,
+                                 catalyst=sc.catalyst, risk=sc.risk, score_total=sc.overextension_pct)
+            for sc in short_candidates
         )
-
-    conn.close()
+        scan_failed = False
+    finally:
+        # Flush + join the writer thread and release the connection even if a stage fails
+        try:
+            writer.close()
+        except Exception as e:
+            if not scan_failed:
+                raise
+            # Don't let the flush error replace the stage error already propagating
+            print(f"  DB writer flush failed — {type(e).__name__}: {e}", file=sys.stderr)
+        finally:
+            conn.close()
 
     # 8. Combine output
     now = datetime.now().strftime("%Y-%m-%d %H:%M PT")
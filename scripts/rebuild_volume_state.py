@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+VantaStonk — Rebuild rolling volume state
+
+Recomputes volume_state (the per-ticker 30-day volume ring behind RVOL's
+avg_30d) from the daily bars already cached in price_bars. Use it after a
+DB sync import, a bar backfill, or if the state looks off. No Schwab calls.
+
+Usage:
+    python scripts/rebuild_volume_state.py
+    python scripts/rebuild_volume_state.py --tickers ABCD WXYZ --window 20
+"""
+
+import sys
+import os
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import DB_PATH, open_db, unit_of_work, get_avg_volumes
+from src.signals.volume_state import AVG_WINDOW, rebuild_volume_state
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild volume_state from cached daily bars")
+    parser.add_argument("--db", default=DB_PATH, help="Path to the SQLite database")
+    parser.add_argument("--tickers", nargs="+", help="Only these tickers (default: every cached ticker)")
+    parser.add_argument("--window", type=int, default=AVG_WINDOW, help="Days in the rolling average")
+    args = parser.parse_args()
+
+    conn = open_db(args.db, profile="scan_writer")
+    with unit_of_work(conn):
+        rows = rebuild_volume_state(conn, args.tickers, window=args.window)
+    print(f"Rebuilt volume_state for {rows} ticker(s) ({args.window}-day window)")
+    if args.tickers:
+        avgs = get_avg_volumes(conn, args.tickers)
+        for t in args.tickers:
+            avg = avgs.get(t)
+            print(f"  {t:<6} avg volume: {f'{avg:,.0f}' if avg is not None else 'no bars cached'}")
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
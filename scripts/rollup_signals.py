@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+VantaStonk — Signal retention / rollup
+
+Applies spec §8.5 retention: rolls raw signal rows older than the window
+into daily aggregates and prunes old AI response text. Safe to re-run.
+
+Usage:
+    python scripts/rollup_signals.py
+    python scripts/rollup_signals.py --days 45 --vacuum
+"""
+
+import sys
+import os
+import argparse
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.db import DB_PATH, open_db
+from src.workflows.retention import RETENTION_DAYS, run_retention, format_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VantaStonk signal retention / rollup")
+    parser.add_argument("--db", default=DB_PATH, help="Path to the SQLite database")
+    parser.add_argument("--days", type=int, default=RETENTION_DAYS, help="Days of granular history to keep")
+    parser.add_argument("--vacuum", action="store_true", help="VACUUM afterwards to shrink the file")
+    args = parser.parse_args()
+
+    conn = open_db(args.db, profile="scan_writer")
+    report = run_retention(conn, retention_days=args.days, db_path=args.db, vacuum=args.vacuum)
+    print(format_report(report))
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
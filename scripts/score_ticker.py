@@ -11,19 +11,26 @@ Usage:
 
 import sys
 import os
+from typing import Optional
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.integrations.schwab_client import SchwabClient
+from src.integrations.schwab_client import SchwabClient, PriceBar, prices_5d_from_bars
+from src.integrations.bar_cache import BarCache
 from src.core.scoring import ScoreInputs, score
 from src.core.filters import PriceContext, check_chasing
 from src.core.prompt_pulse import estimate_discoverability
-from src.db import get_connection, init_db, save_price_snapshot, save_score, upsert_ticker
+from src.db import open_db, save_price_snapshots, save_scores, upsert_tickers, unit_of_work
 
 
-def score_ticker(client: SchwabClient, ticker: str) -> dict:
-    """Score a single ticker using live Schwab data."""
+def score_ticker(client: SchwabClient, ticker: str, bars: Optional[list[PriceBar]] = None) -> dict:
+    """
+    Score a single ticker using live Schwab data.
+
+    bars: pre-fetched daily history (e.g. from get_price_history_bulk).
+    Fetched on demand when omitted.
+    """
     ticker = ticker.upper()
 
     # Get current quote
@@ -33,7 +40,10 @@ def score_ticker(client: SchwabClient, ticker: str) -> dict:
         return None
 
     # Get 5-day price for chasing filter
-    current_price, price_5d_ago = client.get_5day_prices(ticker)
+    if bars is None:
+        current_price, price_5d_ago = client.get_5day_prices(ticker)
+    else:
+        current_price, price_5d_ago = prices_5d_from_bars(bars)
     if current_price is None:
         current_price = quote.last_price
         price_5d_ago = quote.close_price  # fallback to previous close
@@ -137,20 +147,28 @@ def main():
         print("Failed to connect to Schwab API. Check your .env credentials.")
         sys.exit(1)
 
-    # Initialize DB
-    init_db()
-    conn = get_connection()
+    # Open DB (applies pending schema migrations; a no-op check when current)
+    conn = open_db(profile="scan_writer")
+
+    # One concurrent history fetch for every requested ticker (cached bars are reused)
+    history, history_errors = BarCache(client, conn).get_price_history_bulk(tickers, days=10, frequency="daily")
+    for ticker, err in history_errors.items():
+        print(f"  History failed for {ticker} — {err}")
 
+    # Score everything first: quote requests must not run while holding the write lock
+    results = []
     for ticker in tickers:
         print(f"\nScoring {ticker}...")
-        data = score_ticker(client, ticker)
+        data = score_ticker(client, ticker, bars=history.get(ticker, []))
         if data:
             print_result(data)
+            results.append(data)
 
-            # Save to database
-            upsert_ticker(conn, ticker)
-            save_price_snapshot(conn, ticker, data["price"], data["volume"])
-            save_score(conn, ticker, data["score"])
+    # Then save in one short transaction
+    with unit_of_work(conn):
+        upsert_tickers(conn, (d["ticker"] for d in results))
+        save_price_snapshots(conn, ((d["ticker"], d["price"], d["volume"]) for d in results))
+        save_scores(conn, (d["score"] for d in results))
 
     conn.close()
 
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+VantaStonk — Streaming Quotes
+
+Streams Level-1 quotes for the watchlist plus open positions and prints
+the latest-quote table every few seconds. Can record the raw stream for
+offline replay, or replay a recording without touching Schwab.
+
+Usage:
+    python scripts/stream_quotes.py
+    python scripts/stream_quotes.py --record data/ticks_2026-05-15.jsonl
+    python scripts/stream_quotes.py --replay data/ticks_2026-05-15.jsonl --bench
+"""
+
+import sys
+import os
+import json
+import argparse
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.integrations.schwab_client import SchwabClient
+from src.integrations.schwab_stream import (
+    QuoteStreamer, ReplayStreamClient, replay_benchmark, streaming_symbols,
+)
+
+DEFAULT_WATCHLIST = "data/watchlist.json"
+
+
+def print_table(streamer: QuoteStreamer):
+    quotes = streamer.table.snapshot()
+    print(f"\n{'SYM':<8} {'LAST':>10} {'BID':>10} {'ASK':>10} {'VOLUME':>14}  TIME")
+    print("-" * 70)
+    for sym in sorted(quotes):
+        q = quotes[sym]
+        print(f"{sym:<8} {q.last_price:>10.2f} {q.bid_price:>10.2f} {q.ask_price:>10.2f} "
+              f"{q.volume:>14,}  {q.timestamp or ''}")
+    print(f"({streamer.messages} messages, {streamer.table.updates} updates)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="VantaStonk Streaming Quotes")
+    parser.add_argument("--watchlist", default=DEFAULT_WATCHLIST, help="Path to watchlist JSON")
+    parser.add_argument("--replay", help="Replay a recorded JSONL stream instead of connecting")
+    parser.add_argument("--record", help="Append raw stream messages to this JSONL file")
+    parser.add_argument("--bench", action="store_true", help="With --replay: replay flat out and report throughput")
+    parser.add_argument("--interval", type=float, default=5.0, help="Seconds between table prints")
+    args = parser.parse_args()
+
+    watchlist = json.loads(Path(args.watchlist).read_text()) if Path(args.watchlist).exists() else {}
+    tickers = watchlist.get("tickers", [])
+
+    if args.replay:
+        if args.bench:
+            # Subscribe to every symbol in the recording
+            symbols = streaming_symbols(*[
+                [r["key"] for r in json.loads(line).get("content", [])]
+                for line in Path(args.replay).read_text().splitlines() if line.strip()
+            ])
+            print(json.dumps(replay_benchmark(args.replay, symbols), indent=2))
+            return
+        streamer = QuoteStreamer(ReplayStreamClient(args.replay, speed=1.0), record_path=args.record)
+        symbols = streaming_symbols(tickers)
+    else:
+        client = SchwabClient()
+        if not client.connect():
+            print("Failed to connect to Schwab API. Check your .env credentials.")
+            sys.exit(1)
+        positions = [p.ticker for p in client.get_positions()]
+        symbols = streaming_symbols(tickers, positions)
+        streamer = QuoteStreamer.from_schwab(client, record_path=args.record)
+
+    print(f"Streaming {len(symbols)} symbols...")
+    thread = streamer.run_in_thread(symbols)
+    try:
+        while thread.is_alive():
+            thread.join(timeout=args.interval)
+            print_table(streamer)
+    except KeyboardInterrupt:
+        print("Stopping...")
+    finally:
+        # Stops the loop and joins the stream thread before closing the record file
+        streamer.close()
+
+
+if __name__ == "__main__":
+    main()
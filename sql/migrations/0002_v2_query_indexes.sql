@@ -0,0 +1,14 @@
+-- Indexes for the v2 signal-pipeline query paths
+
+-- get_mentions_history: WHERE ticker = ? AND source = ? AND captured_at >= ?
+CREATE INDEX IF NOT EXISTS idx_social_source_ticker_time
+    ON social_snapshots(source, ticker, captured_at);
+
+-- Same-day AI sample lookups by model + prompt
+CREATE INDEX IF NOT EXISTS idx_ai_samples_model_prompt_time
+    ON ai_samples_raw(model, prompt_id, captured_at);
+
+-- Outcomes still waiting on a price_Nd backfill (spec §9.3)
+CREATE INDEX IF NOT EXISTS idx_outcomes_pending
+    ON recommendation_outcomes(first_appeared_at)
+    WHERE price_7d IS NULL;
@@ -0,0 +1,28 @@
+-- Daily per-ticker social mention aggregates (7-day velocity baseline)
+--
+-- One row per (source, ticker, day), kept current by the social snapshot
+-- writers in src/db.py. Apewisdom counts are trailing-24h, so a day's
+-- level is the mean over its snapshots and "today" is the latest one.
+
+CREATE TABLE IF NOT EXISTS social_daily (
+    source TEXT NOT NULL,
+    ticker TEXT NOT NULL,
+    day TEXT NOT NULL,                   -- YYYY-MM-DD of captured_at
+    snapshots INTEGER NOT NULL,
+    mentions_sum INTEGER NOT NULL,
+    last_captured_at TEXT NOT NULL,
+    last_mentions INTEGER NOT NULL,      -- mentions_count of the latest snapshot that day
+    PRIMARY KEY (source, ticker, day)
+) WITHOUT ROWID;
+
+-- Universe-wide "who has mentions today" lookups
+CREATE INDEX IF NOT EXISTS idx_social_daily_day
+    ON social_daily(source, day);
+
+-- Backfill from existing snapshots (bare column + MAX() takes the latest row)
+INSERT OR REPLACE INTO social_daily
+    (source, ticker, day, snapshots, mentions_sum, last_captured_at, last_mentions)
+SELECT source, ticker, substr(captured_at, 1, 10), COUNT(*), SUM(mentions_count),
+       MAX(captured_at), mentions_count
+FROM social_snapshots
+GROUP BY source, ticker, substr(captured_at, 1, 10);
@@ -0,0 +1,22 @@
+-- Spec §8.5 retention: daily rollup of prompt_pulse_components
+--
+-- Scans older than the retention window are folded into one row per
+-- ticker per day (means of each component) by src/workflows/retention.py.
+-- social_snapshots rolls up into social_daily (migration 3).
+
+CREATE TABLE IF NOT EXISTS prompt_pulse_daily (
+    ticker TEXT NOT NULL,
+    day TEXT NOT NULL,                   -- YYYY-MM-DD of captured_at
+    scans INTEGER NOT NULL,
+    ai_sampling REAL,                    -- daily means; NULL if never scored that day
+    social_velocity REAL,
+    volume_anomaly REAL,
+    composite REAL NOT NULL,
+    last_captured_at TEXT NOT NULL,
+    PRIMARY KEY (ticker, day)
+) WITHOUT ROWID;
+
+-- Pruned ai_samples_raw rows keep tickers_extracted; find unpruned ones by time
+CREATE INDEX IF NOT EXISTS idx_ai_samples_unpruned
+    ON ai_samples_raw(captured_at)
+    WHERE response_text != '';
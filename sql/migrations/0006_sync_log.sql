@@ -0,0 +1,78 @@
+-- Change log for laptop/desktop sync (src/db_sync.py)
+--
+-- Triggers record the rowid of every inserted/updated row in the synced
+-- tables. An export ships the current contents of rows logged since that
+-- peer's watermark; imports upsert them by each table's UNIQUE key.
+
+CREATE TABLE IF NOT EXISTS sync_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    tbl TEXT NOT NULL,
+    row_id INTEGER NOT NULL
+);
+
+-- Last sync_log.seq exported to each peer
+CREATE TABLE IF NOT EXISTS sync_peers (
+    peer TEXT PRIMARY KEY,
+    last_seq INTEGER NOT NULL DEFAULT 0,
+    exported_at TEXT
+);
+
+CREATE TRIGGER IF NOT EXISTS sync_tickers_insert AFTER INSERT ON tickers
+BEGIN
+    INSERT INTO sync_log (tbl, row_id) VALUES ('tickers', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS sync_tickers_update AFTER UPDATE ON tickers
+BEGIN
+    INSERT INTO sync_log (tbl, row_id) VALUES ('tickers', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS sync_price_snapshots_insert AFTER INSERT ON price_snapshots
+BEGIN
+    INSERT INTO sync_log (tbl, row_id) VALUES ('price_snapshots', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS sync_price_snapshots_update AFTER UPDATE ON price_snapshots
+BEGIN
+    INSERT INTO sync_log (tbl, row_id) VALUES ('price_snapshots', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS sync_prompt_pulse_components_insert AFTER INSERT ON prompt_pulse_components
+BEGIN
+    INSERT INTO sync_log (tbl, row_id) VALUES ('prompt_pulse_components', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS sync_prompt_pulse_components_update AFTER UPDATE ON prompt_pulse_components
+BEGIN
+    INSERT INTO sync_log (tbl, row_id) VALUES ('prompt_pulse_components', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS sync_social_snapshots_insert AFTER INSERT ON social_snapshots
+BEGIN
+    INSERT INTO sync_log (tbl, row_id) VALUES ('social_snapshots', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS sync_social_snapshots_update AFTER UPDATE ON social_snapshots
+BEGIN
+    INSERT INTO sync_log (tbl, row_id) VALUES ('social_snapshots', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS sync_recommendation_outcomes_insert AFTER INSERT ON recommendation_outcomes
+BEGIN
+    INSERT INTO sync_log (tbl, row_id) VALUES ('recommendation_outcomes', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS sync_recommendation_outcomes_update AFTER UPDATE ON recommendation_outcomes
+BEGIN
+    INSERT INTO sync_log (tbl, row_id) VALUES ('recommendation_outcomes', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS sync_price_bars_insert AFTER INSERT ON price_bars
+BEGIN
+    INSERT INTO sync_log (tbl, row_id) VALUES ('price_bars', NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS sync_price_bars_update AFTER UPDATE ON price_bars
+BEGIN
+    INSERT INTO sync_log (tbl, row_id) VALUES ('price_bars', NEW.id);
+END;
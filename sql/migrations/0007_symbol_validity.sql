@@ -0,0 +1,10 @@
+-- Persistent symbol-validity cache for ticker validation
+--
+-- One row per symbol checked against Schwab quotes. Valid results are
+-- trusted for longer than invalid ones (see src/signals/ticker_validator.py).
+
+CREATE TABLE IF NOT EXISTS symbol_validity (
+    symbol TEXT PRIMARY KEY,
+    is_valid INTEGER NOT NULL,           -- 1 = Schwab returned a quote
+    checked_at TEXT NOT NULL             -- ISO8601 datetime
+) WITHOUT ROWID;
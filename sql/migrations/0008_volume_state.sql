@@ -0,0 +1,16 @@
+-- Rolling daily-volume state for RVOL's 30-day average
+--
+-- One row per ticker: the last window_days completed daily volumes (ring,
+-- oldest first) plus their running sum, advanced one bar at a time as
+-- BarCache stores new daily bars (see src/signals/volume_state.py). Derived
+-- from price_bars; rebuild with scripts/rebuild_volume_state.py.
+
+CREATE TABLE IF NOT EXISTS volume_state (
+    ticker TEXT PRIMARY KEY,
+    window_days INTEGER NOT NULL,        -- N: how many days the average covers
+    last_bar_date TEXT NOT NULL,         -- newest completed daily bar folded in (YYYY-MM-DD)
+    volume_sum INTEGER NOT NULL,         -- sum of the volumes in ring
+    day_count INTEGER NOT NULL,          -- volumes in ring (< window_days for young listings)
+    ring TEXT NOT NULL,                  -- JSON array of the last day_count volumes, oldest first
+    updated_at TEXT NOT NULL             -- ISO8601 datetime
+) WITHOUT ROWID;
@@ -1,5 +1,8 @@
 -- VantaStonk 95v2 — Database Schema
 -- SQLite-compatible
+--
+-- Baseline schema, applied as migration 1 (see src/db.py MIGRATIONS).
+-- Later schema changes go in sql/migrations/NNNN_*.sql, not here.
 
 -- Core ticker registry
 CREATE TABLE IF NOT EXISTS tickers (
@@ -186,3 +189,30 @@ CREATE INDEX IF NOT EXISTS idx_outcomes_ticker
     ON recommendation_outcomes(ticker);
 CREATE INDEX IF NOT EXISTS idx_outcomes_entry
     ON recommendation_outcomes(first_appeared_at DESC);
+
+-- Cached daily OHLCV bars from Schwab price history
+CREATE TABLE IF NOT EXISTS price_bars (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticker TEXT NOT NULL,
+    frequency TEXT NOT NULL,             -- 'daily'
+    bar_date TEXT NOT NULL,              -- YYYY-MM-DD
+    open REAL,
+    high REAL,
+    low REAL,
+    close REAL,
+    volume INTEGER,
+    created_at TEXT DEFAULT (datetime('now')),
+    UNIQUE(ticker, frequency, bar_date)
+);
+
+-- Date span already fetched into price_bars (so gaps vs. non-trading days are known)
+CREATE TABLE IF NOT EXISTS price_bar_coverage (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ticker TEXT NOT NULL,
+    frequency TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    fetched_at TEXT NOT NULL,            -- ISO8601 datetime of the last fetch
+    created_at TEXT DEFAULT (datetime('now')),
+    UNIQUE(ticker, frequency)
+);
@@ -2,37 +2,259 @@
 VantaStonk — Database Layer
 
 SQLite connection manager and query helpers.
-Wires up the schema from sql/schema.sql.
+
+Schema is versioned with PRAGMA user_version: sql/schema.sql is the
+baseline (migration 1) and later steps live in sql/migrations/. Opening a
+current database costs one integer read.
 """
 
 import sqlite3
 import json
-from datetime import datetime
+import hashlib
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 
 DB_PATH = "data/vantastonk.db"
 SCHEMA_PATH = "sql/schema.sql"
-
-
-def get_connection(db_path: str = DB_PATH) -> sqlite3.Connection:
-    """Get a SQLite connection with row factory enabled."""
-    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
+MIGRATIONS_DIR = "sql/migrations"
+
+
+class _Connection(sqlite3.Connection):
+    """sqlite3.Connection that knows whether it is inside a unit_of_work."""
+    _uow_depth = 0
+
+
+# --- Connection profiles ---
+
+@dataclass(frozen=True)
+class ConnectionProfile:
+    """Pragmas and driver settings applied by get_connection."""
+    synchronous: str = "FULL"        # FULL | NORMAL | OFF
+    cache_size: int = -2000          # negative = KiB (SQLite default ~2 MB)
+    mmap_size: int = 0               # bytes of the DB file to memory-map
+    temp_store: str = "DEFAULT"      # DEFAULT | FILE | MEMORY
+    busy_timeout_ms: int = 5000      # wait this long on a locked DB before failing
+    cached_statements: int = 128     # sqlite3 prepared-statement cache
+    read_only: bool = False          # open via file:...?mode=ro
+
+
+CONNECTION_PROFILES = {
+    # SQLite defaults + WAL, as every script used before profiles existed
+    "default": ConnectionProfile(),
+    # Scans: WAL + NORMAL is durable against app crashes (may drop the last
+    # commit on power loss) and skips the fsync on every commit
+    "scan_writer": ConnectionProfile(
+        synchronous="NORMAL", cache_size=-16_000, mmap_size=64 * 1024 * 1024,
+        temp_store="MEMORY", cached_statements=256,
+    ),
+    # Reports / dashboards: read-only, big cache + mmap, never takes a write lock
+    "reader": ConnectionProfile(
+        synchronous="NORMAL", cache_size=-32_000, mmap_size=256 * 1024 * 1024,
+        temp_store="MEMORY", cached_statements=256, read_only=True,
+    ),
+    # Large rebuildable loads (bar backfills, rollups): no fsyncs at all
+    "bulk_backfill": ConnectionProfile(
+        synchronous="OFF", cache_size=-64_000, mmap_size=256 * 1024 * 1024,
+        temp_store="MEMORY", busy_timeout_ms=30_000, cached_statements=512,
+    ),
+}
+
+
+def get_connection(db_path: str = DB_PATH, profile: str = "default") -> sqlite3.Connection:
+    """Get a SQLite connection with row factory enabled, tuned per CONNECTION_PROFILES."""
+    p = CONNECTION_PROFILES[profile]
+    if p.read_only:
+        target, uri = Path(db_path).resolve().as_uri() + "?mode=ro", True
+    else:
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        target, uri = db_path, False
+    conn = sqlite3.connect(target, uri=uri, factory=_Connection,
+                           timeout=p.busy_timeout_ms / 1000, cached_statements=p.cached_statements)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
+    if not p.read_only:
+        conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
+    conn.execute(f"PRAGMA synchronous={p.synchronous}")
+    conn.execute(f"PRAGMA cache_size={p.cache_size}")
+    conn.execute(f"PRAGMA mmap_size={p.mmap_size}")
+    conn.execute(f"PRAGMA temp_store={p.temp_store}")
     return conn
 
 
 def init_db(db_path: str = DB_PATH):
-    """Initialize the database from schema.sql."""
+    """Bring the database schema up to date (see migrate)."""
     conn = get_connection(db_path)
-    schema = Path(SCHEMA_PATH).read_text()
-    conn.executescript(schema)
-    conn.commit()
+    applied = migrate(conn)
     conn.close()
-    print(f"Database initialized at {db_path}")
+    if applied:
+        print(f"Database at {db_path} migrated to v{applied[-1]}")
+
+
+def open_db(db_path: str = DB_PATH, profile: str = "default") -> sqlite3.Connection:
+    """Get a connection with the schema brought up to date — one connection, no re-run of schema.sql."""
+    conn = get_connection(db_path, profile)
+    migrate(conn)
+    return conn
+
+
+# --- Schema migrations ---
+
+def _sql_migration(path: str):
+    """Migration step that runs a SQL script file."""
+    def apply(conn: sqlite3.Connection):
+        for statement in _split_sql(Path(path).read_text()):
+            conn.execute(statement)
+    apply.__doc__ = path
+    return apply
+
+
+def _split_sql(script: str) -> list[str]:
+    """Split a SQL script into complete statements."""
+    statements, buf = [], ""
+    for line in script.splitlines(keepends=True):
+        buf += line
+        if sqlite3.complete_statement(buf):
+            if buf.strip():
+                statements.append(buf.strip())
+            buf = ""
+    if buf.strip():
+        statements.append(buf.strip())  # trailing comments, or an unterminated statement sqlite will reject
+    return statements
+
+
+# v5 is a Python step: it copies ai_samples_raw in id order, chunk rows at a time.
+def _migrate_ai_samples_compressed(conn: sqlite3.Connection, chunk: int = 1000):
+    """Intern prompts into ai_prompts and rebuild ai_samples_raw with compressed responses."""
+    conn.execute("""
+        CREATE TABLE ai_prompts (
+            prompt_key INTEGER PRIMARY KEY,
+            prompt_id TEXT NOT NULL,
+            prompt_hash TEXT NOT NULL,           -- sha256 of prompt_text
+            prompt_text TEXT NOT NULL,
+            created_at TEXT DEFAULT (datetime('now')),
+            UNIQUE(prompt_id, prompt_hash)
+        )
+    """)
+    conn.execute("""
+        CREATE TABLE ai_samples_v5 (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            captured_at TEXT NOT NULL,
+            model TEXT NOT NULL,
+            prompt_id TEXT NOT NULL,
+            prompt_key INTEGER NOT NULL REFERENCES ai_prompts(prompt_key),
+            response_z BLOB,                     -- zlib(response_text); NULL once pruned
+            tickers_extracted TEXT,              -- JSON array
+            token_cost_usd REAL,
+            created_at TEXT DEFAULT (datetime('now'))
+        )
+    """)
+    last_id = 0
+    while True:
+        rows = conn.execute("""
+            SELECT * FROM ai_samples_raw WHERE id > ? ORDER BY id LIMIT ?
+        """, (last_id, chunk)).fetchall()
+        if not rows:
+            break
+        keys = intern_prompts(conn, ((r["prompt_id"], r["prompt_text"]) for r in rows))
+        conn.executemany("""
+            INSERT INTO ai_samples_v5
+                (id, captured_at, model, prompt_id, prompt_key, response_z,
+                 tickers_extracted, token_cost_usd, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, ((r["id"], r["captured_at"], r["model"], r["prompt_id"],
+               keys[(r["prompt_id"], r["prompt_text"])], compress_text(r["response_text"]),
+               r["tickers_extracted"], r["token_cost_usd"], r["created_at"]) for r in rows))
+        last_id = rows[-1]["id"]
+    conn.execute("DROP TABLE ai_samples_raw")
+    conn.execute("ALTER TABLE ai_samples_v5 RENAME TO ai_samples_raw")
+    conn.execute("CREATE INDEX idx_ai_samples_time ON ai_samples_raw(captured_at DESC)")
+    conn.execute("CREATE INDEX idx_ai_samples_model_prompt_time ON ai_samples_raw(model, prompt_id, captured_at)")
+    conn.execute("""
+        CREATE INDEX idx_ai_samples_unpruned ON ai_samples_raw(captured_at)
+        WHERE response_z IS NOT NULL
+    """)
+
+
+# (version, name, step). Versions are contiguous from 1; never edit a shipped step.
+MIGRATIONS = [
+    (1, "baseline", _sql_migration(SCHEMA_PATH)),
+    (2, "v2_query_indexes", _sql_migration(f"{MIGRATIONS_DIR}/0002_v2_query_indexes.sql")),
+    (3, "social_daily", _sql_migration(f"{MIGRATIONS_DIR}/0003_social_daily.sql")),
+    (4, "signal_rollups", _sql_migration(f"{MIGRATIONS_DIR}/0004_signal_rollups.sql")),
+    (5, "ai_samples_compressed", _migrate_ai_samples_compressed),
+    (6, "sync_log", _sql_migration(f"{MIGRATIONS_DIR}/0006_sync_log.sql")),
+    (7, "symbol_validity", _sql_migration(f"{MIGRATIONS_DIR}/0007_symbol_validity.sql")),
+    (8, "volume_state", _sql_migration(f"{MIGRATIONS_DIR}/0008_volume_state.sql")),
+]
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> list[int]:
+    """
+    Apply pending migrations in order. Each step and its user_version bump
+    commit together, so a failed step leaves the DB at the previous version.
+    Returns the versions applied (empty when already current).
+    """
+    current = schema_version(conn)
+    if current >= LATEST_VERSION:
+        return []
+
+    applied = []
+    for version, _name, step in MIGRATIONS:
+        if version <= current:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            step(conn)
+            conn.execute(f"PRAGMA user_version = {version}")
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        applied.append(version)
+    return applied
+
+
+# --- Transactions ---
+
+def _commit(conn: sqlite3.Connection):
+    """Commit, unless a unit_of_work is open on this connection (it commits on exit)."""
+    if getattr(conn, "_uow_depth", 0) == 0:
+        conn.commit()
+
+
+@contextmanager
+def unit_of_work(conn: sqlite3.Connection):
+    """
+    Group writes into one transaction.
+
+    Every helper in this module skips its own commit while a unit of work
+    is open; the outermost block commits once on success and rolls back
+    on error. Nested blocks join the outer transaction.
+
+        with unit_of_work(conn):
+            upsert_tickers(conn, tickers)
+            save_price_snapshots(conn, rows)
+    """
+    conn._uow_depth += 1
+    try:
+        yield conn
+    except BaseException:
+        conn._uow_depth -= 1
+        if conn._uow_depth == 0:
+            conn.rollback()
+        raise
+    conn._uow_depth -= 1
+    if conn._uow_depth == 0:
+        conn.commit()
 
 
 # --- Tickers ---
@@ -49,7 +271,30 @@ def upsert_ticker(conn: sqlite3.Connection, ticker: str, company_name: str = Non
             market_cap_millions = COALESCE(excluded.market_cap_millions, market_cap_millions),
             has_options = excluded.has_options
     """, (ticker, company_name, sector, market_cap_millions, has_options))
-    conn.commit()
+    _commit(conn)
+
+
+def upsert_tickers(conn: sqlite3.Connection, tickers: Iterable):
+    """
+    Bulk upsert_ticker. Items are ticker strings or dicts with upsert_ticker's
+    keyword arguments (ticker, company_name, sector, market_cap_millions, has_options).
+    """
+    rows = []
+    for t in tickers:
+        if isinstance(t, str):
+            t = {"ticker": t}
+        rows.append((t["ticker"], t.get("company_name"), t.get("sector"),
+                     t.get("market_cap_millions"), t.get("has_options", True)))
+    conn.executemany("""
+        INSERT INTO tickers (ticker, company_name, sector, market_cap_millions, has_options)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(ticker) DO UPDATE SET
+            company_name = COALESCE(excluded.company_name, company_name),
+            sector = COALESCE(excluded.sector, sector),
+            market_cap_millions = COALESCE(excluded.market_cap_millions, market_cap_millions),
+            has_options = excluded.has_options
+    """, rows)
+    _commit(conn)
 
 
 # --- Price Snapshots ---
@@ -62,7 +307,19 @@ def save_price_snapshot(conn: sqlite3.Connection, ticker: str, price: float,
         INSERT OR IGNORE INTO price_snapshots (ticker, price, volume, snapshot_date, snapshot_time, source)
         VALUES (?, ?, ?, ?, ?, ?)
     """, (ticker, price, volume, now.strftime("%Y-%m-%d"), now.strftime("%H:%M:%S"), source))
-    conn.commit()
+    _commit(conn)
+
+
+def save_price_snapshots(conn: sqlite3.Connection, rows: Iterable[tuple], source: str = "schwab",
+                         at: Optional[datetime] = None):
+    """Bulk save_price_snapshot. rows: (ticker, price, volume); all share one timestamp (default now)."""
+    now = at or datetime.now()
+    snap_date, snap_time = now.strftime("%Y-%m-%d"), now.strftime("%H:%M:%S")
+    conn.executemany("""
+        INSERT OR IGNORE INTO price_snapshots (ticker, price, volume, snapshot_date, snapshot_time, source)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, ((ticker, price, volume, snap_date, snap_time, source) for ticker, price, volume in rows))
+    _commit(conn)
 
 
 def get_price_history(conn: sqlite3.Connection, ticker: str, days: int = 10) -> list[dict]:
@@ -79,17 +336,19 @@ def get_price_history(conn: sqlite3.Connection, ticker: str, days: int = 10) ->
 
 # --- Signal Scores ---
 
-def save_score(conn: sqlite3.Connection, ticker: str, score_result) -> int:
-    """Save a ScoreResult to signal_scores. Returns the row id."""
-    cursor = conn.execute("""
-        INSERT INTO signal_scores
-            (ticker, run_date, total_score, raw_score, grade,
-             catalyst_score, prompt_pulse_score, freshness_score,
-             peer_score, volume_score, macro_score, penalties)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, (
+_SAVE_SCORE_SQL = """
+    INSERT INTO signal_scores
+        (ticker, run_date, total_score, raw_score, grade,
+         catalyst_score, prompt_pulse_score, freshness_score,
+         peer_score, volume_score, macro_score, penalties)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _score_row(ticker: str, run_date: str, score_result) -> tuple:
+    return (
         ticker,
-        datetime.now().strftime("%Y-%m-%d"),
+        run_date,
         score_result.total,
         score_result.raw_total,
         score_result.grade,
@@ -100,11 +359,23 @@ def save_score(conn: sqlite3.Connection, ticker: str, score_result) -> int:
         score_result.breakdown.get("volume", 0),
         score_result.breakdown.get("macro", 0),
         json.dumps(score_result.penalties_applied),
-    ))
-    conn.commit()
+    )
+
+
+def save_score(conn: sqlite3.Connection, ticker: str, score_result) -> int:
+    """Save a ScoreResult to signal_scores. Returns the row id."""
+    cursor = conn.execute(_SAVE_SCORE_SQL, _score_row(ticker, datetime.now().strftime("%Y-%m-%d"), score_result))
+    _commit(conn)
     return cursor.lastrowid
 
 
+def save_scores(conn: sqlite3.Connection, score_results: Iterable):
+    """Bulk save_score. Items are ScoreResults (ticker taken from .ticker)."""
+    run_date = datetime.now().strftime("%Y-%m-%d")
+    conn.executemany(_SAVE_SCORE_SQL, (_score_row(r.ticker, run_date, r) for r in score_results))
+    _commit(conn)
+
+
 # --- Recommendations ---
 
 def save_recommendation(conn: sqlite3.Connection, ticker: str, module: str,
@@ -118,7 +389,20 @@ def save_recommendation(conn: sqlite3.Connection, ticker: str, module: str,
         VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
     """, (ticker, datetime.now().strftime("%Y-%m-%d"), module, category, setup, why_now,
           catalyst, not_priced_in, risk, score_total))
-    conn.commit()
+    _commit(conn)
+
+
+def save_recommendations(conn: sqlite3.Connection, recommendations: Iterable[dict]):
+    """Bulk save_recommendation. Items are dicts of save_recommendation's keyword arguments."""
+    run_date = datetime.now().strftime("%Y-%m-%d")
+    conn.executemany("""
+        INSERT INTO recommendations
+            (ticker, run_date, module, category, setup, why_now, catalyst, not_priced_in, risk, score_total)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, ((r["ticker"], run_date, r["module"], r.get("category"), r.get("setup"), r.get("why_now"),
+           r.get("catalyst"), r.get("not_priced_in"), r.get("risk"), r.get("score_total"))
+          for r in recommendations))
+    _commit(conn)
 
 
 # --- ShadowList ---
@@ -131,7 +415,7 @@ def save_shadowlist_entry(conn: sqlite3.Connection, ticker: str, why_interesting
             (ticker, why_interesting, why_not_ready, trigger_condition, added_date, status)
         VALUES (?, ?, ?, ?, ?, 'active')
     """, (ticker, why_interesting, why_not_ready, trigger_condition, datetime.now().strftime("%Y-%m-%d")))
-    conn.commit()
+    _commit(conn)
 
 
 def get_active_shadowlist(conn: sqlite3.Connection) -> list[dict]:
@@ -148,7 +432,7 @@ def graduate_shadowlist(conn: sqlite3.Connection, ticker: str):
         UPDATE shadowlist_entries SET status = 'graduated', graduated_date = ?
         WHERE ticker = ? AND status = 'active'
     """, (datetime.now().strftime("%Y-%m-%d"), ticker))
-    conn.commit()
+    _commit(conn)
 
 
 # --- Near Misses ---
@@ -159,7 +443,7 @@ def save_near_miss(conn: sqlite3.Connection, ticker: str, total_score: float, mi
         INSERT INTO near_misses (ticker, run_date, total_score, miss_reason)
         VALUES (?, ?, ?, ?)
     """, (ticker, datetime.now().strftime("%Y-%m-%d"), total_score, miss_reason))
-    conn.commit()
+    _commit(conn)
 
 
 # --- Trade Journal ---
@@ -172,7 +456,7 @@ def log_trade(conn: sqlite3.Connection, ticker: str, direction: str,
         INSERT INTO trade_journal (ticker, direction, entry_date, entry_price, shares, module, notes)
         VALUES (?, ?, ?, ?, ?, ?, ?)
     """, (ticker, direction, entry_date, entry_price, shares, module, notes))
-    conn.commit()
+    _commit(conn)
     return cursor.lastrowid
 
 
@@ -192,7 +476,7 @@ def close_trade(conn: sqlite3.Connection, trade_id: int, exit_date: str,
         UPDATE trade_journal SET exit_date = ?, exit_price = ?, pnl = ?, pnl_pct = ?
         WHERE id = ?
     """, (exit_date, exit_price, round(pnl, 2), round(pnl_pct, 2), trade_id))
-    conn.commit()
+    _commit(conn)
 
 
 def get_open_trades(conn: sqlite3.Connection) -> list[dict]:
@@ -241,7 +525,21 @@ def save_prompt_pulse_components(
         VALUES (?, ?, ?, ?, ?, ?, ?)
     """, (ticker, captured_at, scan_type, ai_sampling, social_velocity,
           volume_anomaly, composite))
-    conn.commit()
+    _commit(conn)
+
+
+def save_prompt_pulse_components_bulk(conn: sqlite3.Connection, rows: Iterable[tuple]):
+    """
+    Bulk save_prompt_pulse_components. rows: (ticker, captured_at, scan_type,
+    ai_sampling, social_velocity, volume_anomaly, composite).
+    """
+    conn.executemany("""
+        INSERT OR REPLACE INTO prompt_pulse_components
+            (ticker, captured_at, scan_type, ai_sampling, social_velocity,
+             volume_anomaly, composite)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, rows)
+    _commit(conn)
 
 
 def get_recent_components(conn: sqlite3.Connection, ticker: str, limit: int = 10):
@@ -266,28 +564,125 @@ def get_latest_composite(conn: sqlite3.Connection, ticker: str):
     return dict(row) if row else None
 
 
+
+def get_component_history(conn, ticker: str, since: str) -> list[dict]:
+    """
+    Component history since a date/timestamp, newest first, across raw scans
+    and prompt_pulse_daily rollups. Each row has a `granularity` of 'scan'
+    or 'day'; rolled-up days report their last scan time as captured_at.
+    """
+    rows = conn.execute("""
+        SELECT captured_at, scan_type, ai_sampling, social_velocity, volume_anomaly,
+               composite, 'scan' AS granularity
+        FROM prompt_pulse_components
+        WHERE ticker = ?1 AND captured_at >= ?2
+        UNION ALL
+        SELECT last_captured_at, NULL, ai_sampling, social_velocity, volume_anomaly,
+               composite, 'day'
+        FROM prompt_pulse_daily
+        WHERE ticker = ?1 AND day >= substr(?2, 1, 10)
+        ORDER BY captured_at DESC
+    """, (ticker, since)).fetchall()
+    return [dict(r) for r in rows]
+
+
 # --- AI samples raw ---
+#
+# Since schema v5 prompts are interned in ai_prompts (one row per prompt_id +
+# content hash) and responses are stored zlib-compressed in response_z
+# (NULL once pruned by retention). The helpers below take and return plain
+# prompt_text / response_text, so callers never see the storage format.
+
+_AI_SAMPLE_COLUMNS = """
+    s.id, s.captured_at, s.model, s.prompt_id, p.prompt_text, s.response_z,
+    s.tickers_extracted, s.token_cost_usd, s.created_at
+"""
+
+
+def prompt_hash(prompt_text: str) -> str:
+    return hashlib.sha256(prompt_text.encode()).hexdigest()
+
+
+def compress_text(text: str) -> Optional[bytes]:
+    """zlib-compress a response body; empty/pruned text is stored as NULL."""
+    return zlib.compress(text.encode()) if text else None
+
+
+def decompress_text(blob: Optional[bytes]) -> str:
+    return zlib.decompress(blob).decode() if blob is not None else ""
+
+
+def intern_prompts(conn, prompts: Iterable[tuple]) -> dict[tuple, int]:
+    """
+    Ensure (prompt_id, prompt_text) pairs exist in ai_prompts.
+    Returns {(prompt_id, prompt_text): prompt_key}.
+    """
+    unique = {(pid, text): prompt_hash(text) for pid, text in prompts}
+    conn.executemany("""
+        INSERT OR IGNORE INTO ai_prompts (prompt_id, prompt_hash, prompt_text) VALUES (?, ?, ?)
+    """, ((pid, h, text) for (pid, text), h in unique.items()))
+    return {
+        key: conn.execute("SELECT prompt_key FROM ai_prompts WHERE prompt_id = ? AND prompt_hash = ?",
+                          (key[0], h)).fetchone()[0]
+        for key, h in unique.items()
+    }
+
+
+def _ai_sample_dict(row) -> dict:
+    d = dict(row)
+    d["response_text"] = decompress_text(d.pop("response_z"))
+    return d
+
 
 def save_ai_sample_raw(conn, captured_at, model, prompt_id, prompt_text,
                        response_text, tickers_extracted, token_cost_usd):
     """Save a raw AI model response for audit and prompt tuning."""
-    conn.execute("""
+    save_ai_samples_raw(conn, [(captured_at, model, prompt_id, prompt_text, response_text,
+                                tickers_extracted, token_cost_usd)])
+
+
+def save_ai_samples_raw(conn, rows: Iterable[tuple]):
+    """
+    Bulk save_ai_sample_raw. rows: (captured_at, model, prompt_id, prompt_text,
+    response_text, tickers_extracted, token_cost_usd).
+    """
+    rows = list(rows)
+    keys = intern_prompts(conn, ((pid, pt) for _, _, pid, pt, _, _, _ in rows))
+    conn.executemany("""
         INSERT INTO ai_samples_raw
-            (captured_at, model, prompt_id, prompt_text, response_text,
+            (captured_at, model, prompt_id, prompt_key, response_z,
              tickers_extracted, token_cost_usd)
         VALUES (?, ?, ?, ?, ?, ?, ?)
-    """, (captured_at, model, prompt_id, prompt_text, response_text,
-          json.dumps(tickers_extracted), token_cost_usd))
-    conn.commit()
+    """, ((c, m, pid, keys[(pid, pt)], compress_text(rt), json.dumps(te), cost)
+          for c, m, pid, pt, rt, te, cost in rows))
+    _commit(conn)
 
 
 def get_ai_samples_since(conn, since: str):
     """Get all AI samples captured at or after the given timestamp."""
-    rows = conn.execute(
-        "SELECT * FROM ai_samples_raw WHERE captured_at >= ? ORDER BY captured_at DESC",
-        (since,)
-    ).fetchall()
-    return [dict(r) for r in rows]
+    rows = conn.execute(f"""
+        SELECT {_AI_SAMPLE_COLUMNS}
+        FROM ai_samples_raw s JOIN ai_prompts p ON p.prompt_key = s.prompt_key
+        WHERE s.captured_at >= ? ORDER BY s.captured_at DESC
+    """, (since,)).fetchall()
+    return [_ai_sample_dict(r) for r in rows]
+
+
+def get_ai_sample_for_day(conn, model: str, prompt_id: str, prompt_text: str, day: str) -> Optional[dict]:
+    """
+    Latest stored response from `model` to this exact prompt (same id and
+    text hash) captured on `day` (YYYY-MM-DD), or None. Pruned responses
+    don't count.
+    """
+    next_day = (date.fromisoformat(day) + timedelta(days=1)).isoformat()
+    row = conn.execute(f"""
+        SELECT {_AI_SAMPLE_COLUMNS}
+        FROM ai_samples_raw s JOIN ai_prompts p ON p.prompt_key = s.prompt_key
+        WHERE s.model = ? AND s.prompt_id = ? AND s.captured_at >= ? AND s.captured_at < ?
+          AND p.prompt_hash = ? AND s.response_z IS NOT NULL
+        ORDER BY s.captured_at DESC LIMIT 1
+    """, (model, prompt_id, day, next_day, prompt_hash(prompt_text))).fetchone()
+    return _ai_sample_dict(row) if row else None
 
 
 # --- Social snapshots ---
@@ -299,7 +694,43 @@ def save_social_snapshot(conn, captured_at, source, ticker, mentions_count, sent
             (captured_at, source, ticker, mentions_count, sentiment_score)
         VALUES (?, ?, ?, ?, ?)
     """, (captured_at, source, ticker, mentions_count, sentiment_score))
-    conn.commit()
+    refresh_social_daily(conn, [(source, ticker, captured_at[:10])])
+    _commit(conn)
+
+
+def save_social_snapshots(conn, rows: Iterable[tuple]):
+    """
+    Bulk save_social_snapshot. rows: (captured_at, source, ticker,
+    mentions_count, sentiment_score); any iterable, consumed once without
+    being materialized.
+    """
+    keys = set()
+
+    def tap(rows):
+        for r in rows:
+            keys.add((r[1], r[2], r[0][:10]))
+            yield r
+
+    conn.executemany("""
+        INSERT OR REPLACE INTO social_snapshots
+            (captured_at, source, ticker, mentions_count, sentiment_score)
+        VALUES (?, ?, ?, ?, ?)
+    """, tap(rows))
+    refresh_social_daily(conn, keys)
+    _commit(conn)
+
+
+def refresh_social_daily(conn, keys: Iterable[tuple]):
+    """Recompute social_daily for the given (source, ticker, day) keys from their raw snapshots."""
+    conn.executemany("""
+        INSERT OR REPLACE INTO social_daily
+            (source, ticker, day, snapshots, mentions_sum, last_captured_at, last_mentions)
+        SELECT source, ticker, ?3, COUNT(*), SUM(mentions_count), MAX(captured_at), mentions_count
+        FROM social_snapshots
+        WHERE source = ?1 AND ticker = ?2
+          AND captured_at >= ?3 AND captured_at < date(?3, '+1 day')
+        GROUP BY source, ticker
+    """, keys)
 
 
 def get_mentions_history(conn, ticker: str, source: str = "apewisdom", days: int = 7):
@@ -313,6 +744,153 @@ def get_mentions_history(conn, ticker: str, source: str = "apewisdom", days: int
     return [dict(r) for r in rows]
 
 
+def get_social_baseline(conn, ticker: str, source: str = "apewisdom", days: int = 7,
+                        as_of: Optional[str] = None) -> Optional[float]:
+    """
+    Average daily mention level over the `days` days before as_of (default
+    today), from social_daily. None when there is no history in the window.
+    """
+    as_of = as_of or date.today().isoformat()
+    row = conn.execute("""
+        SELECT AVG(mentions_sum * 1.0 / snapshots) FROM social_daily
+        WHERE source = ? AND ticker = ?
+          AND day >= date(?, '-' || ? || ' days') AND day < ?
+    """, (source, ticker, as_of, days, as_of)).fetchone()
+    return row[0]
+
+
+def get_velocity_inputs(conn, source: str = "apewisdom", days: int = 7,
+                        as_of: Optional[str] = None) -> dict[str, dict]:
+    """
+    Velocity inputs for every ticker with mentions on as_of (default today),
+    in one query: {ticker: {"mentions_today", "mentions_7d_avg"}}.
+    mentions_7d_avg is None for tickers with no history in the window.
+    """
+    as_of = as_of or date.today().isoformat()
+    rows = conn.execute("""
+        SELECT t.ticker, t.last_mentions AS mentions_today,
+               AVG(b.mentions_sum * 1.0 / b.snapshots) AS mentions_7d_avg
+        FROM social_daily t
+        LEFT JOIN social_daily b
+          ON b.source = t.source AND b.ticker = t.ticker
+         AND b.day >= date(?1, '-' || ?2 || ' days') AND b.day < ?1
+        WHERE t.source = ?3 AND t.day = ?1
+        GROUP BY t.ticker
+    """, (as_of, days, source)).fetchall()
+    return {r["ticker"]: {"mentions_today": r["mentions_today"], "mentions_7d_avg": r["mentions_7d_avg"]}
+            for r in rows}
+
+
+
+def get_social_history(conn, ticker: str, since: str, source: str = "apewisdom") -> list[dict]:
+    """
+    Mention history since a date/timestamp, newest first: raw snapshots where
+    they are still retained, social_daily means for days already rolled up.
+    Each row has a `granularity` of 'scan' or 'day'.
+    """
+    rows = conn.execute("""
+        SELECT captured_at, mentions_count * 1.0 AS mentions, 'scan' AS granularity
+        FROM social_snapshots
+        WHERE source = ?1 AND ticker = ?2 AND captured_at >= ?3
+        UNION ALL
+        SELECT d.last_captured_at, d.mentions_sum * 1.0 / d.snapshots, 'day'
+        FROM social_daily d
+        WHERE d.source = ?1 AND d.ticker = ?2 AND d.day >= substr(?3, 1, 10)
+          AND NOT EXISTS (
+              SELECT 1 FROM social_snapshots s
+              WHERE s.source = d.source AND s.ticker = d.ticker
+                AND s.captured_at >= d.day AND s.captured_at < date(d.day, '+1 day'))
+        ORDER BY captured_at DESC
+    """, (source, ticker, since)).fetchall()
+    return [dict(r) for r in rows]
+
+
+# --- Retention / rollups (spec §8.5) ---
+
+def get_rollup_days(conn, table: str, before: str) -> list[str]:
+    """Distinct captured_at days with raw rows older than `before` (YYYY-MM-DD)."""
+    if table not in ("prompt_pulse_components", "social_snapshots"):
+        raise ValueError(f"no rollup for {table}")
+    rows = conn.execute(f"""
+        SELECT DISTINCT substr(captured_at, 1, 10) FROM {table}
+        WHERE captured_at < ? ORDER BY 1
+    """, (before,)).fetchall()
+    return [r[0] for r in rows]
+
+
+def rollup_prompt_pulse_day(conn, day: str) -> int:
+    """
+    Fold one day of prompt_pulse_components into prompt_pulse_daily and
+    delete the raw rows. A day already rolled up is merged, weighted by scan
+    count, so re-running is harmless. Returns raw rows removed.
+    """
+    conn.execute("""
+        INSERT INTO prompt_pulse_daily
+            (ticker, day, scans, ai_sampling, social_velocity, volume_anomaly,
+             composite, last_captured_at)
+        SELECT ticker, ?1, COUNT(*), AVG(ai_sampling), AVG(social_velocity),
+               AVG(volume_anomaly), AVG(composite), MAX(captured_at)
+        FROM prompt_pulse_components
+        WHERE captured_at >= ?1 AND captured_at < date(?1, '+1 day')
+        GROUP BY ticker
+        ON CONFLICT(ticker, day) DO UPDATE SET
+            ai_sampling = COALESCE((ai_sampling * scans + excluded.ai_sampling * excluded.scans)
+                                   / (scans + excluded.scans), ai_sampling, excluded.ai_sampling),
+            social_velocity = COALESCE((social_velocity * scans + excluded.social_velocity * excluded.scans)
+                                       / (scans + excluded.scans), social_velocity, excluded.social_velocity),
+            volume_anomaly = COALESCE((volume_anomaly * scans + excluded.volume_anomaly * excluded.scans)
+                                      / (scans + excluded.scans), volume_anomaly, excluded.volume_anomaly),
+            composite = (composite * scans + excluded.composite * excluded.scans) / (scans + excluded.scans),
+            last_captured_at = MAX(last_captured_at, excluded.last_captured_at),
+            scans = scans + excluded.scans
+    """, (day,))
+    deleted = conn.execute("""
+        DELETE FROM prompt_pulse_components
+        WHERE captured_at >= ?1 AND captured_at < date(?1, '+1 day')
+    """, (day,)).rowcount
+    _commit(conn)
+    return deleted
+
+
+def rollup_social_day(conn, day: str) -> int:
+    """
+    Delete one day of social_snapshots, which social_daily already
+    aggregates. Any (source, ticker) missing from social_daily (rows written
+    outside the db helpers) is filled in first. Returns raw rows removed.
+    """
+    conn.execute("""
+        INSERT OR IGNORE INTO social_daily
+            (source, ticker, day, snapshots, mentions_sum, last_captured_at, last_mentions)
+        SELECT source, ticker, ?1, COUNT(*), SUM(mentions_count), MAX(captured_at), mentions_count
+        FROM social_snapshots
+        WHERE captured_at >= ?1 AND captured_at < date(?1, '+1 day')
+        GROUP BY source, ticker
+    """, (day,))
+    deleted = conn.execute("""
+        DELETE FROM social_snapshots
+        WHERE captured_at >= ?1 AND captured_at < date(?1, '+1 day')
+    """, (day,)).rowcount
+    _commit(conn)
+    return deleted
+
+
+def prune_ai_responses(conn, before: str, limit: int = 500) -> int:
+    """
+    Drop the response body of up to `limit` ai_samples_raw rows captured
+    before `before`, keeping tickers_extracted and the rest of the row.
+    Returns rows pruned (0 when nothing is left).
+    """
+    pruned = conn.execute("""
+        UPDATE ai_samples_raw SET response_z = NULL
+        WHERE id IN (
+            SELECT id FROM ai_samples_raw
+            WHERE captured_at < ? AND response_z IS NOT NULL
+            LIMIT ?)
+    """, (before, limit)).rowcount
+    _commit(conn)
+    return pruned
+
+
 # --- Recommendation outcomes ---
 
 def save_recommendation_outcome(conn, ticker, ring, first_appeared_at,
@@ -326,7 +904,7 @@ def save_recommendation_outcome(conn, ticker, ring, first_appeared_at,
         VALUES (?, ?, ?, ?, ?, ?)
     """, (ticker, ring, first_appeared_at, entry_price, entry_price_source,
           composite_score_at_entry))
-    conn.commit()
+    _commit(conn)
 
 
 def get_outcome(conn, ticker, first_appeared_at, ring):
@@ -347,7 +925,32 @@ def update_outcome_price(conn, ticker, first_appeared_at, ring, field, price):
         "WHERE ticker = ? AND first_appeared_at = ? AND ring = ?",
         (price, ticker, first_appeared_at, ring)
     )
-    conn.commit()
+    _commit(conn)
+
+
+def get_pending_outcomes(conn) -> list[dict]:
+    """Outcomes still missing a horizon price (price_7d is always filled last)."""
+    rows = conn.execute("""
+        SELECT * FROM recommendation_outcomes
+        WHERE price_7d IS NULL
+        ORDER BY first_appeared_at
+    """).fetchall()
+    return [dict(r) for r in rows]
+
+
+def update_outcome_prices(conn, rows: Iterable[tuple]):
+    """
+    Bulk fill of horizon prices. rows: (id, price_1d, price_3d, price_7d);
+    None leaves a field as is, and fields already set are never overwritten.
+    """
+    conn.executemany("""
+        UPDATE recommendation_outcomes SET
+            price_1d = COALESCE(price_1d, ?),
+            price_3d = COALESCE(price_3d, ?),
+            price_7d = COALESCE(price_7d, ?)
+        WHERE id = ?
+    """, ((p1, p3, p7, oid) for oid, p1, p3, p7 in rows))
+    _commit(conn)
 
 
 def mark_outcome_dropped(conn, ticker, first_appeared_at, ring, dropped_at):
@@ -356,4 +959,157 @@ def mark_outcome_dropped(conn, ticker, first_appeared_at, ring, dropped_at):
         UPDATE recommendation_outcomes SET dropped_at = ?
         WHERE ticker = ? AND first_appeared_at = ? AND ring = ?
     """, (dropped_at, ticker, first_appeared_at, ring))
-    conn.commit()
+    _commit(conn)
+
+
+# --- Price bars (local OHLCV cache) ---
+
+def save_price_bars(conn, ticker: str, frequency: str, bars):
+    """Upsert OHLCV bars (objects with date/open/high/low/close/volume) for one ticker."""
+    conn.executemany("""
+        INSERT INTO price_bars (ticker, frequency, bar_date, open, high, low, close, volume)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(ticker, frequency, bar_date) DO UPDATE SET
+            open = excluded.open, high = excluded.high, low = excluded.low,
+            close = excluded.close, volume = excluded.volume
+    """, [(ticker, frequency, b.date, b.open, b.high, b.low, b.close, b.volume) for b in bars])
+    _commit(conn)
+
+
+def get_price_bars(conn, ticker: str, frequency: str, start_date: str, end_date: str):
+    """Get cached bars for a ticker within [start_date, end_date], oldest first."""
+    rows = conn.execute("""
+        SELECT bar_date, open, high, low, close, volume FROM price_bars
+        WHERE ticker = ? AND frequency = ? AND bar_date BETWEEN ? AND ?
+        ORDER BY bar_date
+    """, (ticker, frequency, start_date, end_date)).fetchall()
+    return [dict(r) for r in rows]
+
+
+def get_bar_coverage(conn, ticker: str, frequency: str):
+    """Get the fetched date span for a ticker's cached bars, or None."""
+    row = conn.execute("""
+        SELECT start_date, end_date, fetched_at FROM price_bar_coverage
+        WHERE ticker = ? AND frequency = ?
+    """, (ticker, frequency)).fetchone()
+    return dict(row) if row else None
+
+
+def save_bar_coverage(conn, ticker: str, frequency: str, start_date: str,
+                      end_date: str, fetched_at: str):
+    """Record the fetched date span for a ticker's cached bars."""
+    conn.execute("""
+        INSERT INTO price_bar_coverage (ticker, frequency, start_date, end_date, fetched_at)
+        VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(ticker, frequency) DO UPDATE SET
+            start_date = excluded.start_date,
+            end_date = excluded.end_date,
+            fetched_at = excluded.fetched_at
+    """, (ticker, frequency, start_date, end_date, fetched_at))
+    _commit(conn)
+
+
+# --- Symbol validity cache ---
+
+def get_symbol_validity(conn, symbols: Iterable[str], valid_since: str, invalid_since: str) -> dict[str, bool]:
+    """
+    Cached validity for symbols checked recently enough: valid results
+    checked at/after valid_since, invalid ones at/after invalid_since.
+    Stale or unknown symbols are left out.
+    """
+    symbols = list(symbols)
+    out: dict[str, bool] = {}
+    for i in range(0, len(symbols), 500):   # stay under SQLite's bound-parameter limit
+        chunk = symbols[i:i + 500]
+        rows = conn.execute(f"""
+            SELECT symbol, is_valid FROM symbol_validity
+            WHERE symbol IN ({','.join('?' * len(chunk))})
+              AND checked_at >= CASE WHEN is_valid THEN ? ELSE ? END
+        """, (*chunk, valid_since, invalid_since)).fetchall()
+        out.update({r["symbol"]: bool(r["is_valid"]) for r in rows})
+    return out
+
+
+def save_symbol_validity(conn, results: dict[str, bool], checked_at: str):
+    """Record validation results ({symbol: is_valid})."""
+    conn.executemany("""
+        INSERT INTO symbol_validity (symbol, is_valid, checked_at) VALUES (?, ?, ?)
+        ON CONFLICT(symbol) DO UPDATE SET is_valid = excluded.is_valid, checked_at = excluded.checked_at
+    """, ((sym, int(ok), checked_at) for sym, ok in results.items()))
+    _commit(conn)
+
+
+# --- Rolling volume state ---
+
+def get_volume_states(conn, tickers: Iterable[str]) -> dict[str, dict]:
+    """volume_state rows for the given tickers ({ticker: row}, ring decoded). Unknown tickers are left out."""
+    tickers = list(tickers)
+    out: dict[str, dict] = {}
+    for i in range(0, len(tickers), 500):   # stay under SQLite's bound-parameter limit
+        chunk = tickers[i:i + 500]
+        rows = conn.execute(f"""
+            SELECT ticker, window_days, last_bar_date, volume_sum, day_count, ring
+            FROM volume_state WHERE ticker IN ({','.join('?' * len(chunk))})
+        """, chunk).fetchall()
+        for r in rows:
+            d = dict(r)
+            d["ring"] = json.loads(d["ring"])
+            out[d["ticker"]] = d
+    return out
+
+
+def save_volume_states(conn, rows: Iterable[tuple]):
+    """Upsert volume_state. rows: (ticker, window_days, last_bar_date, volume_sum, day_count, ring, updated_at)."""
+    conn.executemany("""
+        INSERT OR REPLACE INTO volume_state
+            (ticker, window_days, last_bar_date, volume_sum, day_count, ring, updated_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """, ((t, w, last, total, n, json.dumps(ring), at) for t, w, last, total, n, ring, at in rows))
+    _commit(conn)
+
+
+def get_avg_volumes(conn, tickers: Optional[Iterable[str]] = None) -> dict[str, float]:
+    """
+    Rolling average daily volume per ticker from volume_state (one primary-key
+    read each; every ticker with state if tickers is None). The average is
+    over day_count days, which is below the window for young listings.
+    """
+    sql = "SELECT ticker, volume_sum * 1.0 / day_count AS avg FROM volume_state WHERE day_count > 0"
+    if tickers is None:
+        return {r["ticker"]: r["avg"] for r in conn.execute(sql)}
+    tickers = list(tickers)
+    out: dict[str, float] = {}
+    for i in range(0, len(tickers), 500):
+        chunk = tickers[i:i + 500]
+        rows = conn.execute(f"{sql} AND ticker IN ({','.join('?' * len(chunk))})", chunk)
+        out.update({r["ticker"]: r["avg"] for r in rows})
+    return out
+
+
+def get_recent_daily_volumes(conn, before: str, n: int,
+                             tickers: Optional[Iterable[str]] = None) -> dict[str, list[tuple[str, int]]]:
+    """
+    The last n daily (bar_date, volume) pairs dated before `before` per
+    ticker from price_bars, oldest first. All cached tickers if tickers is None.
+    """
+    where, params = "", []
+    if tickers is not None:
+        tickers = list(tickers)
+        if not tickers:
+            return {}
+        where = "AND ticker IN (SELECT value FROM json_each(?))"
+        params = [json.dumps(tickers)]
+    rows = conn.execute(f"""
+        SELECT ticker, bar_date, volume FROM (
+            SELECT ticker, bar_date, volume,
+                   ROW_NUMBER() OVER (PARTITION BY ticker ORDER BY bar_date DESC) AS rn
+            FROM price_bars
+            WHERE frequency = 'daily' AND bar_date < ? AND volume IS NOT NULL {where}
+        )
+        WHERE rn <= ?
+        ORDER BY ticker, bar_date
+    """, (before, *params, n)).fetchall()
+    out: dict[str, list[tuple[str, int]]] = {}
+    for r in rows:
+        out.setdefault(r["ticker"], []).append((r["bar_date"], r["volume"]))
+    return out
@@ -0,0 +1,150 @@
+"""
+VantaStonk — Incremental DB sync between workstations
+
+data/vantastonk.db is not tracked in git, so each machine keeps its own
+scan history. This module moves only what changed since the last sync:
+
+- export_changes(conn, peer, path) writes every row inserted or updated
+  since the last export to that peer (per the sync_log triggers) as a
+  gzipped JSON changeset, then advances the peer's watermark.
+- import_changes(conn, path) upserts the changeset by each table's UNIQUE
+  key in one transaction. Applying the same file twice is a no-op, and
+  imported rows are not logged for re-export.
+
+Synced tables are those with natural UNIQUE keys (SYNC_TABLES). Derived
+tables (social_daily, rollups, bar coverage, volume_state) are rebuilt
+locally instead;
+tables without a natural key (scores, recommendations, AI samples, the
+journal) stay per-machine. Local row ids never cross machines.
+"""
+
+import gzip
+import json
+import socket
+from datetime import datetime
+from pathlib import Path
+
+from src.db import schema_version, unit_of_work, refresh_social_daily
+
+FORMAT = "vantastonk-changeset"
+FORMAT_VERSION = 1
+
+# table → UNIQUE key, in foreign-key order
+SYNC_TABLES = {
+    "tickers": ("ticker",),
+    "price_snapshots": ("ticker", "snapshot_date", "snapshot_time"),
+    "prompt_pulse_components": ("ticker", "captured_at"),
+    "social_snapshots": ("captured_at", "source", "ticker"),
+    "recommendation_outcomes": ("ticker", "first_appeared_at", "ring"),
+    "price_bars": ("ticker", "frequency", "bar_date"),
+}
+
+
+def _columns(conn, table: str) -> list[str]:
+    return [r["name"] for r in conn.execute(f"PRAGMA table_info({table})") if r["name"] != "id"]
+
+
+def _last_seq(conn) -> int:
+    """
+    Highest sync_log.seq ever issued. Read from sqlite_sequence rather than
+    MAX(seq): exports prune the log, and an empty log must not send a
+    peer's watermark back to 0.
+    """
+    row = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'sync_log'").fetchone()
+    return row[0] if row else 0
+
+
+def peer_watermark(conn, peer: str) -> int:
+    row = conn.execute("SELECT last_seq FROM sync_peers WHERE peer = ?", (peer,)).fetchone()
+    return row[0] if row else 0
+
+
+def export_changes(conn, peer: str, path: str, full: bool = False) -> dict:
+    """
+    Write rows changed since the last export to `peer` (everything with
+    full=True) to a changeset file. Returns {table: rows} plus "bytes".
+    """
+    since = 0 if full else peer_watermark(conn, peer)
+    upto = _last_seq(conn)
+
+    tables = {}
+    for table in SYNC_TABLES:
+        columns = _columns(conn, table)
+        if full:
+            rows = conn.execute(f"SELECT {', '.join(columns)} FROM {table}").fetchall()
+        else:
+            rows = conn.execute(f"""
+                SELECT {', '.join(columns)} FROM {table}
+                WHERE id IN (SELECT row_id FROM sync_log WHERE tbl = ? AND seq > ? AND seq <= ?)
+            """, (table, since, upto)).fetchall()
+        if rows:
+            tables[table] = {"columns": columns, "rows": [list(r) for r in rows]}
+
+    changeset = {
+        "format": FORMAT,
+        "version": FORMAT_VERSION,
+        "schema_version": schema_version(conn),
+        "source": socket.gethostname(),
+        "exported_at": datetime.now().isoformat(timespec="seconds"),
+        "tables": tables,
+    }
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump(changeset, f, separators=(",", ":"))
+
+    with unit_of_work(conn):
+        conn.execute("""
+            INSERT INTO sync_peers (peer, last_seq, exported_at) VALUES (?, ?, ?)
+            ON CONFLICT(peer) DO UPDATE SET last_seq = excluded.last_seq, exported_at = excluded.exported_at
+        """, (peer, upto, changeset["exported_at"]))
+        # Log entries every peer has already received are no longer needed
+        conn.execute("DELETE FROM sync_log WHERE seq <= (SELECT MIN(last_seq) FROM sync_peers)")
+
+    stats = {t: len(d["rows"]) for t, d in tables.items()}
+    stats["bytes"] = Path(path).stat().st_size
+    return stats
+
+
+def _upsert_sql(table: str, columns: list[str]) -> str:
+    key = SYNC_TABLES[table]
+    updates = [c for c in columns if c not in key and c != "created_at"]
+    set_clause = ", ".join(f"{c} = COALESCE(excluded.{c}, {c})" for c in updates)
+    conflict = f"DO UPDATE SET {set_clause}" if updates else "DO NOTHING"
+    return f"""
+        INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})
+        ON CONFLICT({', '.join(key)}) {conflict}
+    """
+
+
+def import_changes(conn, path: str) -> dict:
+    """Apply a changeset in one transaction. Returns {table: rows applied}."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        changeset = json.load(f)
+    if changeset.get("format") != FORMAT or changeset.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{path} is not a {FORMAT} v{FORMAT_VERSION} file")
+    if changeset["schema_version"] != schema_version(conn):
+        raise ValueError(f"schema mismatch: changeset v{changeset['schema_version']}, "
+                         f"local v{schema_version(conn)} — migrate both machines first")
+
+    stats = {}
+    with unit_of_work(conn):
+        before = _last_seq(conn)
+        for table in SYNC_TABLES:
+            data = changeset["tables"].get(table)
+            if not data:
+                continue
+            local = set(_columns(conn, table))
+            keep = [i for i, c in enumerate(data["columns"]) if c in local]
+            columns = [data["columns"][i] for i in keep]
+            conn.executemany(_upsert_sql(table, columns),
+                             ([row[i] for i in keep] for row in data["rows"]))
+            stats[table] = len(data["rows"])
+
+            if table == "social_snapshots":
+                idx = {c: i for i, c in enumerate(data["columns"])}
+                refresh_social_daily(conn, {
+                    (r[idx["source"]], r[idx["ticker"]], r[idx["captured_at"]][:10]) for r in data["rows"]
+                })
+        # Imported rows came from the peer; don't ship them back
+        conn.execute("DELETE FROM sync_log WHERE seq > ?", (before,))
+    return stats
@@ -0,0 +1,254 @@
+"""
+VantaStonk — Write-behind DB writer
+
+Producers (scan stages, fetch threads) submit typed records; one writer
+thread owns its own SQLite connection and drains them into the bulk
+writers in src/db.py, one transaction per batch. A batch is written when
+it reaches batch_size records or max_delay seconds after its first record,
+whichever comes first, so network-bound stages never wait on disk.
+
+flush() is the durability barrier: it returns once everything submitted
+before it is committed, and re-raises the first write error since the
+previous flush. Call it at stage boundaries and before reading back what
+was written through another connection.
+
+Within a batch, ticker upserts are written first so the foreign keys of
+price snapshots always resolve.
+"""
+
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from src.db import (
+    DB_PATH, get_connection, unit_of_work,
+    upsert_tickers, save_price_snapshots, save_scores, save_recommendations,
+    save_prompt_pulse_components_bulk, save_ai_samples_raw, save_social_snapshots,
+)
+
+BATCH_SIZE = 500
+MAX_DELAY = 0.5   # seconds a record may wait before its batch is written
+
+
+# --- Records ---
+
+@dataclass(frozen=True)
+class TickerRecord:
+    ticker: str
+    company_name: Optional[str] = None
+    sector: Optional[str] = None
+    market_cap_millions: Optional[float] = None
+    has_options: bool = True
+
+
+@dataclass(frozen=True)
+class PriceSnapshotRecord:
+    ticker: str
+    price: float
+    volume: Optional[int] = None
+    source: str = "schwab"
+    taken_at: datetime = field(default_factory=datetime.now)
+
+
+@dataclass(frozen=True)
+class ScoreRecord:
+    score_result: Any   # ScoreResult
+
+
+@dataclass(frozen=True)
+class RecommendationRecord:
+    ticker: str
+    module: str
+    category: Optional[str] = None
+    setup: Optional[str] = None
+    why_now: Optional[str] = None
+    catalyst: Optional[str] = None
+    not_priced_in: Optional[str] = None
+    risk: Optional[str] = None
+    score_total: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class ComponentRecord:
+    ticker: str
+    captured_at: str
+    scan_type: str
+    ai_sampling: Optional[float]
+    social_velocity: Optional[float]
+    volume_anomaly: Optional[float]
+    composite: float
+
+
+@dataclass(frozen=True)
+class AiSampleRecord:
+    captured_at: str
+    model: str
+    prompt_id: str
+    prompt_text: str
+    response_text: str
+    tickers_extracted: list
+    token_cost_usd: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class SocialSnapshotRecord:
+    captured_at: str
+    source: str
+    ticker: str
+    mentions_count: int
+    sentiment_score: Optional[float] = None
+
+
+class _Barrier:
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+_STOP = object()
+
+
+def write_batch(conn, records: list):
+    """Write a mixed list of records in one transaction, in dependency order."""
+    by_type: dict[type, list] = {}
+    for r in records:
+        by_type.setdefault(type(r), []).append(r)
+
+    with unit_of_work(conn):
+        if TickerRecord in by_type:
+            upsert_tickers(conn, [r.__dict__ for r in by_type[TickerRecord]])
+        snapshot_groups: dict[tuple, list] = {}
+        for r in by_type.get(PriceSnapshotRecord, []):
+            key = (r.source, r.taken_at.replace(microsecond=0))
+            snapshot_groups.setdefault(key, []).append((r.ticker, r.price, r.volume))
+        for (source, taken_at), rows in snapshot_groups.items():
+            save_price_snapshots(conn, rows, source=source, at=taken_at)
+        if ScoreRecord in by_type:
+            save_scores(conn, [r.score_result for r in by_type[ScoreRecord]])
+        if RecommendationRecord in by_type:
+            save_recommendations(conn, [r.__dict__ for r in by_type[RecommendationRecord]])
+        if ComponentRecord in by_type:
+            save_prompt_pulse_components_bulk(conn, [
+                (r.ticker, r.captured_at, r.scan_type, r.ai_sampling, r.social_velocity,
+                 r.volume_anomaly, r.composite) for r in by_type[ComponentRecord]])
+        if AiSampleRecord in by_type:
+            save_ai_samples_raw(conn, [
+                (r.captured_at, r.model, r.prompt_id, r.prompt_text, r.response_text,
+                 r.tickers_extracted, r.token_cost_usd) for r in by_type[AiSampleRecord]])
+        if SocialSnapshotRecord in by_type:
+            save_social_snapshots(conn, [
+                (r.captured_at, r.source, r.ticker, r.mentions_count, r.sentiment_score)
+                for r in by_type[SocialSnapshotRecord]])
+
+
+class DbWriter:
+    """Background writer thread with its own connection. Use as a context manager or call close()."""
+
+    def __init__(self, db_path: str = DB_PATH, batch_size: int = BATCH_SIZE,
+                 max_delay: float = MAX_DELAY, profile: str = "scan_writer"):
+        self._db_path = db_path
+        self._profile = profile
+        self._batch_size = batch_size
+        self._max_delay = max_delay
+        self._queue: queue.Queue = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self.batches = 0   # transactions committed
+        self.written = 0   # records committed
+        self._thread = threading.Thread(target=self._run, name="db-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, record):
+        if self._closed:
+            raise RuntimeError("DbWriter is closed")
+        self._queue.put(record)
+
+    def submit_many(self, records):
+        for r in records:
+            self.submit(r)
+
+    def flush(self, timeout: Optional[float] = None):
+        """Block until every record submitted so far is committed; raise any write error since the last flush."""
+        barrier = _Barrier()
+        self._queue.put(barrier)
+        give_up = None if timeout is None else time.monotonic() + timeout
+        while not barrier.done.wait(0.05):
+            if not self._thread.is_alive():
+                raise RuntimeError("DbWriter thread has stopped") from self._error
+            if give_up is not None and time.monotonic() >= give_up:
+                raise TimeoutError("DbWriter flush timed out")
+        if barrier.error is not None:
+            raise barrier.error
+
+    def close(self):
+        """Flush, stop the thread and close its connection."""
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- writer thread ---
+
+    def _write(self, conn, batch: list):
+        if not batch:
+            return
+        try:
+            write_batch(conn, batch)
+            self.batches += 1
+            self.written += len(batch)
+        except Exception as e:
+            print(f"  DB writer: batch of {len(batch)} records failed: {e}")
+            if self._error is None:
+                self._error = e
+        batch.clear()
+
+    def _run(self):
+        try:
+            conn = get_connection(self._db_path, self._profile)
+        except Exception as e:
+            print(f"  DB writer: could not open {self._db_path}: {e}")
+            self._error = e
+            return
+        batch: list = []
+        deadline = None
+        try:
+            while True:
+                timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    self._write(conn, batch)
+                    deadline = None
+                    continue
+
+                if item is _STOP:
+                    self._write(conn, batch)
+                    return
+                if isinstance(item, _Barrier):
+                    self._write(conn, batch)
+                    deadline = None
+                    item.error, self._error = self._error, None
+                    item.done.set()
+                    continue
+
+                batch.append(item)
+                if deadline is None:
+                    deadline = time.monotonic() + self._max_delay
+                if len(batch) >= self._batch_size:
+                    self._write(conn, batch)
+                    deadline = None
+        finally:
+            conn.close()
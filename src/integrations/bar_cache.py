@@ -0,0 +1,134 @@
+"""
+VantaStonk — Persistent OHLCV bar cache
+
+Sits in front of SchwabClient price history. Daily bars are stored in the
+price_bars table along with the date span already fetched per ticker
+(price_bar_coverage), so a request only goes to Schwab for the part of the
+range the cache has not seen:
+
+- no coverage, or range starts before coverage → fetch from range start
+- range ends after coverage → fetch from the last covered day (re-pulls
+  that day, whose bar may have been partial when cached)
+- range ends today and today's bar is older than TAIL_TTL → refresh the tail
+
+Fetches always run through "now", which keeps coverage one contiguous span.
+Newly stored daily bars also advance the rolling volume_state (avg_30d for
+RVOL) in the same transaction. Minute bars are passed straight through to
+the client (not cached).
+"""
+
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from src.db import get_price_bars, get_bar_coverage, save_price_bars, save_bar_coverage, unit_of_work
+from src.integrations.schwab_client import PriceBar, SchwabClient, prices_5d_from_bars
+from src.signals.volume_state import fold_daily_bars
+
+# How long today's (still-forming) bar is trusted before the tail is re-pulled
+TAIL_TTL = timedelta(hours=1)
+
+
+class BarCache:
+    """Drop-in replacement for SchwabClient's price-history methods, backed by SQLite."""
+
+    def __init__(self, client: SchwabClient, conn, tail_ttl: timedelta = TAIL_TTL):
+        self._client = client
+        self._conn = conn
+        self._tail_ttl = tail_ttl
+        self.fetches = 0   # history requests sent to Schwab
+        self.hits = 0      # requests served entirely from the cache
+
+    def _fetch_days(self, ticker: str, start: date, end: date, now: datetime) -> Optional[int]:
+        """Return the `days` lookback to fetch for this range, or None if fully cached."""
+        cov = get_bar_coverage(self._conn, ticker, "daily")
+        today = now.date()
+
+        if cov is None or start.isoformat() < cov["start_date"]:
+            fetch_from = start
+        elif end.isoformat() > cov["end_date"]:
+            fetch_from = date.fromisoformat(cov["end_date"])
+        elif end >= today and datetime.fromisoformat(cov["fetched_at"]) < now - self._tail_ttl:
+            fetch_from = date.fromisoformat(cov["end_date"])
+        else:
+            return None
+
+        # +1 so the first day's candle is inside the window regardless of time of day
+        return (today - fetch_from).days + 1
+
+    def _store(self, ticker: str, bars: list[PriceBar], start: date, now: datetime):
+        cov = get_bar_coverage(self._conn, ticker, "daily")
+        cov_start = start.isoformat()
+        if cov is not None:
+            cov_start = min(cov_start, cov["start_date"])
+        save_price_bars(self._conn, ticker, "daily", bars)
+        save_bar_coverage(self._conn, ticker, "daily", cov_start,
+                          now.date().isoformat(), now.isoformat(timespec="seconds"))
+
+    def _read(self, ticker: str, start: date, end: date) -> list[PriceBar]:
+        rows = get_price_bars(self._conn, ticker, "daily", start.isoformat(), end.isoformat())
+        return [PriceBar(date=r["bar_date"], open=r["open"], high=r["high"], low=r["low"],
+                         close=r["close"], volume=r["volume"]) for r in rows]
+
+    def get_range(self, ticker: str, start: date, end: Optional[date] = None) -> list[PriceBar]:
+        """Get daily bars for [start, end] (end defaults to today), fetching only what's missing."""
+        bars, errors = self.get_range_bulk([ticker], start, end)
+        if ticker in errors:
+            raise errors[ticker]
+        return bars[ticker]
+
+    def get_range_bulk(
+        self,
+        tickers: list[str],
+        start: date,
+        end: Optional[date] = None,
+    ) -> tuple[dict[str, list[PriceBar]], dict[str, Exception]]:
+        """
+        Bulk version of get_range. Tickers needing a fetch are grouped by
+        lookback and sent through SchwabClient.get_price_history_bulk.
+
+        Returns (bars_by_ticker, errors_by_ticker) in request order.
+        """
+        now = datetime.now()
+        end = end or now.date()
+        unique = list(dict.fromkeys(tickers))
+
+        by_days: dict[int, list[str]] = {}
+        for ticker in unique:
+            days = self._fetch_days(ticker, start, end, now)
+            if days is None:
+                self.hits += 1
+            else:
+                by_days.setdefault(days, []).append(ticker)
+
+        errors: dict[str, Exception] = {}
+        for days, group in by_days.items():
+            fetched, failed = self._client.get_price_history_bulk(group, days=days, frequency="daily")
+            self.fetches += len(group)
+            errors.update(failed)
+            with unit_of_work(self._conn):
+                for ticker, bars in fetched.items():
+                    self._store(ticker, bars, start, now)
+                fold_daily_bars(self._conn, fetched, now.date(), now=now)
+
+        bars_by_ticker = {t: self._read(t, start, end) for t in unique if t not in errors}
+        return bars_by_ticker, errors
+
+    # --- SchwabClient-compatible surface ---
+
+    def get_price_history(self, ticker: str, days: int = 10, frequency: str = "daily") -> list[PriceBar]:
+        if frequency != "daily":
+            return self._client.get_price_history(ticker, days=days, frequency=frequency)
+        return self.get_range(ticker, (datetime.now() - timedelta(days=days)).date())
+
+    def get_price_history_bulk(
+        self,
+        tickers: list[str],
+        days: int = 10,
+        frequency: str = "daily",
+    ) -> tuple[dict[str, list[PriceBar]], dict[str, Exception]]:
+        if frequency != "daily":
+            return self._client.get_price_history_bulk(tickers, days=days, frequency=frequency)
+        return self.get_range_bulk(tickers, (datetime.now() - timedelta(days=days)).date())
+
+    def get_5day_prices(self, ticker: str) -> tuple[Optional[float], Optional[float]]:
+        return prices_5d_from_bars(self.get_price_history(ticker, days=10))
@@ -0,0 +1,183 @@
+"""
+VantaStonk — Shared outbound HTTP layer
+
+One long-lived, pooled httpx.Client per remote host, shared by every
+integration in the process (Apewisdom, the OpenAI / xAI / Anthropic SDKs),
+so TLS handshakes happen once per host per process rather than on every
+call:
+
+- keep-alive pools sized per host (HOST_LIMITS): one client per host means
+  the connection cap is a true per-host limit
+- HTTP/2 where the server negotiates it, when the optional `h2` package is
+  installed (pip install httpx[http2]); HTTP/1.1 otherwise
+- connect/read timeouts per host (HOST_TIMEOUTS)
+- per-host metrics: requests, errors, latency to response headers, and
+  bytes sent / received on the wire — see stats() and format_stats()
+
+schwab-py builds and refreshes its own OAuth session, so Schwab traffic
+stays on that client and its AdaptiveRateLimiter. SDK releases that no
+longer accept an httpx.Client (see ai_sampling._AnthropicClient) likewise
+keep their own pool and don't show up in these metrics.
+"""
+
+import atexit
+import importlib.util
+import threading
+import time
+from dataclasses import dataclass, asdict
+from typing import Optional
+
+import httpx
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+DEFAULT_HOST_LIMIT = 8
+KEEPALIVE_EXPIRY = 60.0     # seconds an idle pooled connection is kept
+
+HOST_LIMITS = {
+    "apewisdom.io": 4,
+    "api.openai.com": 8,
+    "api.x.ai": 8,
+    "api.anthropic.com": 8,
+}
+HOST_TIMEOUTS = {
+    "apewisdom.io": httpx.Timeout(10.0, connect=5.0),
+    # LLM responses are slow to start; the SDKs also pass per-request timeouts
+    "api.openai.com": httpx.Timeout(120.0, connect=5.0),
+    "api.x.ai": httpx.Timeout(120.0, connect=5.0),
+    "api.anthropic.com": httpx.Timeout(120.0, connect=5.0),
+}
+
+
+@dataclass
+class HostStats:
+    requests: int = 0
+    errors: int = 0              # transport errors (no response)
+    bytes_sent: int = 0
+    bytes_received: int = 0      # response body bytes as sent (before decompression)
+    latency_seconds: float = 0.0     # summed time to response headers
+    max_latency_seconds: float = 0.0
+
+    @property
+    def mean_latency_ms(self) -> float:
+        return self.latency_seconds / self.requests * 1000 if self.requests else 0.0
+
+
+_stats: dict[str, HostStats] = {}
+_stats_lock = threading.Lock()
+
+
+def _record(host: str, **deltas):
+    with _stats_lock:
+        s = _stats.setdefault(host, HostStats())
+        latency = deltas.pop("latency", None)
+        if latency is not None:
+            s.requests += 1
+            s.latency_seconds += latency
+            s.max_latency_seconds = max(s.max_latency_seconds, latency)
+        for name, value in deltas.items():
+            setattr(s, name, getattr(s, name) + value)
+
+
+class _CountingStream(httpx.SyncByteStream):
+    """Response body stream that counts bytes as the caller reads them."""
+
+    def __init__(self, stream, host: str):
+        self._stream = stream
+        self._host = host
+
+    def __iter__(self):
+        for chunk in self._stream:
+            _record(self._host, bytes_received=len(chunk))
+            yield chunk
+
+    def close(self):
+        self._stream.close()
+
+
+class _MeteredTransport(httpx.BaseTransport):
+    """Wraps the pooled HTTPTransport to feed the per-host metrics."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        sent = int(request.headers.get("Content-Length") or 0)
+        start = time.perf_counter()
+        try:
+            response = self._transport.handle_request(request)
+        except httpx.TransportError:
+            _record(host, errors=1, bytes_sent=sent)
+            raise
+        _record(host, latency=time.perf_counter() - start, bytes_sent=sent)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_CountingStream(response.stream, host),
+            extensions=response.extensions,
+        )
+
+    def close(self):
+        self._transport.close()
+
+
+def new_client(host: str, transport: Optional[httpx.BaseTransport] = None) -> httpx.Client:
+    """A metered, pooled client tuned for `host` (use client_for to share one)."""
+    limit = HOST_LIMITS.get(host, DEFAULT_HOST_LIMIT)
+    transport = transport or httpx.HTTPTransport(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit,
+                            keepalive_expiry=KEEPALIVE_EXPIRY),
+    )
+    return httpx.Client(
+        transport=_MeteredTransport(transport),
+        timeout=HOST_TIMEOUTS.get(host, DEFAULT_TIMEOUT),
+        follow_redirects=True,
+    )
+
+
+_clients: dict[str, httpx.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def client_for(host: str) -> httpx.Client:
+    """The process-wide pooled client for `host`, created on first use. Thread-safe."""
+    with _clients_lock:
+        client = _clients.get(host)
+        if client is None or client.is_closed:
+            client = _clients[host] = new_client(host)
+        return client
+
+
+def close_all():
+    """Close every shared client (runs at interpreter exit)."""
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+
+atexit.register(close_all)
+
+
+def stats() -> dict[str, dict]:
+    """{host: HostStats fields + mean_latency_ms} for this process."""
+    with _stats_lock:
+        return {host: {**asdict(s), "mean_latency_ms": s.mean_latency_ms} for host, s in _stats.items()}
+
+
+def reset_stats():
+    with _stats_lock:
+        _stats.clear()
+
+
+def format_stats() -> str:
+    lines = [f"{'HOST':<22} {'REQS':>6} {'ERR':>4} {'MEAN ms':>8} {'MAX ms':>8} {'SENT KiB':>9} {'RECV KiB':>9}"]
+    for host, s in sorted(stats().items()):
+        lines.append(
+            f"{host:<22} {s['requests']:>6} {s['errors']:>4} {s['mean_latency_ms']:>8.0f} "
+            f"{s['max_latency_seconds'] * 1000:>8.0f} {s['bytes_sent'] / 1024:>9.1f} {s['bytes_received'] / 1024:>9.1f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,243 @@
+"""
+VantaStonk — Adaptive rate limiter for outbound API calls
+
+One limiter instance is shared by every SchwabClient (and AsyncSchwabClient)
+so fan-out code can't exceed the account's request budget:
+
+- Token bucket: refills at rate_per_minute, bursts up to `burst`.
+- Concurrency slots (AIMD): start at initial_concurrency, +1 after every
+  `increase_after` clean responses, halved on each 429. The level the run
+  settles at is the learned safe concurrency.
+- 429 handling: honour Retry-After (seconds or HTTP date) when present,
+  otherwise exponential backoff with full jitter. The whole limiter pauses
+  so other workers back off too.
+
+Counters (requests, throttled responses, retries, time spent waiting) are
+available from stats().
+"""
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Schwab Trader API documented budget: 120 requests per minute per app
+DEFAULT_REQUESTS_PER_MINUTE = 120
+
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0    # seconds
+BACKOFF_CAP = 30.0    # seconds
+
+
+@dataclass
+class ThrottleStats:
+    requests: int = 0            # calls sent (including retries)
+    throttled: int = 0           # 429 responses received
+    retries: int = 0             # calls re-sent after a 429
+    token_wait_seconds: float = 0.0    # time spent waiting for the token bucket
+    slot_wait_seconds: float = 0.0     # time spent waiting for a concurrency slot
+    backoff_seconds: float = 0.0       # time spent sleeping after 429s
+    concurrency: int = 0         # current learned concurrency level
+    peak_concurrency: int = 0
+
+
+def parse_retry_after(value: Optional[str], now: Optional[datetime] = None) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds, or None."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (when - now).total_seconds())
+
+
+class AdaptiveRateLimiter:
+    """Thread-safe token bucket + AIMD concurrency limiter with 429 backoff."""
+
+    def __init__(
+        self,
+        rate_per_minute: int = DEFAULT_REQUESTS_PER_MINUTE,
+        burst: Optional[int] = None,
+        initial_concurrency: int = 4,
+        max_concurrency: int = 16,
+        increase_after: int = 20,
+        max_retries: int = MAX_RETRIES,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self._rate = rate_per_minute / 60.0          # tokens per second
+        self._capacity = float(burst or max(1, rate_per_minute // 6))
+        self._tokens = self._capacity
+        self._last_refill = clock()
+        self._paused_until = 0.0
+
+        self._max_concurrency = max(1, max_concurrency)
+        self._concurrency = max(1, min(initial_concurrency, self._max_concurrency))
+        self._increase_after = increase_after
+        self._clean_streak = 0
+        self._in_flight = 0
+
+        self._max_retries = max_retries
+        self._clock = clock
+        self._sleep = sleep
+        self._cond = threading.Condition()
+        self._stats = ThrottleStats(concurrency=self._concurrency,
+                                    peak_concurrency=self._concurrency)
+
+    # --- Token bucket ---
+
+    def _reserve_token(self) -> float:
+        """Take one token (possibly going into debt). Returns seconds to wait before using it."""
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._rate)
+        self._last_refill = now
+        self._tokens -= 1.0
+        wait = 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+        return max(wait, self._paused_until - now)
+
+    # --- Concurrency slots ---
+
+    def _try_take_slot(self) -> bool:
+        if self._in_flight < self._concurrency:
+            self._in_flight += 1
+            return True
+        return False
+
+    def acquire(self):
+        """Block until a concurrency slot and a token are available."""
+        start = self._clock()
+        with self._cond:
+            while not self._try_take_slot():
+                self._cond.wait()
+            slot_waited = self._clock() - start
+            wait = self._reserve_token()
+            self._stats.slot_wait_seconds += slot_waited
+            self._stats.token_wait_seconds += wait
+        if wait > 0:
+            self._sleep(wait)
+
+    async def acquire_async(self):
+        """asyncio version of acquire(); never blocks the event loop."""
+        start = self._clock()
+        while True:
+            with self._cond:
+                if self._try_take_slot():
+                    self._stats.slot_wait_seconds += self._clock() - start
+                    wait = self._reserve_token()
+                    self._stats.token_wait_seconds += wait
+                    break
+            await asyncio.sleep(0.01)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def release(self, throttled: bool = False, retry_after: Optional[float] = None):
+        """Return a slot and feed the response outcome into the AIMD controller."""
+        with self._cond:
+            self._in_flight -= 1
+            self._stats.requests += 1
+            if throttled:
+                self._stats.throttled += 1
+                self._clean_streak = 0
+                self._concurrency = max(1, self._concurrency // 2)
+                self._tokens = min(self._tokens, 0.0)
+                if retry_after:
+                    self._paused_until = max(self._paused_until, self._clock() + retry_after)
+            else:
+                self._clean_streak += 1
+                if self._clean_streak >= self._increase_after and self._concurrency < self._max_concurrency:
+                    self._concurrency += 1
+                    self._clean_streak = 0
+            self._stats.concurrency = self._concurrency
+            self._stats.peak_concurrency = max(self._stats.peak_concurrency, self._concurrency)
+            self._cond.notify_all()
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[float]) -> float:
+        """Delay before retry `attempt` (0-based): Retry-After if given, else capped full-jitter exponential."""
+        if retry_after is not None:
+            return retry_after + random.uniform(0, BACKOFF_BASE)
+        return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+    # --- Call wrappers ---
+
+    def call(self, fn, *args, **kwargs):
+        """
+        Call fn(*args, **kwargs) (an HTTP request returning a response with
+        status_code/headers) under the limiter, retrying 429s. Returns the
+        final response; a 429 after max_retries is returned as-is.
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                resp = fn(*args, **kwargs)
+            except BaseException:
+                self.release()
+                raise
+            retry_after = self._retry_after(resp)
+            throttled = getattr(resp, "status_code", None) == 429
+            self.release(throttled=throttled, retry_after=retry_after)
+            if not throttled or attempt >= self._max_retries:
+                return resp
+            delay = self.backoff_delay(attempt, retry_after)
+            self._record_retry(delay)
+            self._sleep(delay)
+            attempt += 1
+
+    async def call_async(self, fn, *args, **kwargs):
+        """asyncio version of call() for coroutine functions."""
+        attempt = 0
+        while True:
+            await self.acquire_async()
+            try:
+                resp = await fn(*args, **kwargs)
+            except BaseException:
+                self.release()
+                raise
+            retry_after = self._retry_after(resp)
+            throttled = getattr(resp, "status_code", None) == 429
+            self.release(throttled=throttled, retry_after=retry_after)
+            if not throttled or attempt >= self._max_retries:
+                return resp
+            delay = self.backoff_delay(attempt, retry_after)
+            self._record_retry(delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @staticmethod
+    def _retry_after(resp) -> Optional[float]:
+        headers = getattr(resp, "headers", None) or {}
+        return parse_retry_after(headers.get("Retry-After"))
+
+    def _record_retry(self, delay: float):
+        with self._cond:
+            self._stats.retries += 1
+            self._stats.backoff_seconds += delay
+
+    # --- Introspection ---
+
+    @property
+    def concurrency(self) -> int:
+        return self._concurrency
+
+    def stats(self) -> dict:
+        """Snapshot of the throttle counters."""
+        with self._cond:
+            return asdict(self._stats)
+
+    def format_stats(self) -> str:
+        s = self.stats()
+        return (f"{s['requests']} requests, {s['throttled']} throttled, {s['retries']} retries, "
+                f"waited {s['token_wait_seconds'] + s['slot_wait_seconds']:.1f}s, "
+                f"backoff {s['backoff_seconds']:.1f}s, concurrency {s['concurrency']} "
+                f"(peak {s['peak_concurrency']})")
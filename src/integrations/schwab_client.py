@@ -5,12 +5,21 @@ Wraps schwab-py for:
 - OAuth2 authentication + token management
 - Account positions
 - Price quotes (single + batch)
-- Price history (5-day lookback for chasing filter)
+- Price history (5-day lookback for chasing filter, single + bulk)
 - Recent orders (for trade journal)
+
+Every request goes through the shared SCHWAB_LIMITER (token bucket +
+adaptive concurrency + 429/Retry-After backoff, see rate_limit.py).
+
+SchwabClient is the blocking client used by the scripts. AsyncSchwabClient
+exposes the same methods as coroutines on schwab-py's async client, so a
+scan can overlap Schwab calls with other I/O on one event loop.
 """
 
 import os
 import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -19,6 +28,8 @@ from typing import Optional
 from dotenv import load_dotenv
 from schwab import auth, client as schwab_client
 
+from src.integrations.rate_limit import AdaptiveRateLimiter, DEFAULT_REQUESTS_PER_MINUTE
+
 load_dotenv()
 
 # --- Config from .env ---
@@ -28,6 +39,17 @@ APP_SECRET = os.getenv("SCHWAB_APP_SECRET", "")
 CALLBACK_URL = os.getenv("SCHWAB_CALLBACK_URL", "https://127.0.0.1:8182/")
 TOKEN_PATH = os.getenv("SCHWAB_TOKEN_PATH", "data/schwab_token.json")
 
+# Worker pool size for fan-out calls (bulk price history, chunked quotes)
+MAX_WORKERS = int(os.getenv("SCHWAB_MAX_WORKERS", "8"))
+# Max symbols per get_quotes request; larger lists are split into chunks
+QUOTES_CHUNK_SIZE = int(os.getenv("SCHWAB_QUOTES_CHUNK_SIZE", "500"))
+
+# One limiter shared by every client instance, sync and async
+SCHWAB_LIMITER = AdaptiveRateLimiter(
+    rate_per_minute=int(os.getenv("SCHWAB_REQUESTS_PER_MINUTE", str(DEFAULT_REQUESTS_PER_MINUTE))),
+    max_concurrency=MAX_WORKERS * 2,
+)
+
 
 @dataclass
 class Position:
@@ -68,12 +90,158 @@ class PriceBar:
     volume: int
 
 
+# --- Response parsing (shared by the sync and async clients) ---
+
+def _parse_positions(data: dict) -> list[Position]:
+    """Build Positions from a get_account(fields=POSITIONS) payload."""
+    positions = []
+    for pos in data.get("securitiesAccount", {}).get("positions", []):
+        instrument = pos.get("instrument", {})
+        ticker = instrument.get("symbol", "???")
+
+        quantity = pos.get("longQuantity", 0) - pos.get("shortQuantity", 0)
+        avg_price = pos.get("averagePrice", 0)
+        market_value = pos.get("marketValue", 0)
+        current_price = pos.get("currentDayProfitLossPercentage", 0)  # fallback
+        day_pnl = pos.get("currentDayProfitLoss", 0)
+
+        # Calculate current price from market value and quantity
+        if quantity != 0:
+            current_price = market_value / quantity
+
+        total_pnl = market_value - (avg_price * quantity)
+        total_pnl_pct = (total_pnl / (avg_price * quantity) * 100) if avg_price * quantity != 0 else 0
+
+        positions.append(Position(
+            ticker=ticker,
+            quantity=quantity,
+            avg_price=round(avg_price, 2),
+            market_value=round(market_value, 2),
+            current_price=round(current_price, 2),
+            day_pnl=round(day_pnl, 2),
+            total_pnl=round(total_pnl, 2),
+            total_pnl_pct=round(total_pnl_pct, 2),
+        ))
+
+    return positions
+
+
+def _parse_quote(ticker: str, data: dict) -> Optional[Quote]:
+    """Build a Quote for `ticker` from a get_quote/get_quotes payload."""
+    quote_data = data.get(ticker, {}).get("quote", {})
+    if not quote_data:
+        return None
+
+    return Quote(
+        ticker=ticker,
+        last_price=quote_data.get("lastPrice", 0),
+        open_price=quote_data.get("openPrice", 0),
+        high_price=quote_data.get("highPrice", 0),
+        low_price=quote_data.get("lowPrice", 0),
+        close_price=quote_data.get("closePrice", 0),
+        volume=quote_data.get("totalVolume", 0),
+        bid_price=quote_data.get("bidPrice", 0),
+        ask_price=quote_data.get("askPrice", 0),
+    )
+
+
+def _parse_quotes(tickers: list[str], data: dict) -> dict[str, Quote]:
+    quotes = {}
+    for ticker in tickers:
+        quote = _parse_quote(ticker, data)
+        if quote:
+            quotes[ticker] = quote
+    return quotes
+
+
+def _parse_candles(data: dict) -> list[PriceBar]:
+    bars = []
+    for candle in data.get("candles", []):
+        # Schwab returns epoch milliseconds
+        dt = datetime.fromtimestamp(candle["datetime"] / 1000)
+        bars.append(PriceBar(
+            date=dt.strftime("%Y-%m-%d"),
+            open=candle.get("open", 0),
+            high=candle.get("high", 0),
+            low=candle.get("low", 0),
+            close=candle.get("close", 0),
+            volume=candle.get("volume", 0),
+        ))
+    return bars
+
+
+def _parse_account_summary(data: dict) -> dict:
+    balances = data.get("securitiesAccount", {}).get("currentBalances", {})
+    return {
+        "account_value": balances.get("liquidationValue", 0),
+        "cash_available": balances.get("cashBalance", 0),
+        "buying_power": balances.get("buyingPower", 0),
+        "day_pnl": balances.get("currentDayProfitLoss", 0) if "currentDayProfitLoss" in balances else None,
+    }
+
+
+def _client_from_token_file(use_asyncio: bool):
+    """Load a schwab-py client (sync or async) from the token file, or None on failure."""
+    if not APP_KEY or not APP_SECRET:
+        print("ERROR: Set SCHWAB_APP_KEY and SCHWAB_APP_SECRET in .env")
+        return None
+
+    token_path = Path(TOKEN_PATH)
+    if not token_path.exists():
+        print("ERROR: No token file found. Run 'python scripts/schwab_login.py' first.")
+        return None
+
+    try:
+        client = auth.client_from_token_file(
+            token_path=str(token_path),
+            api_key=APP_KEY,
+            app_secret=APP_SECRET,
+            asyncio=use_asyncio,
+        )
+        print("Schwab API connected.")
+        return client
+    except Exception as e:
+        print(f"Schwab connection failed: {e}")
+        return None
+
+
+def _chunks(items: list, size: int) -> list[list]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def prices_5d_from_bars(bars: list[PriceBar]) -> tuple[Optional[float], Optional[float]]:
+    """
+    Derive (current_price, price_5d_ago) from daily bars for the chasing filter.
+
+    Returns (None, None) if there are no bars.
+    """
+    if not bars:
+        return None, None
+
+    current_price = bars[-1].close
+    # 5 trading days back (or as far back as we have)
+    idx = max(0, len(bars) - 6)
+    price_5d_ago = bars[idx].close
+
+    return current_price, price_5d_ago
+
+
 class SchwabClient:
     """VantaStonk's interface to the Schwab API."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        quotes_chunk_size: int = QUOTES_CHUNK_SIZE,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+    ):
         self._client = None
         self._account_hash = None
+        self.limiter = limiter or SCHWAB_LIMITER
+        self._max_workers = max(1, max_workers)
+        self._quotes_chunk_size = max(1, quotes_chunk_size)
+        # Symbols from get_quotes chunks that failed on the last call → error
+        self.last_quote_errors: dict[str, Exception] = {}
 
     def connect(self) -> bool:
         """
@@ -82,33 +250,40 @@ class SchwabClient:
         Loads token from file (created by scripts/schwab_login.py).
         Auto-refreshes the access token as needed.
         """
-        if not APP_KEY or not APP_SECRET:
-            print("ERROR: Set SCHWAB_APP_KEY and SCHWAB_APP_SECRET in .env")
-            return False
-
-        token_path = Path(TOKEN_PATH)
-        if not token_path.exists():
-            print("ERROR: No token file found. Run 'python scripts/schwab_login.py' first.")
-            return False
-
-        try:
-            self._client = auth.client_from_token_file(
-                token_path=str(token_path),
-                api_key=APP_KEY,
-                app_secret=APP_SECRET,
-            )
-            print("Schwab API connected.")
-            return True
-        except Exception as e:
-            print(f"Schwab connection failed: {e}")
-            return False
+        self._client = _client_from_token_file(use_asyncio=False)
+        return self._client is not None
+
+    def _request(self, fn, *args, **kwargs):
+        """Send one schwab-py request through the shared rate limiter; raise on HTTP error."""
+        resp = self.limiter.call(fn, *args, **kwargs)
+        resp.raise_for_status()
+        return resp
+
+    def _fan_out(self, fn, items: list) -> list[tuple]:
+        """
+        Run fn over items on a bounded worker pool.
+
+        Returns [(result, error), ...] in item order; exactly one of the
+        pair is None. Exceptions are captured, never raised.
+        """
+        def call(item):
+            try:
+                return fn(item), None
+            except Exception as e:
+                return None, e
+
+        if len(items) <= 1:
+            return [call(item) for item in items]
+        workers = min(self._max_workers, len(items))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # pool.map yields in submission order
+            return list(pool.map(call, items))
 
     def _ensure_account_hash(self):
         """Fetch and cache the account hash (required for all account operations)."""
         if self._account_hash:
             return
-        resp = self._client.get_account_numbers()
-        resp.raise_for_status()
+        resp = self._request(self._client.get_account_numbers)
         accounts = resp.json()
         if not accounts:
             raise RuntimeError("No accounts found on this Schwab login")
@@ -120,89 +295,50 @@ class SchwabClient:
     def get_positions(self) -> list[Position]:
         """Get all current positions."""
         self._ensure_account_hash()
-        resp = self._client.get_account(
+        resp = self._request(
+            self._client.get_account,
             self._account_hash,
             fields=schwab_client.Client.Account.Fields.POSITIONS,
         )
-        resp.raise_for_status()
-        data = resp.json()
-
-        positions = []
-        for pos in data.get("securitiesAccount", {}).get("positions", []):
-            instrument = pos.get("instrument", {})
-            ticker = instrument.get("symbol", "???")
-
-            quantity = pos.get("longQuantity", 0) - pos.get("shortQuantity", 0)
-            avg_price = pos.get("averagePrice", 0)
-            market_value = pos.get("marketValue", 0)
-            current_price = pos.get("currentDayProfitLossPercentage", 0)  # fallback
-            day_pnl = pos.get("currentDayProfitLoss", 0)
-
-            # Calculate current price from market value and quantity
-            if quantity != 0:
-                current_price = market_value / quantity
-
-            total_pnl = market_value - (avg_price * quantity)
-            total_pnl_pct = (total_pnl / (avg_price * quantity) * 100) if avg_price * quantity != 0 else 0
-
-            positions.append(Position(
-                ticker=ticker,
-                quantity=quantity,
-                avg_price=round(avg_price, 2),
-                market_value=round(market_value, 2),
-                current_price=round(current_price, 2),
-                day_pnl=round(day_pnl, 2),
-                total_pnl=round(total_pnl, 2),
-                total_pnl_pct=round(total_pnl_pct, 2),
-            ))
-
-        return positions
+        return _parse_positions(resp.json())
 
     # --- Quotes ---
 
     def get_quote(self, ticker: str) -> Optional[Quote]:
         """Get a single price quote."""
-        resp = self._client.get_quote(ticker)
-        resp.raise_for_status()
-        data = resp.json()
-
-        quote_data = data.get(ticker, {}).get("quote", {})
-        if not quote_data:
-            return None
+        resp = self._request(self._client.get_quote, ticker)
+        return _parse_quote(ticker, resp.json())
 
-        return Quote(
-            ticker=ticker,
-            last_price=quote_data.get("lastPrice", 0),
-            open_price=quote_data.get("openPrice", 0),
-            high_price=quote_data.get("highPrice", 0),
-            low_price=quote_data.get("lowPrice", 0),
-            close_price=quote_data.get("closePrice", 0),
-            volume=quote_data.get("totalVolume", 0),
-            bid_price=quote_data.get("bidPrice", 0),
-            ask_price=quote_data.get("askPrice", 0),
-        )
+    def has_quote(self, ticker: str) -> bool:
+        """True if Schwab returns a quote for the symbol (ticker validation)."""
+        return ticker in self.get_quotes([ticker])
 
     def get_quotes(self, tickers: list[str]) -> dict[str, Quote]:
-        """Get batch quotes for multiple tickers."""
-        resp = self._client.get_quotes(tickers)
-        resp.raise_for_status()
-        data = resp.json()
-
-        quotes = {}
-        for ticker in tickers:
-            quote_data = data.get(ticker, {}).get("quote", {})
-            if quote_data:
-                quotes[ticker] = Quote(
-                    ticker=ticker,
-                    last_price=quote_data.get("lastPrice", 0),
-                    open_price=quote_data.get("openPrice", 0),
-                    high_price=quote_data.get("highPrice", 0),
-                    low_price=quote_data.get("lowPrice", 0),
-                    close_price=quote_data.get("closePrice", 0),
-                    volume=quote_data.get("totalVolume", 0),
-                    bid_price=quote_data.get("bidPrice", 0),
-                    ask_price=quote_data.get("askPrice", 0),
-                )
+        """
+        Get batch quotes for multiple tickers.
+
+        Lists longer than quotes_chunk_size are split into chunks that are
+        requested concurrently, asking only for the quote block. A failed
+        chunk does not discard the others: its symbols are left out of the
+        result and recorded in last_quote_errors.
+        """
+        def fetch(chunk: list[str]) -> dict[str, Quote]:
+            resp = self._request(
+                self._client.get_quotes,
+                chunk, fields=[schwab_client.Client.Quote.Fields.QUOTE],
+            )
+            return _parse_quotes(chunk, resp.json())
+
+        chunks = _chunks(list(dict.fromkeys(tickers)), self._quotes_chunk_size)
+        quotes: dict[str, Quote] = {}
+        errors: dict[str, Exception] = {}
+        for chunk, (result, err) in zip(chunks, self._fan_out(fetch, chunks)):
+            if err is not None:
+                print(f"  Quote chunk failed ({len(chunk)} symbols): {err}")
+                errors.update({sym: err for sym in chunk})
+            else:
+                quotes.update(result)
+        self.last_quote_errors = errors
         return quotes
 
     # --- Price History ---
@@ -224,34 +360,19 @@ class SchwabClient:
         start_dt = datetime.now() - timedelta(days=days)
 
         if frequency == "daily":
-            resp = self._client.get_price_history_every_day(
+            resp = self._request(
+                self._client.get_price_history_every_day,
                 ticker,
                 start_datetime=start_dt,
                 need_previous_close=True,
             )
         else:
-            resp = self._client.get_price_history_every_minute(
+            resp = self._request(
+                self._client.get_price_history_every_minute,
                 ticker,
                 start_datetime=start_dt,
             )
-
-        resp.raise_for_status()
-        data = resp.json()
-
-        bars = []
-        for candle in data.get("candles", []):
-            # Schwab returns epoch milliseconds
-            dt = datetime.fromtimestamp(candle["datetime"] / 1000)
-            bars.append(PriceBar(
-                date=dt.strftime("%Y-%m-%d"),
-                open=candle.get("open", 0),
-                high=candle.get("high", 0),
-                low=candle.get("low", 0),
-                close=candle.get("close", 0),
-                volume=candle.get("volume", 0),
-            ))
-
-        return bars
+        return _parse_candles(resp.json())
 
     def get_5day_prices(self, ticker: str) -> tuple[Optional[float], Optional[float]]:
         """
@@ -260,15 +381,37 @@ class SchwabClient:
         Returns (current_price, price_5d_ago) for the chasing filter.
         """
         bars = self.get_price_history(ticker, days=10, frequency="daily")
-        if not bars:
-            return None, None
+        return prices_5d_from_bars(bars)
+
+    def get_price_history_bulk(
+        self,
+        tickers: list[str],
+        days: int = 10,
+        frequency: str = "daily",
+    ) -> tuple[dict[str, list[PriceBar]], dict[str, Exception]]:
+        """
+        Get OHLCV price history for many tickers concurrently.
+
+        Requests fan out over a bounded worker pool (max_workers). A failure
+        for one ticker never aborts the batch.
+
+        Returns (bars_by_ticker, errors_by_ticker). bars_by_ticker preserves
+        the order of `tickers`; tickers that failed appear only in errors.
+        """
+        unique = list(dict.fromkeys(tickers))
+        bars_by_ticker: dict[str, list[PriceBar]] = {}
+        errors: dict[str, Exception] = {}
+
+        def fetch(ticker: str) -> list[PriceBar]:
+            return self.get_price_history(ticker, days=days, frequency=frequency)
 
-        current_price = bars[-1].close
-        # 5 trading days back (or as far back as we have)
-        idx = max(0, len(bars) - 6)
-        price_5d_ago = bars[idx].close
+        for ticker, (bars, err) in zip(unique, self._fan_out(fetch, unique)):
+            if err is not None:
+                errors[ticker] = err
+            else:
+                bars_by_ticker[ticker] = bars
 
-        return current_price, price_5d_ago
+        return bars_by_ticker, errors
 
     # --- Orders ---
 
@@ -278,12 +421,12 @@ class SchwabClient:
         from_dt = datetime.now() - timedelta(days=days)
         to_dt = datetime.now()
 
-        resp = self._client.get_orders_for_account(
+        resp = self._request(
+            self._client.get_orders_for_account,
             self._account_hash,
             from_entered_datetime=from_dt,
             to_entered_datetime=to_dt,
         )
-        resp.raise_for_status()
         return resp.json()
 
     # --- Account Summary ---
@@ -291,14 +434,192 @@ class SchwabClient:
     def get_account_summary(self) -> dict:
         """Get account balances and summary info."""
         self._ensure_account_hash()
-        resp = self._client.get_account(self._account_hash)
+        resp = self._request(self._client.get_account, self._account_hash)
+        return _parse_account_summary(resp.json())
+
+
+class AsyncSchwabClient:
+    """
+    Asyncio-native twin of SchwabClient.
+
+    Same methods and dataclass outputs, but every call is a coroutine backed
+    by schwab-py's async client. Usage:
+
+        client = AsyncSchwabClient()
+        if client.connect():
+            quotes, positions = await asyncio.gather(
+                client.get_quotes(tickers), client.get_positions(),
+            )
+            await client.aclose()
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_WORKERS,
+        quotes_chunk_size: int = QUOTES_CHUNK_SIZE,
+        limiter: Optional[AdaptiveRateLimiter] = None,
+    ):
+        self._client = None
+        self._account_hash = None
+        self.limiter = limiter or SCHWAB_LIMITER
+        self._account_lock = asyncio.Lock()
+        self._max_concurrency = max(1, max_concurrency)
+        self._quotes_chunk_size = max(1, quotes_chunk_size)
+        self.last_quote_errors: dict[str, Exception] = {}
+
+    def connect(self) -> bool:
+        """Load the token file and build schwab-py's async client."""
+        self._client = _client_from_token_file(use_asyncio=True)
+        return self._client is not None
+
+    async def aclose(self):
+        """Close the underlying async HTTP session."""
+        if self._client is not None:
+            await self._client.close_async_session()
+
+    async def _request(self, fn, *args, **kwargs):
+        """Send one schwab-py request through the shared rate limiter; raise on HTTP error."""
+        resp = await self.limiter.call_async(fn, *args, **kwargs)
         resp.raise_for_status()
-        data = resp.json()
-
-        balances = data.get("securitiesAccount", {}).get("currentBalances", {})
-        return {
-            "account_value": balances.get("liquidationValue", 0),
-            "cash_available": balances.get("cashBalance", 0),
-            "buying_power": balances.get("buyingPower", 0),
-            "day_pnl": balances.get("currentDayProfitLoss", 0) if "currentDayProfitLoss" in balances else None,
-        }
+        return resp
+
+    async def _ensure_account_hash(self):
+        """Fetch and cache the account hash; concurrent callers share one lookup."""
+        async with self._account_lock:
+            if self._account_hash:
+                return
+            resp = await self._request(self._client.get_account_numbers)
+            accounts = resp.json()
+            if not accounts:
+                raise RuntimeError("No accounts found on this Schwab login")
+            # Use the first account
+            self._account_hash = accounts[0]["hashValue"]
+
+    # --- Positions ---
+
+    async def get_positions(self) -> list[Position]:
+        """Get all current positions."""
+        await self._ensure_account_hash()
+        resp = await self._request(
+            self._client.get_account,
+            self._account_hash,
+            fields=schwab_client.Client.Account.Fields.POSITIONS,
+        )
+        return _parse_positions(resp.json())
+
+    # --- Quotes ---
+
+    async def get_quote(self, ticker: str) -> Optional[Quote]:
+        """Get a single price quote."""
+        resp = await self._request(self._client.get_quote, ticker)
+        return _parse_quote(ticker, resp.json())
+
+    async def get_quotes(self, tickers: list[str]) -> dict[str, Quote]:
+        """Get batch quotes, chunked and gathered. See SchwabClient.get_quotes."""
+        sem = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch(chunk: list[str]) -> dict[str, Quote]:
+            async with sem:
+                resp = await self._request(
+                    self._client.get_quotes,
+                    chunk, fields=[schwab_client.Client.Quote.Fields.QUOTE],
+                )
+            return _parse_quotes(chunk, resp.json())
+
+        chunks = _chunks(list(dict.fromkeys(tickers)), self._quotes_chunk_size)
+        results = await asyncio.gather(*(fetch(c) for c in chunks), return_exceptions=True)
+
+        quotes: dict[str, Quote] = {}
+        errors: dict[str, Exception] = {}
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, Exception):
+                print(f"  Quote chunk failed ({len(chunk)} symbols): {result}")
+                errors.update({sym: result for sym in chunk})
+            else:
+                quotes.update(result)
+        self.last_quote_errors = errors
+        return quotes
+
+    # --- Price History ---
+
+    async def get_price_history(
+        self,
+        ticker: str,
+        days: int = 10,
+        frequency: str = "daily",
+    ) -> list[PriceBar]:
+        """Get OHLCV price history. See SchwabClient.get_price_history."""
+        start_dt = datetime.now() - timedelta(days=days)
+
+        if frequency == "daily":
+            resp = await self._request(
+                self._client.get_price_history_every_day,
+                ticker,
+                start_datetime=start_dt,
+                need_previous_close=True,
+            )
+        else:
+            resp = await self._request(
+                self._client.get_price_history_every_minute,
+                ticker,
+                start_datetime=start_dt,
+            )
+        return _parse_candles(resp.json())
+
+    async def get_5day_prices(self, ticker: str) -> tuple[Optional[float], Optional[float]]:
+        """Get (current_price, price_5d_ago) for the chasing filter."""
+        bars = await self.get_price_history(ticker, days=10, frequency="daily")
+        return prices_5d_from_bars(bars)
+
+    async def get_price_history_bulk(
+        self,
+        tickers: list[str],
+        days: int = 10,
+        frequency: str = "daily",
+    ) -> tuple[dict[str, list[PriceBar]], dict[str, Exception]]:
+        """
+        Get price history for many tickers concurrently, at most
+        max_concurrency requests in flight. Same return shape as
+        SchwabClient.get_price_history_bulk.
+        """
+        unique = list(dict.fromkeys(tickers))
+        sem = asyncio.Semaphore(self._max_concurrency)
+
+        async def fetch(ticker: str):
+            async with sem:
+                return await self.get_price_history(ticker, days=days, frequency=frequency)
+
+        results = await asyncio.gather(*(fetch(t) for t in unique), return_exceptions=True)
+
+        bars_by_ticker: dict[str, list[PriceBar]] = {}
+        errors: dict[str, Exception] = {}
+        for ticker, result in zip(unique, results):
+            if isinstance(result, Exception):
+                errors[ticker] = result
+            else:
+                bars_by_ticker[ticker] = result
+        return bars_by_ticker, errors
+
+    # --- Orders ---
+
+    async def get_recent_orders(self, days: int = 7) -> list[dict]:
+        """Get recent orders for trade journal logging."""
+        await self._ensure_account_hash()
+        from_dt = datetime.now() - timedelta(days=days)
+        to_dt = datetime.now()
+
+        resp = await self._request(
+            self._client.get_orders_for_account,
+            self._account_hash,
+            from_entered_datetime=from_dt,
+            to_entered_datetime=to_dt,
+        )
+        return resp.json()
+
+    # --- Account Summary ---
+
+    async def get_account_summary(self) -> dict:
+        """Get account balances and summary info."""
+        await self._ensure_account_hash()
+        resp = await self._request(self._client.get_account, self._account_hash)
+        return _parse_account_summary(resp.json())
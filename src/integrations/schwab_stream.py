@@ -0,0 +1,260 @@
+"""
+VantaStonk — Streaming Level-1 equity quotes
+
+Subscribes to Schwab's LEVELONE_EQUITIES stream (via schwab-py's
+StreamClient) and keeps an in-memory table of the latest Quote per symbol.
+Other components read the table instead of making REST quote calls.
+
+Level-1 messages are deltas: each update carries only the fields that
+changed, so QuoteTable merges them into the previous Quote.
+
+ReplayStreamClient is a local stand-in for StreamClient that replays
+recorded messages (JSONL, one handler payload per line, as written by
+QuoteStreamer(record_path=...)). It lets the streaming path be tested and
+benchmarked offline.
+"""
+
+import asyncio
+import json
+import threading
+import time
+from dataclasses import replace
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from schwab.streaming import StreamClient
+
+from src.integrations.schwab_client import Quote, SchwabClient
+
+LEVEL_ONE_SERVICE = "LEVELONE_EQUITIES"
+
+# Stream field name → Quote attribute
+_FIELD_MAP = {
+    "LAST_PRICE": "last_price",
+    "OPEN_PRICE": "open_price",
+    "HIGH_PRICE": "high_price",
+    "LOW_PRICE": "low_price",
+    "CLOSE_PRICE": "close_price",
+    "TOTAL_VOLUME": "volume",
+    "BID_PRICE": "bid_price",
+    "ASK_PRICE": "ask_price",
+}
+
+LEVEL_ONE_FIELDS = [
+    StreamClient.LevelOneEquityFields.SYMBOL,
+    StreamClient.LevelOneEquityFields.BID_PRICE,
+    StreamClient.LevelOneEquityFields.ASK_PRICE,
+    StreamClient.LevelOneEquityFields.LAST_PRICE,
+    StreamClient.LevelOneEquityFields.TOTAL_VOLUME,
+    StreamClient.LevelOneEquityFields.HIGH_PRICE,
+    StreamClient.LevelOneEquityFields.LOW_PRICE,
+    StreamClient.LevelOneEquityFields.CLOSE_PRICE,
+    StreamClient.LevelOneEquityFields.OPEN_PRICE,
+    StreamClient.LevelOneEquityFields.QUOTE_TIME_MILLIS,
+]
+
+
+def streaming_symbols(*groups: list[str]) -> list[str]:
+    """Union of symbol groups (e.g. Core, Feeder, positions), uppercased, first-seen order."""
+    out: dict[str, None] = {}
+    for group in groups:
+        for sym in group:
+            sym = sym.strip().upper()
+            if sym:
+                out[sym] = None
+    return list(out)
+
+
+class QuoteTable:
+    """Thread-safe latest-Quote table fed by Level-1 stream messages."""
+
+    def __init__(self):
+        self._quotes: dict[str, Quote] = {}
+        self._lock = threading.Lock()
+        self.updates = 0
+
+    def apply_message(self, msg: dict):
+        """Merge one LEVELONE_EQUITIES handler payload into the table."""
+        ts = msg.get("timestamp")
+        with self._lock:
+            for row in msg.get("content", []):
+                sym = row.get("key") or row.get("SYMBOL")
+                if not sym:
+                    continue
+                changes = {attr: row[field] for field, attr in _FIELD_MAP.items() if field in row}
+                millis = row.get("QUOTE_TIME_MILLIS", ts)
+                if millis is not None:
+                    changes["timestamp"] = datetime.fromtimestamp(millis / 1000).isoformat(timespec="seconds")
+                prev = self._quotes.get(sym)
+                if prev is None:
+                    prev = Quote(ticker=sym, last_price=0, open_price=0, high_price=0, low_price=0,
+                                 close_price=0, volume=0, bid_price=0, ask_price=0)
+                self._quotes[sym] = replace(prev, **changes)
+                self.updates += 1
+
+    def get(self, ticker: str) -> Optional[Quote]:
+        with self._lock:
+            return self._quotes.get(ticker.upper())
+
+    def get_quotes(self, tickers: list[str]) -> dict[str, Quote]:
+        """Same shape as SchwabClient.get_quotes, served from memory."""
+        with self._lock:
+            return {t: self._quotes[t] for t in tickers if t in self._quotes}
+
+    def snapshot(self) -> dict[str, Quote]:
+        with self._lock:
+            return dict(self._quotes)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._quotes)
+
+
+class ReplayStreamClient:
+    """
+    Offline stand-in for schwab-py's StreamClient.
+
+    Replays recorded LEVELONE_EQUITIES payloads to registered handlers,
+    filtered to subscribed symbols. speed=0 replays as fast as possible;
+    speed=1.0 honours the recorded timestamps in real time.
+    """
+
+    def __init__(self, path: str, speed: float = 0.0):
+        self._messages = [
+            json.loads(line) for line in Path(path).read_text().splitlines() if line.strip()
+        ]
+        self._speed = speed
+        self._pos = 0
+        self._handlers = []
+        self._symbols: set[str] = set()
+        self._last_ts = None
+
+    async def login(self, websocket_connect_args=None):
+        return None
+
+    async def logout(self):
+        return None
+
+    def add_level_one_equity_handler(self, handler):
+        self._handlers.append(handler)
+
+    async def level_one_equity_subs(self, symbols, *, fields=None):
+        self._symbols = set(symbols)
+
+    async def level_one_equity_add(self, symbols, *, fields=None):
+        self._symbols |= set(symbols)
+
+    async def level_one_equity_unsubs(self, symbols):
+        self._symbols -= set(symbols)
+
+    @property
+    def exhausted(self) -> bool:
+        return self._pos >= len(self._messages)
+
+    async def handle_message(self):
+        """Deliver the next recorded message. Raises EOFError when the recording ends."""
+        if self.exhausted:
+            raise EOFError("replay finished")
+        msg = self._messages[self._pos]
+        self._pos += 1
+
+        ts = msg.get("timestamp")
+        if self._speed and ts is not None and self._last_ts is not None:
+            await asyncio.sleep(max(0.0, (ts - self._last_ts) / 1000 / self._speed))
+        self._last_ts = ts
+
+        content = [r for r in msg.get("content", []) if r.get("key") in self._symbols]
+        if content:
+            for handler in self._handlers:
+                handler({**msg, "content": content})
+
+
+class QuoteStreamer:
+    """Drives a stream client and keeps a QuoteTable current."""
+
+    def __init__(self, stream_client, table: Optional[QuoteTable] = None,
+                 record_path: Optional[str] = None):
+        self._stream = stream_client
+        self.table = table or QuoteTable()
+        self._record = open(record_path, "a") if record_path else None
+        self._record_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.messages = 0
+
+    @classmethod
+    def from_schwab(cls, client: SchwabClient, **kwargs) -> "QuoteStreamer":
+        """Build a live streamer on a connected SchwabClient's schwab-py client."""
+        return cls(StreamClient(client._client), **kwargs)
+
+    def _on_level_one(self, msg: dict):
+        self.messages += 1
+        self.table.apply_message(msg)
+        with self._record_lock:
+            if self._record:
+                self._record.write(json.dumps(msg) + "\n")
+
+    async def start(self, symbols: list[str]):
+        """Log in and subscribe to Level-1 quotes for symbols."""
+        await self._stream.login()
+        self._stream.add_level_one_equity_handler(self._on_level_one)
+        await self._stream.level_one_equity_subs(symbols, fields=LEVEL_ONE_FIELDS)
+
+    async def add_symbols(self, symbols: list[str]):
+        await self._stream.level_one_equity_add(symbols, fields=LEVEL_ONE_FIELDS)
+
+    async def run(self, symbols: list[str], max_messages: Optional[int] = None):
+        """Subscribe and pump messages until stop(), max_messages, or end of replay."""
+        await self.start(symbols)
+        try:
+            while not self._stop.is_set():
+                if max_messages is not None and self.messages >= max_messages:
+                    break
+                try:
+                    await self._stream.handle_message()
+                except EOFError:
+                    break
+        finally:
+            with self._record_lock:
+                if self._record:
+                    self._record.flush()
+            await self._stream.logout()
+
+    def run_in_thread(self, symbols: list[str]) -> threading.Thread:
+        """Run the stream on a background thread with its own event loop."""
+        t = self._thread = threading.Thread(target=lambda: asyncio.run(self.run(symbols)), daemon=True)
+        t.start()
+        return t
+
+    def stop(self):
+        self._stop.set()
+
+    def close(self, timeout: float = 5.0):
+        """
+        Stop the stream, wait up to `timeout` seconds for the stream thread
+        to finish its current message, then close the record file. A message
+        that still arrives after that is applied to the table but not recorded.
+        """
+        self.stop()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+        with self._record_lock:
+            if self._record:
+                self._record.close()
+                self._record = None
+
+
+def replay_benchmark(path: str, symbols: list[str]) -> dict:
+    """Replay a recording as fast as possible and report throughput."""
+    streamer = QuoteStreamer(ReplayStreamClient(path))
+    start = time.perf_counter()
+    asyncio.run(streamer.run(symbols))
+    elapsed = time.perf_counter() - start
+    return {
+        "messages": streamer.messages,
+        "updates": streamer.table.updates,
+        "symbols": len(streamer.table),
+        "seconds": round(elapsed, 4),
+        "updates_per_sec": round(streamer.table.updates / elapsed) if elapsed else None,
+    }
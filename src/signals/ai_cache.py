@@ -0,0 +1,64 @@
+"""
+VantaStonk — Same-day AI response cache
+
+AI sampling runs once per day (spec §7.1); a rerun the same day — a
+post-close scan, a crash-and-rerun morning, a test run — should reuse the
+responses it already paid for. Responses are stored in ai_samples_raw, so
+the cache needs no table of its own: an entry is the latest unpruned row
+for (model, prompt_id, prompt text hash) captured on the run date.
+
+Editing a prompt's text changes its hash, so an edited prompt is a miss
+even under the same prompt_id. force_refresh skips lookups (every call is
+a miss) but still stores the fresh responses.
+"""
+
+import json
+from datetime import datetime
+from typing import Iterable, Optional
+
+from src.db import get_ai_sample_for_day, save_ai_samples_raw
+from src.signals.ai_sampling import AiSampleResult
+from src.signals.prompts import Prompt
+
+
+class AiResponseCache:
+    """Read-through cache over ai_samples_raw for one run date. Main-thread only."""
+
+    def __init__(self, conn, now: Optional[datetime] = None, force_refresh: bool = False):
+        self.conn = conn
+        self.now = now or datetime.now()
+        self.run_date = self.now.date().isoformat()
+        self.force_refresh = force_refresh
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, model: str, prompt: Prompt) -> Optional[AiSampleResult]:
+        """Today's stored response from `model` to `prompt`, or None (counts a hit or a miss)."""
+        row = None
+        if not self.force_refresh:
+            row = get_ai_sample_for_day(self.conn, model, prompt.prompt_id, prompt.text, self.run_date)
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return AiSampleResult(
+            model=model,
+            prompt_id=prompt.prompt_id,
+            prompt_text=row["prompt_text"],
+            response_text=row["response_text"],
+            tickers_extracted=json.loads(row["tickers_extracted"] or "[]"),
+            token_cost_usd=0.0,        # nothing was spent on this run
+        )
+
+    def put(self, results: Iterable[AiSampleResult]):
+        """Store fresh responses so later runs today can reuse them."""
+        captured_at = self.now.isoformat(timespec="seconds")
+        save_ai_samples_raw(self.conn, (
+            (captured_at, r.model, r.prompt_id, r.prompt_text, r.response_text,
+             r.tickers_extracted, r.token_cost_usd)
+            for r in results
+        ))
+
+    def summary(self) -> str:
+        mode = " (force refresh)" if self.force_refresh else ""
+        return f"AI response cache {self.run_date}{mode}: {self.hits} hit(s), {self.misses} miss(es)"
@@ -0,0 +1,208 @@
+"""
+VantaStonk — Concurrent AI sampling orchestrator
+
+Runs every model × prompt query of a pre-market sampling run at once
+instead of back to back, so the run takes roughly as long as its slowest
+single call rather than the sum of all of them.
+
+- Each provider has its own concurrency cap (PROVIDER_CONCURRENCY), so one
+  vendor's rate limit is never hit by the whole fan-out.
+- Each call gets CALL_TIMEOUT seconds from when it actually starts, cut
+  short to whatever is left of RUN_DEADLINE. That is passed to the SDK as
+  its request timeout, and enforced here as well.
+- Calls that fail or time out are recorded, not raised; the run is
+  degraded but keeps every response that did come back. Per spec §7.4 the
+  fallback is per ticker: component_scores() scores tickers from the
+  successful responses and gives None (neutral 0.5 in compose_with_fallback)
+  only to tickers no successful response named.
+
+With an AiResponseCache, cached (model, prompt) pairs are answered from
+today's stored responses before anything is queued, and fresh responses
+are stored afterwards; a rerun on the same day makes no LLM calls.
+
+Calls still in flight at the deadline are abandoned, not killed (blocking
+SDK calls can't be interrupted) and their results are discarded. Because
+each request's SDK timeout ends no later than the run deadline, their
+worker threads finish shortly after it, so they can't hold the interpreter
+open at exit for longer than that.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from typing import Iterable, Mapping, Optional
+
+from src.signals.ai_cache import AiResponseCache
+from src.signals.ai_sampling import (
+    AiSampleResult, Client, MentionRecord, TickerExtractor, extract_ranked_tickers, score_all_ai_sampling,
+)
+from src.signals.prompts import Prompt
+
+CALL_TIMEOUT = 90.0          # seconds per LLM call, from when it starts
+RUN_DEADLINE = 180.0         # seconds for the whole fan-out
+PROVIDER_CONCURRENCY = 3     # in-flight calls per provider
+
+# Canonical model name → API provider whose rate limits it shares
+PROVIDERS = {
+    "grok": "xai",
+    "gpt-5": "openai",
+    "claude-4.7": "anthropic",
+}
+
+
+@dataclass
+class SamplingRun:
+    """Outcome of one fan-out: what came back, what didn't, and why."""
+    results: list[AiSampleResult] = field(default_factory=list)
+    failures: dict[tuple[str, str], str] = field(default_factory=dict)   # (model, prompt_id) → reason
+    cached: int = 0              # results served from the same-day cache
+    elapsed: float = 0.0
+
+    @property
+    def degraded_models(self) -> set[str]:
+        return {model for model, _ in self.failures}
+
+    @property
+    def degraded(self) -> bool:
+        return bool(self.failures)
+
+    def mentions(self, extractor: Optional[TickerExtractor] = None,
+                 fresh: Iterable[str] = ()) -> list[MentionRecord]:
+        """Ranked ticker mentions from every successful response (extract_ranked_tickers by default)."""
+        extract = extractor.extract_ranked if extractor else extract_ranked_tickers
+        fresh = set(fresh)
+        return [MentionRecord(ticker, r.model, rank, ticker in fresh)
+                for r in self.results for ticker, rank in extract(r.response_text)]
+
+    def component_scores(self, universe: Iterable[str] = (), extractor: Optional[TickerExtractor] = None,
+                         fresh: Iterable[str] = ()) -> dict[str, Optional[float]]:
+        """
+        ai_sampling component values for the composite, scored from the
+        responses that came back. Failed calls only cost the tickers they
+        would have contributed: a ticker in `universe` that no successful
+        response named gets None, so compose_with_fallback uses neutral.
+        """
+        scores: dict[str, Optional[float]] = dict(score_all_ai_sampling(self.mentions(extractor, fresh)))
+        for ticker in universe:
+            scores.setdefault(ticker, None)
+        return scores
+
+    def summary(self) -> str:
+        line = f"AI sampling: {len(self.results)} responses ({self.cached} cached) in {self.elapsed:.1f}s"
+        if not self.degraded:
+            return line
+        failed = ", ".join(f"{m}/{pid}: {why}" for (m, pid), why in sorted(self.failures.items()))
+        return f"{line} — DEGRADED ({failed}); scored from the responses that came back"
+
+
+def run_sampling(
+    clients: Mapping[str, Client],
+    prompts: list[Prompt],
+    call_timeout: float = CALL_TIMEOUT,
+    deadline: float = RUN_DEADLINE,
+    provider_concurrency: int = PROVIDER_CONCURRENCY,
+    cache: Optional[AiResponseCache] = None,
+) -> SamplingRun:
+    """
+    Query every client (keyed by canonical model name) with every prompt
+    concurrently. Results come back in model × prompt order with `model`
+    set to the canonical name; failures and timeouts land in run.failures.
+    """
+    start = time.monotonic()
+    run_deadline = start + deadline
+    pairs = [(name, prompt) for name in clients for prompt in prompts]
+    hits = {}
+    if cache is not None:
+        for name, prompt in pairs:
+            hit = cache.get(name, prompt)
+            if hit is not None:
+                hits[(name, prompt.prompt_id)] = hit
+    jobs = [(name, prompt) for name, prompt in pairs if (name, prompt.prompt_id) not in hits]
+    outcome = _fan_out(clients, jobs, call_timeout, run_deadline, provider_concurrency) if jobs else {}
+
+    run = SamplingRun(cached=len(hits))
+    fresh = []
+    for name, prompt in pairs:
+        key = (name, prompt.prompt_id)
+        got = hits.get(key) or outcome[key]
+        if isinstance(got, AiSampleResult):
+            run.results.append(got)
+            if key not in hits:
+                fresh.append(got)
+        else:
+            run.failures[key] = got
+    if cache is not None and fresh:
+        cache.put(fresh)
+    run.elapsed = time.monotonic() - start
+    return run
+
+
+def _fan_out(clients, jobs: list[tuple[str, Prompt]], call_timeout: float, run_deadline: float,
+             provider_concurrency: int) -> dict[tuple[str, str], AiSampleResult | str]:
+    """Run jobs on a thread pool. Returns {(model, prompt_id): result or failure reason}."""
+    limits = {PROVIDERS.get(name, name): threading.BoundedSemaphore(provider_concurrency)
+              for name in clients}
+    started: dict[int, float] = {}          # job index → monotonic start
+    abandoned: set[int] = set()
+    lock = threading.Lock()
+
+    def call(i: int) -> AiSampleResult:
+        name, prompt = jobs[i]
+        with limits[PROVIDERS.get(name, name)]:
+            with lock:
+                now = time.monotonic()
+                if i in abandoned or now >= run_deadline:
+                    raise TimeoutError("deadline")
+                started[i] = now
+            # The SDK's own timeout is what actually ends an abandoned request
+            timeout = min(call_timeout, run_deadline - now)
+            result = clients[name].query(prompt.text, prompt_id=prompt.prompt_id, timeout=timeout)
+        return replace(result, model=name, prompt_id=prompt.prompt_id)
+
+    pool = ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="ai-sampling")
+    futures: dict[Future, int] = {pool.submit(call, i): i for i in range(len(jobs))}
+    outcome: dict[int, AiSampleResult | str] = {}
+    try:
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=_next_check(started, pending, futures, call_timeout, run_deadline),
+                                 return_when=FIRST_COMPLETED)
+            for f in done:
+                try:
+                    outcome[futures[f]] = f.result()
+                except Exception as e:
+                    # builtin TimeoutError, openai.APITimeoutError, anthropic.APITimeoutError, ...
+                    timed_out = "Timeout" in type(e).__name__
+                    outcome[futures[f]] = "timeout" if timed_out else f"{type(e).__name__}: {e}"
+
+            now = time.monotonic()
+            with lock:
+                for f in list(pending):
+                    i = futures[f]
+                    if now >= run_deadline:
+                        outcome[i] = "deadline"
+                    elif i in started and now - started[i] >= call_timeout:
+                        outcome[i] = "timeout"
+                    else:
+                        continue
+                    abandoned.add(i)
+                    pending.discard(f)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    return {(name, prompt.prompt_id): outcome[i] for i, (name, prompt) in enumerate(jobs)}
+
+
+def _next_check(started, pending, futures, call_timeout: float, run_deadline: float) -> float:
+    """
+    Seconds until the run deadline or the earliest running call's timeout.
+    A queued call that starts after this check can't expire sooner than
+    call_timeout from now, so that bounds the wait too.
+    """
+    expiries = [run_deadline, time.monotonic() + call_timeout]
+    for f in pending:
+        t = started.get(futures[f])
+        if t is not None:
+            expiries.append(t + call_timeout)
+    return max(0.0, min(expiries) - time.monotonic())
@@ -2,7 +2,12 @@
 
 import re
 from dataclasses import dataclass, field
-from typing import Protocol
+from pathlib import Path
+from typing import Iterable, Protocol
+
+import httpx
+
+from src.integrations.http import client_for
 
 # Model-weighted convergence (sum = 1.0)
 MODEL_WEIGHTS = {
@@ -22,21 +27,35 @@ class AiSampleResult:
     token_cost_usd: float = 0.0
 
 
-class _Client(Protocol):
-    def query(self, prompt: str) -> AiSampleResult: ...
+class Client(Protocol):
+    def query(self, prompt: str, prompt_id: str = "", timeout: float | None = None) -> AiSampleResult: ...
+
+
+def _timeout_kwargs(timeout: float | None) -> dict:
+    """Per-request timeout for the SDK call; None keeps the SDK default (not "no timeout")."""
+    return {} if timeout is None else {"timeout": timeout}
+
+
+def _shared_http_client(host_url: str) -> dict:
+    """SDK http_client kwarg for the shared pooled client of host_url's host."""
+    return {"http_client": client_for(httpx.URL(host_url).host)}
 
 
 class _OpenAIClient:
     def __init__(self, api_key: str, model: str = "gpt-5", base_url: str | None = None):
         from openai import OpenAI
-        self._openai = OpenAI(api_key=api_key, base_url=base_url) if base_url else OpenAI(api_key=api_key)
+        kwargs = {"base_url": base_url} if base_url else {}
+        # Every OpenAI SDK release accepts an httpx.Client
+        self._openai = OpenAI(api_key=api_key, **kwargs,
+                              **_shared_http_client(base_url or "https://api.openai.com"))
         self._model_id = model
 
-    def query(self, prompt: str, prompt_id: str = "") -> AiSampleResult:
+    def query(self, prompt: str, prompt_id: str = "", timeout: float | None = None) -> AiSampleResult:
         resp = self._openai.chat.completions.create(
             model=self._model_id,
             messages=[{"role": "user", "content": prompt}],
             temperature=0.7,
+            **_timeout_kwargs(timeout),
         )
         text = resp.choices[0].message.content or ""
         usage = getattr(resp, "usage", None)
@@ -54,15 +73,19 @@ class _OpenAIClient:
 
 class _AnthropicClient:
     def __init__(self, api_key: str, model: str = "claude-opus-4-7"):
-        from anthropic import Anthropic
-        self._anthropic = Anthropic(api_key=api_key)
+        from anthropic import Anthropic, DefaultHttpxClient
+        # Releases built on httpx2 reject an httpx.Client; those keep their own pool
+        shared = (_shared_http_client("https://api.anthropic.com")
+                  if issubclass(DefaultHttpxClient, httpx.Client) else {})
+        self._anthropic = Anthropic(api_key=api_key, **shared)
         self._model_id = model
 
-    def query(self, prompt: str, prompt_id: str = "") -> AiSampleResult:
+    def query(self, prompt: str, prompt_id: str = "", timeout: float | None = None) -> AiSampleResult:
         resp = self._anthropic.messages.create(
             model=self._model_id,
             max_tokens=1024,
             messages=[{"role": "user", "content": prompt}],
+            **_timeout_kwargs(timeout),
         )
         text = "".join(b.text for b in resp.content if hasattr(b, "text"))
         cost = 0.0
@@ -77,7 +100,7 @@ class _AnthropicClient:
         )
 
 
-def build_client(name: str, api_key: str) -> _Client:
+def build_client(name: str, api_key: str) -> Client:
     """Build a client by canonical model name."""
     if name == "grok":
         return _OpenAIClient(api_key=api_key, model="grok-4", base_url="https://api.x.ai/v1")
@@ -154,6 +177,133 @@ def extract_ranked_tickers(text: str) -> list[tuple[str, int]]:
     return out
 
 
+# --- Known-symbol extractor ---
+
+@dataclass
+class TickerMention:
+    ticker: str
+    rank: int          # 0-indexed list position (extract_ranked_tickers semantics); -1 = outside the list
+    position: int      # character offset of the first mention
+    cashtag: bool      # first mention was written as $TICKER
+
+
+# One alternation, one pass: newlines end a list item, "1." / "2)" starts one,
+# anything else is a candidate symbol (optionally $-prefixed).
+_TOKEN_RE = re.compile(r"(\n)|^[ \t]*(\d+)[.)][ \t]+|(\$?)\b([A-Z]{1,5})\b", re.MULTILINE)
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _token_offset(text: str, sym: str, cashtag: bool) -> int:
+    """Offset of the first $SYM (cashtag) or standalone SYM in text, as _TOKEN_RE would match it."""
+    needle = "$" + sym if cashtag else sym
+    i = text.find(needle)
+    while i >= 0:
+        end = i + len(needle)
+        if ((cashtag or i == 0 or not _is_word_char(text[i - 1]))
+                and (end == len(text) or not _is_word_char(text[end]))):
+            return i
+        i = text.find(needle, i + 1)
+    return -1
+
+
+class TickerExtractor:
+    """
+    Compiled ticker extractor backed by a set of known-valid symbols.
+
+    Each response is tokenized once; words not in the symbol set are
+    dropped without a lookup. Barewords must be 2+ letters and not in
+    the blocklist (so "NOW" or "ALL" only count as $NOW / $ALL); cashtags
+    only need to be listed.
+    """
+
+    def __init__(self, symbols: Iterable[str], blocklist: Iterable[str] = _BLOCKLIST):
+        self.symbols = frozenset(s.strip().upper() for s in symbols if s.strip())
+        self._bareword_ok = frozenset(s for s in self.symbols if len(s) >= 2) - frozenset(blocklist)
+
+    @classmethod
+    def from_db(cls, conn) -> "TickerExtractor":
+        """Symbols from the tickers table plus those the validity cache has seen quote."""
+        return cls(r[0] for r in conn.execute("""
+            SELECT ticker FROM tickers
+            UNION SELECT symbol FROM symbol_validity WHERE is_valid
+        """))
+
+    @classmethod
+    def from_file(cls, path: str) -> "TickerExtractor":
+        """
+        Symbols from a cached list: one per line, or a pipe/comma-delimited
+        listing (e.g. nasdaqlisted.txt) with the symbol in the first column.
+        """
+        symbols = []
+        for line in Path(path).read_text().splitlines():
+            sym = re.split(r"[|,\s]", line.strip(), maxsplit=1)[0]
+            if sym.isalpha() and sym.isupper():
+                symbols.append(sym)
+        return cls(symbols)
+
+    def mentions(self, text: str) -> list[TickerMention]:
+        """
+        All listed tickers in first-seen order, with rank, offset and cashtag
+        flag. Ranks follow extract_ranked_tickers: a numbered line ranks its
+        first $CASHTAG, else its first bareword; with no numbered list,
+        cashtagged tickers rank ahead of bareword-only ones.
+        """
+        symbols, bareword_ok = self.symbols, self._bareword_ok
+        first: dict[str, bool] = {}     # ticker → first mention was a cashtag
+        cashtagged: dict[str, None] = {}   # in first-cashtag order
+        picks: list[tuple[int, str | None]] = []    # (item, the ticker its line ranks)
+        item = -1                       # index of the numbered line we're on
+        in_item = False
+        line_cash = line_bare = None
+        for nl, num, cash, sym in _TOKEN_RE.findall(text):
+            if sym:
+                if sym not in (symbols if cash else bareword_ok):
+                    continue
+                if sym not in first:
+                    first[sym] = bool(cash)
+                if cash:
+                    cashtagged.setdefault(sym)
+                if in_item:
+                    if cash:
+                        line_cash = line_cash or sym
+                    else:
+                        line_bare = line_bare or sym
+                continue
+            # A newline or the next "N." ends the current list item
+            if in_item:
+                picks.append((item, line_cash or line_bare))
+                in_item = False
+            if num:
+                item += 1
+                in_item = True
+                line_cash = line_bare = None
+        if in_item:
+            picks.append((item, line_cash or line_bare))
+
+        ranked: dict[str, int] = {}
+        for i, sym in picks:
+            if sym and sym not in ranked:
+                ranked[sym] = i
+        if not ranked:                  # no numbered list: cashtags first, then order of appearance
+            ranked = {sym: i for i, sym in enumerate([*cashtagged, *(s for s in first if s not in cashtagged)])}
+
+        # Offsets only for the handful of accepted tickers, not every token
+        return [
+            TickerMention(sym, ranked.get(sym, -1), _token_offset(text, sym, cash), cash)
+            for sym, cash in first.items()
+        ]
+
+    def extract(self, text: str) -> list[str]:
+        return [m.ticker for m in self.mentions(text)]
+
+    def extract_ranked(self, text: str) -> list[tuple[str, int]]:
+        """Same shape as extract_ranked_tickers: [(ticker, rank)] ordered by rank."""
+        return sorted(((m.ticker, m.rank) for m in self.mentions(text) if m.rank >= 0), key=lambda x: x[1])
+
+
 def compute_ai_sampling_score(ticker: str, mentions: list[MentionRecord]) -> float:
     """
     score = clamp((convergence * rank_weight) + freshness_bonus, 0.0, 1.0)
@@ -169,7 +319,37 @@ def compute_ai_sampling_score(ticker: str, mentions: list[MentionRecord]) -> flo
     convergence = sum(MODEL_WEIGHTS.get(m, 0.0) for m in models_seen)
     best_rank = min(m.rank for m in ticker_mentions)
     fresh = any(m.is_fresh for m in ticker_mentions)
+    return _convergence_score(convergence, best_rank, fresh)
+
+
+def _convergence_score(convergence: float, best_rank: int, fresh: bool) -> float:
     rank_weight = compute_rank_weight(best_rank)
     freshness_bonus = 0.2 if fresh else 0.0
     score = (convergence * rank_weight) + freshness_bonus
     return max(0.0, min(1.0, score))
+
+
+def score_all_ai_sampling(mentions: Iterable[MentionRecord]) -> dict[str, float]:
+    """
+    compute_ai_sampling_score for every mentioned ticker, in one pass over
+    mentions instead of one pass per ticker. Returns {ticker: score} in
+    first-mention order; results are identical to the per-ticker function.
+    """
+    # ticker → [models seen, best rank, any fresh]
+    agg: dict[str, list] = {}
+    for m in mentions:
+        a = agg.get(m.ticker)
+        if a is None:
+            agg[m.ticker] = [{m.model}, m.rank, m.is_fresh]
+            continue
+        a[0].add(m.model)
+        if m.rank < a[1]:
+            a[1] = m.rank
+        if m.is_fresh:
+            a[2] = True
+    # Models are summed in the same set order as compute_ai_sampling_score,
+    # so the float result matches to the last bit
+    return {
+        ticker: _convergence_score(sum(MODEL_WEIGHTS.get(model, 0.0) for model in models), best, fresh)
+        for ticker, (models, best, fresh) in agg.items()
+    }
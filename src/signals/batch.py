@@ -0,0 +1,77 @@
+"""
+VantaStonk — Vectorized signal scoring
+
+NumPy versions of the per-ticker signal step functions, for scoring a whole
+candidate universe in one call. Each takes arrays (anything np.asarray
+accepts) and returns a float64 array, element-for-element identical to the
+scalar function:
+
+    compute_velocity       → compute_velocity_batch
+    score_velocity         → score_velocity_batch
+    compute_rvol           → compute_rvol_batch
+    score_volume_anomaly   → score_volume_anomaly_batch
+    compose_with_fallback  → compose_with_fallback_batch
+
+NaN marks a missing value (the scalar functions' None): it propagates
+through the compute/score steps, and compose_with_fallback_batch replaces
+it with NEUTRAL per spec §7.4.
+"""
+
+import numpy as np
+
+from src.signals.composite import COMPONENT_WEIGHTS, NEUTRAL
+
+# Bucket edges and scores of the scalar step functions: a value below
+# EDGES[i] (and at/above EDGES[i-1]) scores SCORES[i]; at/above the last edge
+# scores SCORES[-1].
+VELOCITY_EDGES = np.array([1.5, 2.0, 5.0, 10.0])
+VELOCITY_SCORES = np.array([0.0, 0.3, 0.6, 0.9, 1.0])
+RVOL_EDGES = np.array([1.5, 2.0, 3.0, 5.0])
+RVOL_SCORES = np.array([0.0, 0.3, 0.6, 0.85, 1.0])
+
+
+def _ratio(numerator, denominator) -> np.ndarray:
+    """numerator / denominator, 0.0 where denominator <= 0, NaN where either is NaN."""
+    num = np.asarray(numerator, dtype=np.float64)
+    den = np.asarray(denominator, dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out = np.where(den <= 0, 0.0, num / den)
+    return np.where(np.isnan(num) | np.isnan(den), np.nan, out)   # missing wins over the den <= 0 rule
+
+
+def _bucket(values, edges: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    v = np.asarray(values, dtype=np.float64)
+    out = scores[np.searchsorted(edges, v, side="right")]
+    return np.where(np.isnan(v), np.nan, out)
+
+
+def compute_velocity_batch(mentions_today, mentions_7d_avg) -> np.ndarray:
+    return _ratio(mentions_today, mentions_7d_avg)
+
+
+def score_velocity_batch(velocity) -> np.ndarray:
+    return _bucket(velocity, VELOCITY_EDGES, VELOCITY_SCORES)
+
+
+def compute_rvol_batch(today, avg_30d) -> np.ndarray:
+    return _ratio(today, avg_30d)
+
+
+def score_volume_anomaly_batch(rvol) -> np.ndarray:
+    return _bucket(rvol, RVOL_EDGES, RVOL_SCORES)
+
+
+def _neutral_if_missing(component) -> np.ndarray:
+    c = np.asarray(component, dtype=np.float64)
+    return np.where(np.isnan(c), NEUTRAL, c)
+
+
+def compose_with_fallback_batch(ai_sampling, social_velocity, volume_anomaly) -> np.ndarray:
+    """Weighted composite per ticker, NEUTRAL for NaN components, clamped to [0, 1]."""
+    ai, social, volume = (_neutral_if_missing(c) for c in (ai_sampling, social_velocity, volume_anomaly))
+    s = (
+        COMPONENT_WEIGHTS["ai_sampling"] * ai
+        + COMPONENT_WEIGHTS["social_velocity"] * social
+        + COMPONENT_WEIGHTS["volume_anomaly"] * volume
+    )
+    return np.clip(s, 0.0, 1.0)
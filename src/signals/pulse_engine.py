@@ -0,0 +1,115 @@
+"""
+VantaStonk — Universe-wide composite prompt_pulse (spec §7.1 step 4)
+
+PromptPulseEngine composes ai_sampling, social_velocity and volume_anomaly
+for the whole universe in one vectorized step, instead of one
+compose_with_fallback call and one save_prompt_pulse_components commit per
+ticker:
+
+    engine = PromptPulseEngine(core + feeder)
+    engine.set_component("ai_sampling", run.component_scores(extractor=extractor))
+    engine.set_component("social_velocity", velocity_scores)
+    engine.set_component("volume_anomaly", rvol_scores, tickers=symbols)
+    frame = engine.write(conn, captured_at, "premarket")
+
+The universe is the tickers given up front plus any ticker a component
+reports (newly surfaced candidates), in first-seen order. A ticker a
+component doesn't cover, or covers with None/NaN, gets the neutral 0.5
+for that component (spec §7.4) and is stored as NULL.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+
+from src.db import save_prompt_pulse_components_bulk, unit_of_work
+from src.signals.batch import compose_with_fallback_batch
+from src.signals.composite import COMPONENT_WEIGHTS
+
+
+@dataclass
+class PulseFrame:
+    """Columnar composite result: row i of every array belongs to tickers[i]."""
+    tickers: list[str]
+    ai_sampling: np.ndarray           # NaN = missing (scored as neutral)
+    social_velocity: np.ndarray
+    volume_anomaly: np.ndarray
+    composite: np.ndarray
+
+    def scores(self) -> dict[str, float]:
+        return dict(zip(self.tickers, self.composite.tolist()))
+
+    def top(self, n: int) -> list[tuple[str, float]]:
+        """Highest composites first (ties keep universe order)."""
+        order = np.argsort(-self.composite, kind="stable")[:n]
+        return [(self.tickers[i], float(self.composite[i])) for i in order]
+
+    def rows(self, captured_at: str, scan_type: str) -> Iterable[tuple]:
+        """save_prompt_pulse_components_bulk rows; missing components become NULL."""
+        def column(a):
+            return [None if v != v else v for v in a.tolist()]    # NaN → None
+        return zip(self.tickers, [captured_at] * len(self.tickers), [scan_type] * len(self.tickers),
+                   column(self.ai_sampling), column(self.social_velocity),
+                   column(self.volume_anomaly), self.composite.tolist())
+
+
+class PromptPulseEngine:
+    """Collects component columns keyed by ticker, then composes them all at once."""
+
+    def __init__(self, universe: Iterable[str] = ()):
+        self._universe = list(dict.fromkeys(universe))
+        self._components: dict[str, tuple[list[str], np.ndarray]] = {}
+
+    def set_component(
+        self,
+        name: str,
+        values: Mapping[str, Optional[float]] | Sequence[float] | np.ndarray,
+        tickers: Optional[Sequence[str]] = None,
+    ):
+        """
+        Provide one component: a {ticker: score or None} mapping, or an array
+        of scores aligned with `tickers`. Replaces any earlier values for it.
+        """
+        if name not in COMPONENT_WEIGHTS:
+            raise ValueError(f"unknown component: {name}")
+        if tickers is None:
+            if not isinstance(values, Mapping):
+                raise ValueError("tickers required for array values")
+            tickers = list(values)
+            values = [np.nan if v is None else v for v in values.values()]
+        array = np.asarray(values, dtype=np.float64)
+        if len(array) != len(tickers):
+            raise ValueError(f"{name}: {len(array)} values for {len(tickers)} tickers")
+        self._components[name] = (list(tickers), array)
+
+    def compute(self) -> PulseFrame:
+        tickers = list(self._universe)
+        index = {t: i for i, t in enumerate(tickers)}
+        for names, _ in self._components.values():
+            for t in names:
+                if t not in index:
+                    index[t] = len(tickers)
+                    tickers.append(t)
+
+        columns = {}
+        for name in COMPONENT_WEIGHTS:
+            column = np.full(len(tickers), np.nan)
+            if name in self._components:
+                names, values = self._components[name]
+                column[np.fromiter((index[t] for t in names), dtype=np.intp, count=len(names))] = values
+            columns[name] = column
+
+        return PulseFrame(
+            tickers=tickers,
+            composite=compose_with_fallback_batch(
+                columns["ai_sampling"], columns["social_velocity"], columns["volume_anomaly"]),
+            **columns,
+        )
+
+    def write(self, conn, captured_at: str, scan_type: str) -> PulseFrame:
+        """Compute and store every ticker's prompt_pulse_components row in one transaction."""
+        frame = self.compute()
+        with unit_of_work(conn):
+            save_prompt_pulse_components_bulk(conn, frame.rows(captured_at, scan_type))
+        return frame
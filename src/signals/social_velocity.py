@@ -1,11 +1,20 @@
 """Social mention velocity (Apewisdom aggregates r/WSB, r/stocks, r/pennystocks, r/smallstreetbets)."""
 
+import json
+import warnings
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Any
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
 
 import httpx
 
+from src.db import save_social_snapshots, unit_of_work
+from src.integrations.http import client_for
+
 APEWISDOM_URL = "https://apewisdom.io/api/v1.0/filter/all-stocks/page/1"
+APEWISDOM_PAGE_URL = "https://apewisdom.io/api/v1.0/filter/{filter}/page/{page}"
+APEWISDOM_HOST = "apewisdom.io"
 NOISE_FLOOR = 5  # ignore if absolute count < 5
 
 
@@ -29,14 +38,136 @@ def parse_apewisdom_response(payload: dict[str, Any]) -> list[ApewisdomRow]:
     ]
 
 
-def fetch_apewisdom(client: httpx.Client | None = None, timeout: float = 10.0) -> list[ApewisdomRow]:
-    """Fetch current Apewisdom snapshot. Raises on network error."""
-    c = client or httpx.Client(timeout=timeout)
-    r = c.get(APEWISDOM_URL)
+def fetch_apewisdom(client: httpx.Client | None = None, timeout: float | None = None) -> list[ApewisdomRow]:
+    """
+    Fetch the first page of the current Apewisdom snapshot. Raises on network error.
+
+    timeout is deprecated and ignored: requests use the shared apewisdom.io
+    client's per-host timeout (src.integrations.http.HOST_TIMEOUTS).
+    """
+    if timeout is not None:
+        warnings.warn("fetch_apewisdom(timeout=) is deprecated and ignored; the shared "
+                      "apewisdom.io client's timeout applies", DeprecationWarning, stacklevel=2)
+    r = (client or client_for(APEWISDOM_HOST)).get(APEWISDOM_URL)
     r.raise_for_status()
     return parse_apewisdom_response(r.json())
 
 
+# --- Full-snapshot ingestion ---
+
+def iter_snapshot_rows(payload: dict[str, Any], captured_at: str,
+                       source: str = "apewisdom") -> Iterator[tuple]:
+    """
+    Yield save_social_snapshots rows — (captured_at, source, ticker,
+    mentions_count, sentiment_score) — straight from an Apewisdom page.
+    """
+    for r in payload.get("results", []):
+        yield (captured_at, source, r["ticker"].upper(), int(r.get("mentions", 0)), r.get("sentiment"))
+
+
+@dataclass
+class ApewisdomFetch:
+    """What one ApewisdomFetcher.fetch did."""
+    pages: int = 0
+    rows: int = 0
+    bytes: int = 0
+    not_modified: bool = False    # snapshot unchanged since the last fetch today; nothing written
+
+
+class ApewisdomFetcher:
+    """
+    Pulls every page of the current Apewisdom snapshot over one pooled
+    client (the shared apewisdom.io client from src.integrations.http
+    unless one is passed in).
+
+    Page 1 tells us the page count; the remaining pages are fetched
+    concurrently. Page 1 is requested conditionally (If-None-Match /
+    If-Modified-Since with the validators from the last fetch the same day),
+    so an unchanged snapshot costs one small 304. Apewisdom regenerates all
+    pages together, so a 304 on page 1 stands for the whole snapshot.
+
+    Validators live on the instance, and in state_path if given so they
+    survive across scan processes. They're only used on the day they were
+    saved: the first fetch of a day always writes a snapshot.
+    """
+
+    def __init__(self, client: Optional[httpx.Client] = None, filter: str = "all-stocks",
+                 max_workers: int = 4, state_path: Optional[str] = None):
+        self._client = client or client_for(APEWISDOM_HOST)
+        self._filter = filter
+        self._max_workers = max_workers
+        self._state_path = Path(state_path) if state_path else None
+        self._validators: dict[str, str] = {}
+        if self._state_path and self._state_path.exists():
+            self._validators = json.loads(self._state_path.read_text())
+
+    def _get(self, page: int, headers: Optional[dict] = None) -> httpx.Response:
+        r = self._client.get(APEWISDOM_PAGE_URL.format(filter=self._filter, page=page), headers=headers)
+        if r.status_code != 304:
+            r.raise_for_status()
+        return r
+
+    def _conditional_headers(self, day: str) -> dict:
+        v = self._validators
+        if v.get("day") != day:
+            return {}
+        headers = {}
+        if v.get("etag"):
+            headers["If-None-Match"] = v["etag"]
+        if v.get("last_modified"):
+            headers["If-Modified-Since"] = v["last_modified"]
+        return headers
+
+    def _remember(self, r: httpx.Response, day: str):
+        self._validators = {"day": day, "etag": r.headers.get("ETag"),
+                            "last_modified": r.headers.get("Last-Modified")}
+        if self._state_path:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            self._state_path.write_text(json.dumps(self._validators))
+
+    def fetch(self, conn, captured_at: str, source: str = "apewisdom") -> ApewisdomFetch:
+        """
+        Fetch the snapshot into social_snapshots. Each page's rows stream
+        into save_social_snapshots as that page arrives, all inside one
+        unit_of_work: if any page fails the transaction rolls back, so a
+        partial snapshot is never stored. Writes happen on the caller's
+        thread. Raises on network error.
+        """
+        day = captured_at[:10]
+        report = ApewisdomFetch()
+        first = self._get(1, self._conditional_headers(day))
+        report.bytes += len(first.content)
+        if first.status_code == 304:
+            report.not_modified = True
+            return report
+
+        payload = first.json()
+        pages = max(1, int(payload.get("pages") or 1))
+        report.pages = pages
+
+        def write(page_payload):
+            save_social_snapshots(conn, _counting(iter_snapshot_rows(page_payload, captured_at, source), report))
+
+        with unit_of_work(conn):
+            write(payload)
+            if pages > 1:
+                with ThreadPoolExecutor(max_workers=min(self._max_workers, pages - 1)) as pool:
+                    futures = [pool.submit(self._get, page) for page in range(2, pages + 1)]
+                    for f in as_completed(futures):
+                        r = f.result()
+                        report.bytes += len(r.content)
+                        write(r.json())
+        # Only after every page landed, so a failed fetch is retried in full
+        self._remember(first, day)
+        return report
+
+
+def _counting(rows: Iterable[tuple], report: ApewisdomFetch) -> Iterator[tuple]:
+    for row in rows:
+        report.rows += 1
+        yield row
+
+
 def compute_velocity(mentions_today: int, mentions_7d_avg: float) -> float:
     if mentions_7d_avg <= 0:
         return 0.0
@@ -1,24 +1,72 @@
 """Validates candidate tickers (e.g. extracted from AI responses) against Schwab."""
 
-from typing import Protocol
+from datetime import datetime, timedelta
+from typing import Optional, Protocol
+
+from src.db import get_symbol_validity, save_symbol_validity
+
+# How long a cached result is trusted. Listings rarely disappear; a miss
+# may be a fresh IPO or a transient data gap, so it's re-checked sooner.
+VALID_TTL = timedelta(days=7)
+INVALID_TTL = timedelta(days=1)
 
 
 class QuoteLookup(Protocol):
     def has_quote(self, symbol: str) -> bool: ...
 
 
-def validate_tickers(candidates: list[str], client: QuoteLookup) -> tuple[list[str], list[str]]:
-    """Return (valid, rejected) after deduping, normalizing, and Schwab-validating."""
+class BatchQuoteLookup(Protocol):
+    """SchwabClient-style batch lookup: missing symbols are absent from the result."""
+    last_quote_errors: dict
+    def get_quotes(self, tickers: list[str]) -> dict: ...
+
+
+def _check(symbols: list[str], client) -> dict[str, bool]:
+    """Validate uncached symbols. Symbols whose lookup failed are left out (unknown)."""
+    if not symbols:
+        return {}
+    if hasattr(client, "get_quotes"):
+        quotes = client.get_quotes(symbols)
+        failed = getattr(client, "last_quote_errors", {}) or {}
+        return {sym: sym in quotes for sym in symbols if sym in quotes or sym not in failed}
+    return {sym: client.has_quote(sym) for sym in symbols}
+
+
+def validate_tickers(
+    candidates: list[str],
+    client: QuoteLookup | BatchQuoteLookup,
+    conn=None,
+    now: Optional[datetime] = None,
+) -> tuple[list[str], list[str]]:
+    """
+    Return (valid, rejected) after deduping, normalizing, and Schwab-validating.
+
+    Clients with get_quotes are asked once for all uncached symbols (chunked
+    and concurrent inside SchwabClient); others fall back to has_quote per
+    symbol. With a DB connection, results go through the symbol_validity
+    cache (VALID_TTL / INVALID_TTL). Symbols whose lookup errored are
+    rejected for this run but not cached.
+    """
+    symbols: list[str] = []
     seen: set[str] = set()
-    valid: list[str] = []
-    rejected: list[str] = []
     for raw in candidates:
         sym = raw.strip().upper()
-        if not sym or sym in seen:
-            continue
-        seen.add(sym)
-        if client.has_quote(sym):
-            valid.append(sym)
-        else:
-            rejected.append(sym)
+        if sym and sym not in seen:
+            seen.add(sym)
+            symbols.append(sym)
+
+    now = now or datetime.now()
+    cached: dict[str, bool] = {}
+    if conn is not None:
+        cached = get_symbol_validity(conn, symbols,
+                                     valid_since=(now - VALID_TTL).isoformat(timespec="seconds"),
+                                     invalid_since=(now - INVALID_TTL).isoformat(timespec="seconds"))
+
+    checked = _check([s for s in symbols if s not in cached], client)
+    if conn is not None and checked:
+        save_symbol_validity(conn, checked, now.isoformat(timespec="seconds"))
+
+    results = {**cached, **checked}
+    valid = [s for s in symbols if results.get(s)]
+    rejected = [s for s in symbols if not results.get(s)]
     return valid, rejected
@@ -0,0 +1,118 @@
+"""
+VantaStonk — Rolling 30-day average volume for RVOL
+
+compute_rvol(today, avg_30d) needs each ticker's average daily volume.
+Rather than pulling 30+ bars per ticker per scan, volume_state keeps, per
+ticker, a ring of the last AVG_WINDOW completed daily volumes and their
+running sum:
+
+- fold_daily_bars() advances the ring one bar at a time (add the new day,
+  drop the oldest): O(1) per new bar. BarCache calls it whenever it stores
+  daily bars, so the state stays current with no extra history requests.
+- get_avg_volumes() (src.db) then reads avg_30d for the whole universe, one
+  primary-key lookup per ticker.
+- rebuild_volume_state() recomputes rows from price_bars, for recovery or
+  after importing bars from another machine.
+
+Only completed days count: a bar dated today is still forming and is
+never folded in.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Iterable, Optional
+
+from src.db import get_volume_states, save_volume_states, get_recent_daily_volumes
+
+AVG_WINDOW = 30
+
+
+@dataclass
+class VolumeState:
+    ticker: str
+    window_days: int = AVG_WINDOW
+    last_bar_date: str = ""
+    volume_sum: int = 0
+    day_count: int = 0
+    ring: list[int] = field(default_factory=list)   # oldest first
+
+    @property
+    def avg(self) -> Optional[float]:
+        return self.volume_sum / self.day_count if self.day_count else None
+
+    def push(self, bar_date: str, volume: int) -> bool:
+        """Fold in one completed day. Days at or before last_bar_date are ignored."""
+        if bar_date <= self.last_bar_date:
+            return False
+        self.ring.append(volume)
+        self.volume_sum += volume
+        if len(self.ring) > self.window_days:
+            self.volume_sum -= self.ring.pop(0)
+        self.day_count = len(self.ring)
+        self.last_bar_date = bar_date
+        return True
+
+    def row(self, updated_at: str) -> tuple:
+        return (self.ticker, self.window_days, self.last_bar_date, self.volume_sum,
+                self.day_count, self.ring, updated_at)
+
+
+def _load(conn, tickers: Iterable[str], window: int) -> dict[str, VolumeState]:
+    """Stored states with a matching window (others are treated as missing)."""
+    return {
+        t: VolumeState(t, r["window_days"], r["last_bar_date"], r["volume_sum"], r["day_count"], r["ring"])
+        for t, r in get_volume_states(conn, tickers).items()
+        if r["window_days"] == window
+    }
+
+
+def rebuild_volume_state(
+    conn,
+    tickers: Optional[Iterable[str]] = None,
+    today: Optional[date] = None,
+    window: int = AVG_WINDOW,
+    now: Optional[datetime] = None,
+) -> int:
+    """Recompute volume_state from price_bars (all cached tickers by default). Returns rows written."""
+    today = today or date.today()
+    updated_at = (now or datetime.now()).isoformat(timespec="seconds")
+    states = []
+    for ticker, days in get_recent_daily_volumes(conn, today.isoformat(), window, tickers).items():
+        state = VolumeState(ticker, window)
+        for bar_date, volume in days:
+            state.push(bar_date, volume)
+        states.append(state)
+    save_volume_states(conn, (s.row(updated_at) for s in states))
+    return len(states)
+
+
+def fold_daily_bars(
+    conn,
+    bars_by_ticker: dict[str, list],
+    today: Optional[date] = None,
+    window: int = AVG_WINDOW,
+    now: Optional[datetime] = None,
+) -> int:
+    """
+    Advance each ticker's state with the completed daily bars (PriceBar-like:
+    .date, .volume) newer than its last_bar_date. Tickers with no state yet
+    are rebuilt from price_bars instead, so store the bars first. Returns
+    the number of tickers whose state changed.
+    """
+    today_s = (today or date.today()).isoformat()
+    updated_at = (now or datetime.now()).isoformat(timespec="seconds")
+    states = _load(conn, bars_by_ticker, window)
+    missing = [t for t in bars_by_ticker if t not in states]
+
+    changed = []
+    for ticker, state in states.items():
+        moved = False
+        for bar in sorted(bars_by_ticker[ticker], key=lambda b: b.date):
+            if bar.date < today_s and bar.volume is not None:
+                moved = state.push(bar.date, bar.volume) or moved
+        if moved:
+            changed.append(state)
+    save_volume_states(conn, (s.row(updated_at) for s in changed))
+
+    rebuilt = rebuild_volume_state(conn, missing, date.fromisoformat(today_s), window, now) if missing else 0
+    return len(changed) + rebuilt
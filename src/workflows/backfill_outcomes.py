@@ -0,0 +1,76 @@
+"""
+VantaStonk — Outcome backfill (spec §9.3)
+
+Fills price_1d / price_3d / price_7d on recommendation_outcomes: the close
+N trading days after the day a ticker first appeared (the Nth completed
+daily bar dated after first_appeared_at).
+
+All pending outcomes are grouped by ticker, and each ticker gets a single
+history request reaching back to its oldest pending entry, so every
+horizon of every outcome for that ticker is computed from one span. The
+results are written in one transaction.
+
+`history` is anything with SchwabClient's get_price_history_bulk —
+normally a BarCache, so bars already on disk aren't re-fetched.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Optional
+
+from src.db import get_pending_outcomes, update_outcome_prices
+
+HORIZONS = {"price_1d": 1, "price_3d": 3, "price_7d": 7}
+
+
+@dataclass
+class BackfillReport:
+    pending: int = 0
+    tickers: int = 0
+    updated: int = 0                                 # outcomes with at least one new price
+    filled: dict[str, int] = field(default_factory=lambda: {f: 0 for f in HORIZONS})
+    errors: dict[str, Exception] = field(default_factory=dict)
+
+
+def horizon_prices(entry_day: str, bars, today: str) -> dict[str, Optional[float]]:
+    """Close N completed trading days after entry_day for each horizon (None if not reached yet)."""
+    after = sorted((b for b in bars if entry_day < b.date < today), key=lambda b: b.date)
+    return {f: after[n - 1].close if len(after) >= n else None for f, n in HORIZONS.items()}
+
+
+def backfill_outcomes(conn, history, today: Optional[date] = None) -> BackfillReport:
+    """Compute and store every pending horizon price. One history call per ticker."""
+    today = today or date.today()
+    today_s = today.isoformat()
+    report = BackfillReport()
+
+    by_ticker: dict[str, list[dict]] = {}
+    for row in get_pending_outcomes(conn):
+        if row["first_appeared_at"][:10] < today_s:
+            by_ticker.setdefault(row["ticker"], []).append(row)
+    report.pending = sum(len(rows) for rows in by_ticker.values())
+    report.tickers = len(by_ticker)
+
+    # Tickers needing the same lookback share one bulk request
+    by_days: dict[int, list[str]] = {}
+    for ticker, rows in by_ticker.items():
+        oldest = date.fromisoformat(rows[0]["first_appeared_at"][:10])
+        by_days.setdefault((today - oldest).days + 1, []).append(ticker)
+
+    updates = []
+    for days, tickers in by_days.items():
+        bars_by_ticker, errors = history.get_price_history_bulk(tickers, days=days, frequency="daily")
+        report.errors.update(errors)
+        for ticker, bars in bars_by_ticker.items():
+            for row in by_ticker[ticker]:
+                prices = horizon_prices(row["first_appeared_at"][:10], bars, today_s)
+                new = {f: p for f, p in prices.items() if p is not None and row[f] is None}
+                if not new:
+                    continue
+                for f in new:
+                    report.filled[f] += 1
+                updates.append((row["id"], new.get("price_1d"), new.get("price_3d"), new.get("price_7d")))
+
+    update_outcome_prices(conn, updates)
+    report.updated = len(updates)
+    return report
@@ -0,0 +1,114 @@
+"""
+VantaStonk — Signal table retention (spec §8.5)
+
+Keeps RETENTION_DAYS of granular history, then rolls up:
+
+- prompt_pulse_components → prompt_pulse_daily (per-ticker daily means)
+- social_snapshots        → social_daily (maintained on write; raw rows dropped)
+- ai_samples_raw          → response body dropped, tickers_extracted kept
+
+The job is incremental and idempotent: it only touches rows older than the
+cutoff that haven't been rolled up yet, so re-running it is a no-op. Work is
+committed one day (or one ai_samples_raw chunk) at a time, so no single
+write transaction holds the lock for long.
+
+Deleted rows free pages inside the SQLite file; the report counts those as
+reclaimed bytes. The file itself only shrinks with vacuum=True.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Optional
+
+from src.db import (
+    get_rollup_days, rollup_prompt_pulse_day, rollup_social_day, prune_ai_responses,
+)
+
+RETENTION_DAYS = 30
+AI_PRUNE_CHUNK = 500
+
+
+@dataclass
+class RetentionReport:
+    """What one retention run did."""
+    cutoff: str
+    components_rows_rolled: int = 0
+    components_days: list[str] = field(default_factory=list)
+    social_rows_rolled: int = 0
+    social_days: list[str] = field(default_factory=list)
+    ai_responses_pruned: int = 0
+    freed_bytes: int = 0          # pages moved to the freelist by this run
+    file_bytes_before: int = 0
+    file_bytes_after: int = 0
+
+    @property
+    def reclaimed_bytes(self) -> int:
+        """Space now reusable: freed pages, or the file shrink if it was vacuumed."""
+        return max(self.freed_bytes, self.file_bytes_before - self.file_bytes_after)
+
+
+def _free_bytes(conn) -> int:
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    return conn.execute("PRAGMA freelist_count").fetchone()[0] * page_size
+
+
+def _file_bytes(db_path: Optional[str]) -> int:
+    if not db_path:
+        return 0
+    return sum(p.stat().st_size for p in (Path(db_path), Path(f"{db_path}-wal")) if p.exists())
+
+
+def run_retention(
+    conn,
+    today: Optional[date] = None,
+    retention_days: int = RETENTION_DAYS,
+    ai_chunk: int = AI_PRUNE_CHUNK,
+    db_path: Optional[str] = None,
+    vacuum: bool = False,
+) -> RetentionReport:
+    """
+    Roll up and prune everything older than today - retention_days.
+    Pass db_path to include on-disk file sizes in the report.
+    """
+    today = today or date.today()
+    cutoff = (today - timedelta(days=retention_days)).isoformat()
+    report = RetentionReport(cutoff=cutoff, file_bytes_before=_file_bytes(db_path))
+    free_before = _free_bytes(conn)
+
+    for day in get_rollup_days(conn, "prompt_pulse_components", cutoff):
+        report.components_rows_rolled += rollup_prompt_pulse_day(conn, day)
+        report.components_days.append(day)
+
+    for day in get_rollup_days(conn, "social_snapshots", cutoff):
+        report.social_rows_rolled += rollup_social_day(conn, day)
+        report.social_days.append(day)
+
+    while True:
+        pruned = prune_ai_responses(conn, cutoff, limit=ai_chunk)
+        report.ai_responses_pruned += pruned
+        if pruned < ai_chunk:
+            break
+
+    report.freed_bytes = max(0, _free_bytes(conn) - free_before)
+    if vacuum:
+        conn.execute("VACUUM")
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    report.file_bytes_after = _file_bytes(db_path)
+    return report
+
+
+def format_report(report: RetentionReport) -> str:
+    lines = [
+        f"Retention cutoff: {report.cutoff}",
+        f"  prompt_pulse_components: {report.components_rows_rolled} rows → "
+        f"{len(report.components_days)} day(s) rolled up",
+        f"  social_snapshots:        {report.social_rows_rolled} rows → "
+        f"{len(report.social_days)} day(s) rolled up",
+        f"  ai_samples_raw:          {report.ai_responses_pruned} responses pruned",
+        f"  reclaimed: {report.reclaimed_bytes / 1024:,.1f} KiB",
+    ]
+    if report.file_bytes_before:
+        lines.append(f"  file size: {report.file_bytes_before / 1024:,.1f} KiB → "
+                     f"{report.file_bytes_after / 1024:,.1f} KiB")
+    return "\n".join(lines)
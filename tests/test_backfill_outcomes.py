@@ -0,0 +1,64 @@
+from datetime import date
+
+from src.db import init_db, get_connection, save_recommendation_outcome, update_outcome_price, get_outcome
+from src.integrations.schwab_client import PriceBar
+from src.workflows.backfill_outcomes import backfill_outcomes, horizon_prices
+
+TODAY = date(2026, 5, 15)
+DAYS = ["2026-05-04", "2026-05-05", "2026-05-06", "2026-05-07", "2026-05-08",
+        "2026-05-11", "2026-05-12", "2026-05-13", "2026-05-14", "2026-05-15"]
+
+
+def _bars(base):
+    return [PriceBar(date=d, open=0, high=0, low=0, close=base + i, volume=0) for i, d in enumerate(DAYS)]
+
+
+class FakeHistory:
+    def __init__(self, bars_by_ticker, fail=()):
+        self.bars_by_ticker = bars_by_ticker
+        self.fail = set(fail)
+        self.calls = []
+
+    def get_price_history_bulk(self, tickers, days=10, frequency="daily"):
+        self.calls.append((list(tickers), days))
+        bars = {t: self.bars_by_ticker[t] for t in tickers if t not in self.fail}
+        return bars, {t: RuntimeError("boom") for t in tickers if t in self.fail}
+
+
+def _setup(tmp_path):
+    db = tmp_path / "t.db"
+    init_db(str(db))
+    return get_connection(str(db))
+
+
+def test_horizon_prices_counts_trading_days_and_skips_today():
+    bars = _bars(100)
+    assert horizon_prices("2026-05-04", bars, "2026-05-15") == \
+        {"price_1d": 101, "price_3d": 103, "price_7d": 107}   # weekend skipped
+    # 2026-05-12 entry: only 05-13 and 05-14 are complete
+    assert horizon_prices("2026-05-12", bars, "2026-05-15") == \
+        {"price_1d": 107, "price_3d": None, "price_7d": None}
+
+
+def test_backfill_one_call_per_ticker_and_keeps_existing(tmp_path):
+    conn = _setup(tmp_path)
+    for ticker, entry in [("ABCD", "2026-05-04T06:00:00"), ("ABCD", "2026-05-12T06:00:00"),
+                          ("WXYZ", "2026-05-04T06:00:00"), ("FAIL", "2026-05-04T06:00:00")]:
+        save_recommendation_outcome(conn, ticker, "feeder", entry, 10.0, "premarket_quote", 0.7)
+    update_outcome_price(conn, "WXYZ", "2026-05-04T06:00:00", "feeder", "price_1d", 1.0)
+
+    history = FakeHistory({"ABCD": _bars(100), "WXYZ": _bars(200)}, fail=["FAIL"])
+    report = backfill_outcomes(conn, history, today=TODAY)
+
+    assert sorted(t for tickers, _ in history.calls for t in tickers) == ["ABCD", "FAIL", "WXYZ"]
+    assert report.pending == 4 and report.updated == 3 and "FAIL" in report.errors
+    assert report.filled == {"price_1d": 2, "price_3d": 2, "price_7d": 2}
+    old = get_outcome(conn, "ABCD", "2026-05-04T06:00:00", "feeder")
+    assert (old["price_1d"], old["price_3d"], old["price_7d"]) == (101, 103, 107)
+    recent = get_outcome(conn, "ABCD", "2026-05-12T06:00:00", "feeder")
+    assert (recent["price_1d"], recent["price_3d"]) == (107, None)
+    assert get_outcome(conn, "WXYZ", "2026-05-04T06:00:00", "feeder")["price_1d"] == 1.0
+
+    # Completed outcomes drop out of the pending set
+    again = backfill_outcomes(conn, FakeHistory({"ABCD": _bars(100)}, fail=["FAIL"]), today=TODAY)
+    assert again.pending == 2   # ABCD 05-12 + FAIL
@@ -0,0 +1,80 @@
+from datetime import date, datetime, timedelta
+
+from src.db import init_db, get_connection, get_bar_coverage
+from src.integrations.bar_cache import BarCache
+from src.integrations.schwab_client import PriceBar
+
+
+class FakeHistoryClient:
+    """Serves one bar per calendar day, oldest first, like Schwab's daily history."""
+
+    def __init__(self):
+        self.requests = []  # (tickers, days)
+
+    def get_price_history_bulk(self, tickers, days=10, frequency="daily"):
+        self.requests.append((list(tickers), days))
+        today = date.today()
+        out = {}
+        for t in tickers:
+            out[t] = [
+                PriceBar(date=(today - timedelta(days=n)).isoformat(),
+                         open=1.0, high=1.0, low=1.0, close=float(100 - n), volume=1000)
+                for n in range(days - 1, -1, -1)
+            ]
+        return out, {}
+
+
+def _setup(tmp_path):
+    db = tmp_path / "t.db"
+    init_db(str(db))
+    return get_connection(str(db))
+
+
+def test_first_call_fetches_then_serves_locally(tmp_path):
+    conn = _setup(tmp_path)
+    fake = FakeHistoryClient()
+    cache = BarCache(fake, conn)
+
+    first, _ = cache.get_price_history_bulk(["AAPL", "MSFT"], days=10)
+    second, _ = cache.get_price_history_bulk(["AAPL", "MSFT"], days=10)
+
+    assert len(fake.requests) == 1
+    assert cache.fetches == 2 and cache.hits == 2
+    assert [b.close for b in first["AAPL"]] == [b.close for b in second["AAPL"]]
+    assert first["AAPL"][-1].date == date.today().isoformat()
+
+
+def test_longer_range_fetches_from_range_start(tmp_path):
+    conn = _setup(tmp_path)
+    fake = FakeHistoryClient()
+    cache = BarCache(fake, conn)
+
+    cache.get_price_history("AAPL", days=10)
+    bars = cache.get_price_history("AAPL", days=30)
+
+    assert fake.requests[-1] == (["AAPL"], 31)
+    assert len(bars) == 31
+    cov = get_bar_coverage(conn, "AAPL", "daily")
+    assert cov["start_date"] == (date.today() - timedelta(days=30)).isoformat()
+
+
+def test_stale_tail_is_refreshed_from_last_covered_day(tmp_path):
+    conn = _setup(tmp_path)
+    fake = FakeHistoryClient()
+    cache = BarCache(fake, conn, tail_ttl=timedelta(hours=1))
+
+    cache.get_price_history("AAPL", days=10)
+    stale = (datetime.now() - timedelta(hours=2)).isoformat(timespec="seconds")
+    conn.execute("UPDATE price_bar_coverage SET end_date = ?, fetched_at = ?",
+                 ((date.today() - timedelta(days=2)).isoformat(), stale))
+    cache.get_price_history("AAPL", days=10)
+
+    assert fake.requests[-1] == (["AAPL"], 3)
+
+
+def test_minute_frequency_bypasses_cache(tmp_path):
+    conn = _setup(tmp_path)
+    fake = FakeHistoryClient()
+    cache = BarCache(fake, conn)
+    cache.get_price_history_bulk(["AAPL"], days=1, frequency="minute")
+    assert get_bar_coverage(conn, "AAPL", "minute") is None
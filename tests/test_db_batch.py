@@ -0,0 +1,88 @@
+import sqlite3
+
+import pytest
+
+from src.core.scoring import ScoreInputs, rank
+from src.db import (
+    init_db, get_connection, unit_of_work,
+    upsert_ticker, upsert_tickers, save_price_snapshots, save_scores, save_recommendations,
+    save_social_snapshots, save_prompt_pulse_components_bulk,
+    get_recent_components, save_ai_samples_raw, get_ai_samples_since,
+)
+
+
+def _setup(tmp_path):
+    db = tmp_path / "t.db"
+    init_db(str(db))
+    return str(db), get_connection(str(db))
+
+
+def test_bulk_writers_round_trip(tmp_path):
+    _, conn = _setup(tmp_path)
+    upsert_tickers(conn, ["AAPL", {"ticker": "MSFT", "sector": "tech"}])
+    save_price_snapshots(conn, [("AAPL", 190.0, 1000), ("MSFT", 410.0, 2000)])
+    ranked = rank([ScoreInputs(ticker=t, catalyst=0.5, prompt_pulse=0.5, freshness=0.5, peer=0.5,
+                               volume=0.5, macro=0.5) for t in ("AAPL", "MSFT")])
+    save_scores(conn, ranked)
+    save_recommendations(conn, [dict(ticker="AAPL", module="glance", category="momentum")])
+
+    assert conn.execute("SELECT sector FROM tickers WHERE ticker='MSFT'").fetchone()[0] == "tech"
+    assert conn.execute("SELECT COUNT(*) FROM price_snapshots").fetchone()[0] == 2
+    assert conn.execute("SELECT COUNT(*) FROM signal_scores").fetchone()[0] == 2
+    assert conn.execute("SELECT module FROM recommendations").fetchone()[0] == "glance"
+
+
+def test_bulk_signal_writers(tmp_path):
+    _, conn = _setup(tmp_path)
+    ts = "2026-05-15T06:00:00"
+    save_social_snapshots(conn, [(ts, "apewisdom", "ABCD", 10, None), (ts, "apewisdom", "WXYZ", 3, 0.2)])
+    save_prompt_pulse_components_bulk(conn, [("ABCD", ts, "premarket", 0.8, 0.4, 0.6, 0.64)])
+    save_ai_samples_raw(conn, [(ts, "grok", "p1", "prompt", "$ABCD", ["ABCD"], 0.01)])
+
+    assert conn.execute("SELECT COUNT(*) FROM social_snapshots").fetchone()[0] == 2
+    assert get_recent_components(conn, "ABCD")[0]["composite"] == 0.64
+    assert get_ai_samples_since(conn, ts)[0]["tickers_extracted"] == '["ABCD"]'
+
+
+def test_unit_of_work_commits_once_at_exit(tmp_path):
+    path, conn = _setup(tmp_path)
+    other = get_connection(path)
+    with unit_of_work(conn):
+        upsert_ticker(conn, "AAPL")
+        save_price_snapshots(conn, [("AAPL", 1.0, 1)])
+        # nothing visible to other connections until the block exits
+        assert other.execute("SELECT COUNT(*) FROM tickers").fetchone()[0] == 0
+    assert other.execute("SELECT COUNT(*) FROM price_snapshots").fetchone()[0] == 1
+
+
+def test_unit_of_work_rolls_back_on_error(tmp_path):
+    _, conn = _setup(tmp_path)
+    with pytest.raises(RuntimeError):
+        with unit_of_work(conn):
+            upsert_tickers(conn, ["AAPL", "MSFT"])
+            with unit_of_work(conn):
+                save_price_snapshots(conn, [("AAPL", 1.0, 1)])
+            raise RuntimeError("boom")
+    assert conn.execute("SELECT COUNT(*) FROM tickers").fetchone()[0] == 0
+    assert conn.execute("SELECT COUNT(*) FROM price_snapshots").fetchone()[0] == 0
+    # connection is usable and back to per-call commits
+    upsert_ticker(conn, "NVDA")
+    assert conn.execute("SELECT COUNT(*) FROM tickers").fetchone()[0] == 1
+
+
+def test_connection_profiles_apply_pragmas(tmp_path):
+    path, _ = _setup(tmp_path)
+    writer = get_connection(path, "scan_writer")
+    assert writer.execute("PRAGMA synchronous").fetchone()[0] == 1      # NORMAL
+    assert writer.execute("PRAGMA temp_store").fetchone()[0] == 2       # MEMORY
+    assert writer.execute("PRAGMA cache_size").fetchone()[0] == -16_000
+    assert get_connection(path, "bulk_backfill").execute("PRAGMA synchronous").fetchone()[0] == 0
+
+
+def test_reader_profile_is_read_only(tmp_path):
+    path, conn = _setup(tmp_path)
+    upsert_ticker(conn, "AAPL")
+    reader = get_connection(path, "reader")
+    assert reader.execute("SELECT COUNT(*) FROM tickers").fetchone()[0] == 1
+    with pytest.raises(sqlite3.OperationalError):
+        reader.execute("INSERT INTO tickers (ticker) VALUES ('MSFT')")
@@ -0,0 +1,87 @@
+import sqlite3
+
+import pytest
+
+import src.db as db
+from src.db import get_connection, init_db, open_db, migrate, schema_version, LATEST_VERSION
+
+
+def test_fresh_db_migrates_to_latest(tmp_path):
+    conn = open_db(str(tmp_path / "t.db"))
+    assert schema_version(conn) == LATEST_VERSION
+    indexes = {r["name"] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    assert "idx_social_source_ticker_time" in indexes
+    assert "idx_outcomes_pending" in indexes
+
+
+def test_current_db_applies_nothing(tmp_path):
+    path = str(tmp_path / "t.db")
+    init_db(path)
+    conn = get_connection(path)
+    assert migrate(conn) == []
+
+
+def test_legacy_db_without_version_upgrades_in_place(tmp_path):
+    """DBs built by the old init_db (schema.sql, user_version 0) keep their rows."""
+    path = str(tmp_path / "t.db")
+    conn = get_connection(path)
+    conn.executescript(open(db.SCHEMA_PATH).read())
+    conn.execute("INSERT INTO tickers (ticker) VALUES ('AAPL')")
+    conn.commit()
+    assert schema_version(conn) == 0
+
+    assert migrate(conn) == list(range(1, LATEST_VERSION + 1))
+    assert conn.execute("SELECT ticker FROM tickers").fetchone()[0] == "AAPL"
+
+
+def test_social_daily_backfilled_from_existing_snapshots(tmp_path):
+    path = str(tmp_path / "t.db")
+    conn = get_connection(path)
+    conn.executescript(open(db.SCHEMA_PATH).read())
+    conn.executemany(
+        "INSERT INTO social_snapshots (captured_at, source, ticker, mentions_count) VALUES (?, ?, ?, ?)",
+        [("2026-05-14T06:00:00", "apewisdom", "ABCD", 10), ("2026-05-14T18:00:00", "apewisdom", "ABCD", 30)],
+    )
+    conn.commit()
+    migrate(conn)
+    row = conn.execute("SELECT * FROM social_daily").fetchone()
+    assert (row["day"], row["snapshots"], row["mentions_sum"], row["last_mentions"]) == ("2026-05-14", 2, 40, 30)
+
+
+def test_ai_samples_converted_to_interned_compressed_rows(tmp_path):
+    path = str(tmp_path / "t.db")
+    conn = get_connection(path)
+    conn.executescript(open(db.SCHEMA_PATH).read())
+    conn.executemany("""
+        INSERT INTO ai_samples_raw (captured_at, model, prompt_id, prompt_text, response_text, tickers_extracted)
+        VALUES (?, ?, 'p1', 'Which small caps?', ?, '["ABCD"]')
+    """, [("2026-05-14T06:00:00", "grok", "$ABCD looks strong"), ("2026-05-14T05:00:00", "gpt-5", ""),
+          ("2026-05-15T06:00:00", "grok", "$ABCD again")])
+    conn.commit()
+    migrate(conn)
+
+    assert conn.execute("SELECT COUNT(*) FROM ai_prompts").fetchone()[0] == 1
+    columns = {r["name"] for r in conn.execute("PRAGMA table_info(ai_samples_raw)")}
+    assert "response_z" in columns and "response_text" not in columns
+    rows = db.get_ai_samples_since(conn, "2026-05-01")
+    assert [(r["model"], r["prompt_text"], r["response_text"]) for r in rows] == [
+        ("grok", "Which small caps?", "$ABCD again"),
+        ("grok", "Which small caps?", "$ABCD looks strong"),
+        ("gpt-5", "Which small caps?", ""),   # already pruned: stays empty
+    ]
+
+
+def test_failed_step_rolls_back_and_keeps_version(tmp_path, monkeypatch):
+    conn = open_db(str(tmp_path / "t.db"))
+
+    def bad_step(c):
+        c.execute("CREATE TABLE half_done (id INTEGER)")
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(db, "MIGRATIONS", db.MIGRATIONS + [(LATEST_VERSION + 1, "bad", bad_step)])
+    monkeypatch.setattr(db, "LATEST_VERSION", LATEST_VERSION + 1)
+    with pytest.raises(RuntimeError):
+        migrate(conn)
+    assert schema_version(conn) == LATEST_VERSION
+    with pytest.raises(sqlite3.OperationalError):
+        conn.execute("SELECT * FROM half_done")
@@ -4,7 +4,8 @@ from src.db import (
     init_db, get_connection,
     save_prompt_pulse_components, get_recent_components,
     save_ai_sample_raw, get_ai_samples_since,
-    save_social_snapshot, get_mentions_history,
+    save_social_snapshot, save_social_snapshots, get_mentions_history,
+    get_social_baseline, get_velocity_inputs,
     save_recommendation_outcome, get_outcome,
     update_outcome_price, mark_outcome_dropped,
 )
@@ -67,6 +68,28 @@ def test_save_and_query_social_snapshot(tmp_path):
     assert hist[0]["mentions_count"] == 42
 
 
+def test_social_daily_tracks_snapshots(tmp_path):
+    conn = _setup(tmp_path)
+    rows = []
+    for day in range(8, 15):   # 7 prior days, two snapshots each
+        rows += [(f"2026-05-{day:02d}T06:00:00", "apewisdom", "ABCD", 10, None),
+                 (f"2026-05-{day:02d}T18:00:00", "apewisdom", "ABCD", 30, None)]
+    rows += [("2026-05-15T06:00:00", "apewisdom", "ABCD", 50, None),
+             ("2026-05-15T06:00:00", "apewisdom", "WXYZ", 7, None)]
+    save_social_snapshots(conn, rows)
+    # A later same-day snapshot (and a re-save of an old one) updates the day's aggregate
+    save_social_snapshot(conn, "2026-05-15T09:00:00", "apewisdom", "ABCD", 80)
+    save_social_snapshot(conn, "2026-05-15T06:00:00", "apewisdom", "ABCD", 60)
+
+    assert get_social_baseline(conn, "ABCD", as_of="2026-05-15") == 20.0
+    assert get_social_baseline(conn, "ABCD", as_of="2026-05-08") is None
+    inputs = get_velocity_inputs(conn, as_of="2026-05-15")
+    assert inputs["ABCD"] == {"mentions_today": 80, "mentions_7d_avg": 20.0}
+    assert inputs["WXYZ"] == {"mentions_today": 7, "mentions_7d_avg": None}
+    day = conn.execute("SELECT * FROM social_daily WHERE ticker='ABCD' AND day='2026-05-15'").fetchone()
+    assert (day["snapshots"], day["mentions_sum"]) == (2, 140)
+
+
 def test_outcome_lifecycle(tmp_path):
     conn = _setup(tmp_path)
     now = datetime.now().isoformat(timespec="seconds")
@@ -0,0 +1,76 @@
+import pytest
+
+from src.db import (
+    init_db, get_connection,
+    upsert_tickers, save_price_snapshots, save_social_snapshots, save_prompt_pulse_components_bulk,
+    save_recommendation_outcome, update_outcome_price, get_outcome, get_social_baseline,
+)
+from src.db_sync import export_changes, import_changes, peer_watermark
+
+
+def _db(tmp_path, name):
+    path = tmp_path / f"{name}.db"
+    init_db(str(path))
+    return get_connection(str(path))
+
+
+def _count(conn, table):
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_export_import_round_trip_is_incremental_and_idempotent(tmp_path):
+    laptop, desktop = _db(tmp_path, "laptop"), _db(tmp_path, "desktop")
+    upsert_tickers(laptop, ["AAPL", "MSFT"])
+    save_price_snapshots(laptop, [("AAPL", 190.0, 1000), ("MSFT", 410.0, 2000)])
+    save_social_snapshots(laptop, [("2026-05-14T06:00:00", "apewisdom", "AAPL", 10, None)])
+    save_recommendation_outcome(laptop, "AAPL", "feeder", "2026-05-14T06:00:00", 190.0, "premarket_quote", 0.7)
+
+    first = tmp_path / "1.json.gz"
+    stats = export_changes(laptop, "desktop", str(first))
+    assert stats["tickers"] == 2 and stats["price_snapshots"] == 2
+    import_changes(desktop, str(first))
+    import_changes(desktop, str(first))   # re-applying is a no-op
+    assert _count(desktop, "tickers") == 2 and _count(desktop, "price_snapshots") == 2
+    assert get_social_baseline(desktop, "AAPL", as_of="2026-05-15") == 10.0   # social_daily rebuilt
+
+    # Only rows changed since the last export travel next time
+    update_outcome_price(laptop, "AAPL", "2026-05-14T06:00:00", "feeder", "price_1d", 195.0)
+    second = tmp_path / "2.json.gz"
+    stats = export_changes(laptop, "desktop", str(second))
+    assert {k: v for k, v in stats.items() if k != "bytes"} == {"recommendation_outcomes": 1}
+    import_changes(desktop, str(second))
+    assert get_outcome(desktop, "AAPL", "2026-05-14T06:00:00", "feeder")["price_1d"] == 195.0
+
+
+def test_imported_rows_are_not_echoed_back(tmp_path):
+    laptop, desktop = _db(tmp_path, "laptop"), _db(tmp_path, "desktop")
+    save_prompt_pulse_components_bulk(laptop, [("ABCD", "2026-05-14T06:00:00", "premarket", 0.8, 0.4, 0.6, 0.64)])
+    export_changes(laptop, "desktop", str(tmp_path / "a.json.gz"))
+    import_changes(desktop, str(tmp_path / "a.json.gz"))
+
+    stats = export_changes(desktop, "laptop", str(tmp_path / "b.json.gz"))
+    assert set(stats) == {"bytes"}
+
+
+def test_repeated_exports_without_changes_keep_the_watermark(tmp_path):
+    laptop = _db(tmp_path, "laptop")
+    upsert_tickers(laptop, ["AAPL"])
+    for name in ("1", "2", "3"):
+        stats = export_changes(laptop, "desktop", str(tmp_path / f"{name}.json.gz"))
+    assert set(stats) == {"bytes"}
+    assert _count(laptop, "sync_log") == 0
+    assert peer_watermark(laptop, "desktop") > 0
+
+    # New rows after the log emptied still travel, and nothing old is resent
+    upsert_tickers(laptop, ["MSFT"])
+    stats = export_changes(laptop, "desktop", str(tmp_path / "4.json.gz"))
+    assert {k: v for k, v in stats.items() if k != "bytes"} == {"tickers": 1}
+
+
+def test_import_rejects_schema_mismatch(tmp_path):
+    laptop, desktop = _db(tmp_path, "laptop"), _db(tmp_path, "desktop")
+    path = tmp_path / "c.json.gz"
+    export_changes(laptop, "desktop", str(path))
+    desktop.execute("PRAGMA user_version = 1")
+    with pytest.raises(ValueError):
+        import_changes(desktop, str(path))
@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from src.core.scoring import ScoreInputs, rank
+from src.db import init_db, get_connection
+from src.db_writer import (
+    DbWriter, TickerRecord, PriceSnapshotRecord, ScoreRecord, RecommendationRecord,
+    ComponentRecord, AiSampleRecord, SocialSnapshotRecord,
+)
+
+
+def _setup(tmp_path):
+    db = tmp_path / "t.db"
+    init_db(str(db))
+    return str(db), get_connection(str(db))
+
+
+def _count(conn, table):
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_flush_commits_all_record_types(tmp_path):
+    path, conn = _setup(tmp_path)
+    ts = "2026-05-15T06:00:00"
+    ranked = rank([ScoreInputs(ticker="AAPL", catalyst=0.5, prompt_pulse=0.5, freshness=0.5, peer=0.5,
+                               volume=0.5, macro=0.5)])
+    with DbWriter(path, max_delay=60) as writer:
+        # Snapshot submitted before its ticker: the batch still writes tickers first
+        writer.submit(PriceSnapshotRecord("AAPL", 190.0, 1000))
+        writer.submit_many([
+            TickerRecord("AAPL", sector="tech"),
+            ScoreRecord(ranked[0]),
+            RecommendationRecord("AAPL", "glance", category="momentum"),
+            ComponentRecord("AAPL", ts, "premarket", 0.8, None, 0.4, 0.6),
+            AiSampleRecord(ts, "grok", "p1", "prompt", "$AAPL", ["AAPL"], 0.01),
+            SocialSnapshotRecord(ts, "apewisdom", "AAPL", 12),
+        ])
+        assert _count(conn, "price_snapshots") == 0   # max_delay not reached, nothing written yet
+        writer.flush()
+        for table in ("tickers", "price_snapshots", "signal_scores", "recommendations",
+                      "prompt_pulse_components", "ai_samples_raw", "social_snapshots", "social_daily"):
+            assert _count(conn, table) == 1, table
+        assert writer.batches == 1 and writer.written == 7
+
+
+def test_batches_by_size_and_time(tmp_path):
+    path, conn = _setup(tmp_path)
+    with DbWriter(path, batch_size=3, max_delay=0.05) as writer:
+        writer.submit_many(TickerRecord(f"T{i}") for i in range(7))
+        deadline = time.monotonic() + 2
+        while writer.written < 7 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        # two full batches by size, the remainder by time — no flush needed
+        assert writer.written == 7 and writer.batches == 3
+    assert _count(conn, "tickers") == 7
+
+
+def test_flush_raises_write_errors_once(tmp_path):
+    path, conn = _setup(tmp_path)
+    writer = DbWriter(path)
+    writer.submit(PriceSnapshotRecord("NOPE", 1.0))   # no tickers row → foreign key failure
+    with pytest.raises(Exception):
+        writer.flush()
+    writer.submit(TickerRecord("AAPL"))
+    writer.flush()
+    writer.close()
+    assert _count(conn, "tickers") == 1
+    with pytest.raises(RuntimeError):
+        writer.submit(TickerRecord("MSFT"))
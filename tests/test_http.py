@@ -0,0 +1,44 @@
+import httpx
+
+from src.integrations import http
+
+
+def _echo(request):
+    return httpx.Response(200, content=b"x" * 1000, headers={"Content-Length": "1000"})
+
+
+def test_client_for_shares_one_client_per_host():
+    a = http.client_for("example.invalid")
+    assert http.client_for("example.invalid") is a
+    assert http.client_for("other.invalid") is not a
+    a.close()
+    assert http.client_for("example.invalid") is not a     # closed clients are replaced
+    http.close_all()
+
+
+def test_metrics_count_latency_and_bytes_per_host():
+    http.reset_stats()
+    client = http.new_client("api.example.test", transport=httpx.MockTransport(_echo))
+    for _ in range(3):
+        assert client.post("https://api.example.test/v1", json={"q": "hi"}).content == b"x" * 1000
+
+    s = http.stats()["api.example.test"]
+    assert s["requests"] == 3 and s["errors"] == 0
+    assert s["bytes_received"] == 3000
+    assert s["bytes_sent"] == 3 * len(b'{"q":"hi"}')
+    assert s["mean_latency_ms"] >= 0
+    assert "api.example.test" in http.format_stats()
+
+
+def test_transport_errors_are_counted():
+    def boom(request):
+        raise httpx.ConnectError("refused", request=request)
+
+    http.reset_stats()
+    client = http.new_client("down.example.test", transport=httpx.MockTransport(boom))
+    try:
+        client.get("https://down.example.test/")
+    except httpx.ConnectError:
+        pass
+    assert http.stats()["down.example.test"]["errors"] == 1
+    assert http.stats()["down.example.test"]["requests"] == 0
@@ -0,0 +1,73 @@
+import math
+
+import numpy as np
+import pytest
+
+from src.db import init_db, get_connection
+from src.signals.composite import compose_with_fallback
+from src.signals.pulse_engine import PromptPulseEngine
+
+
+def _setup(tmp_path):
+    db = tmp_path / "t.db"
+    init_db(str(db))
+    return get_connection(str(db))
+
+
+def test_matches_per_ticker_compose_with_fallback():
+    rng = np.random.default_rng(4)
+    tickers = [f"T{i:04d}" for i in range(1000)]
+    ai = {t: (None if rng.random() < 0.2 else float(rng.random())) for t in tickers[:800]}
+    social = {t: float(rng.choice([0.0, 0.3, 0.6, 0.9, 1.0])) for t in tickers[200:]}
+    volume = rng.choice([0.0, 0.3, 0.6, 0.85, 1.0, np.nan], size=len(tickers))
+
+    engine = PromptPulseEngine(tickers)
+    engine.set_component("ai_sampling", ai)
+    engine.set_component("social_velocity", social)
+    engine.set_component("volume_anomaly", volume, tickers=tickers)
+    frame = engine.compute()
+
+    expected = [
+        compose_with_fallback(ai.get(t), social.get(t), None if math.isnan(v) else float(v))
+        for t, v in zip(tickers, volume)
+    ]
+    assert frame.tickers == tickers
+    assert frame.composite.tolist() == expected
+
+
+def test_universe_includes_candidates_surfaced_by_components():
+    engine = PromptPulseEngine(["CORE", "FEED"])
+    engine.set_component("ai_sampling", {"NEWAI": 1.0, "CORE": 0.2})
+    engine.set_component("social_velocity", {"NEWSOC": 0.9})
+    frame = engine.compute()
+    assert frame.tickers == ["CORE", "FEED", "NEWAI", "NEWSOC"]
+    assert frame.scores()["FEED"] == 0.5                     # nothing known → all neutral
+    assert frame.top(1) == [("NEWAI", 0.75)]
+
+
+def test_write_stores_every_row_with_nulls_for_missing(tmp_path):
+    conn = _setup(tmp_path)
+    engine = PromptPulseEngine(["AAA", "BBB"])
+    engine.set_component("ai_sampling", {"AAA": 0.8, "BBB": None})
+    engine.set_component("volume_anomaly", [0.6, 1.0], tickers=["AAA", "BBB"])
+    engine.write(conn, "2026-10-17T06:00:00", "premarket")
+
+    rows = [tuple(r) for r in conn.execute("""
+        SELECT ticker, scan_type, ai_sampling, social_velocity, volume_anomaly, composite
+        FROM prompt_pulse_components ORDER BY ticker
+    """)]
+    assert rows == [
+        ("AAA", "premarket", 0.8, None, 0.6, compose_with_fallback(0.8, None, 0.6)),
+        ("BBB", "premarket", None, None, 1.0, compose_with_fallback(None, None, 1.0)),
+    ]
+    assert not conn.in_transaction
+
+
+def test_rejects_bad_components():
+    engine = PromptPulseEngine()
+    with pytest.raises(ValueError):
+        engine.set_component("sentiment", {"AAA": 0.1})
+    with pytest.raises(ValueError):
+        engine.set_component("ai_sampling", [0.1, 0.2], tickers=["AAA"])
+    with pytest.raises(ValueError, match="tickers required"):
+        engine.set_component("ai_sampling", np.array([0.1, 0.2]))
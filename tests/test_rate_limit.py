@@ -0,0 +1,110 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from src.integrations.rate_limit import AdaptiveRateLimiter, parse_retry_after
+
+
+class FakeResponse:
+    def __init__(self, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def test_parse_retry_after_seconds_and_date():
+    assert parse_retry_after("7") == 7.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("garbage") is None
+    now = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    when = format_datetime(now + timedelta(seconds=30), usegmt=True)
+    assert parse_retry_after(when, now=now) == 30.0
+
+
+def test_token_bucket_enforces_rate():
+    fc = FakeClock()
+    limiter = AdaptiveRateLimiter(rate_per_minute=60, burst=2, clock=fc.clock, sleep=fc.sleep)
+    for _ in range(5):
+        limiter.call(lambda: FakeResponse())
+    # 2 burst tokens free, then 1/sec
+    assert fc.now == 3.0
+    assert limiter.stats()["token_wait_seconds"] == 3.0
+
+
+def test_429_retries_with_retry_after_and_halves_concurrency():
+    fc = FakeClock()
+    limiter = AdaptiveRateLimiter(rate_per_minute=6000, initial_concurrency=8,
+                                  clock=fc.clock, sleep=fc.sleep)
+    responses = [FakeResponse(429, {"Retry-After": "2"}), FakeResponse(200)]
+    resp = limiter.call(lambda: responses.pop(0))
+    assert resp.status_code == 200
+    stats = limiter.stats()
+    assert stats["throttled"] == 1 and stats["retries"] == 1
+    assert stats["concurrency"] == 4
+    assert 2.0 <= stats["backoff_seconds"] <= 3.0
+
+
+def test_gives_up_after_max_retries():
+    fc = FakeClock()
+    limiter = AdaptiveRateLimiter(rate_per_minute=6000, max_retries=2, clock=fc.clock, sleep=fc.sleep)
+    calls = []
+    resp = limiter.call(lambda: calls.append(1) or FakeResponse(429))
+    assert resp.status_code == 429
+    assert len(calls) == 3
+
+
+def test_concurrency_grows_after_clean_streak():
+    limiter = AdaptiveRateLimiter(rate_per_minute=60_000, initial_concurrency=2,
+                                  max_concurrency=3, increase_after=5)
+    for _ in range(20):
+        limiter.call(lambda: FakeResponse())
+    assert limiter.concurrency == 3
+
+
+def test_slots_cap_in_flight_calls():
+    limiter = AdaptiveRateLimiter(rate_per_minute=60_000, initial_concurrency=2, increase_after=1000)
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def slow():
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        time.sleep(0.02)
+        with lock:
+            in_flight.pop()
+        return FakeResponse()
+
+    threads = [threading.Thread(target=limiter.call, args=(slow,)) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert max(peak) == 2
+
+
+def test_async_call_retries():
+    limiter = AdaptiveRateLimiter(rate_per_minute=60_000)
+    responses = [FakeResponse(429, {"Retry-After": "0"}), FakeResponse(200)]
+
+    async def fn():
+        return responses.pop(0)
+
+    resp = asyncio.run(limiter.call_async(fn))
+    assert resp.status_code == 200
+    assert limiter.stats()["retries"] == 1
@@ -0,0 +1,83 @@
+import random
+from datetime import date
+
+import pytest
+
+from src.db import (
+    init_db, get_connection,
+    save_prompt_pulse_components_bulk, save_social_snapshots, save_ai_samples_raw,
+    get_component_history, get_social_history, get_social_baseline, get_ai_samples_since,
+)
+from src.workflows.retention import run_retention
+
+TODAY = date(2026, 6, 20)   # cutoff = 2026-05-21
+
+
+def _setup(tmp_path):
+    db = tmp_path / "t.db"
+    init_db(str(db))
+    return str(db), get_connection(str(db))
+
+
+def _incompressible(n):
+    rng = random.Random(0)
+    return "".join(rng.choice("ABCDEFGHIJKLMNOPQRSTUVWXYZ $,.") for _ in range(n))
+
+
+def _seed(conn):
+    save_prompt_pulse_components_bulk(conn, [
+        ("ABCD", "2026-05-14T06:00:00", "premarket", 0.8, None, 0.4, 0.6),
+        ("ABCD", "2026-05-14T16:00:00", "postclose", 0.4, 0.2, 0.2, 0.4),
+        ("ABCD", "2026-06-19T06:00:00", "premarket", 0.5, 0.5, 0.5, 0.5),
+    ])
+    save_social_snapshots(conn, [
+        ("2026-05-14T06:00:00", "apewisdom", "ABCD", 10, None),
+        ("2026-05-14T18:00:00", "apewisdom", "ABCD", 30, None),
+        ("2026-06-19T06:00:00", "apewisdom", "ABCD", 50, None),
+    ])
+    save_ai_samples_raw(conn, [
+        ("2026-05-14T06:00:00", "grok", "p1", "prompt", _incompressible(40_000), ["ABCD"], 0.01),
+        ("2026-06-19T06:00:00", "grok", "p1", "prompt", "fresh $ABCD", ["ABCD"], 0.01),
+    ])
+
+
+def test_rollup_folds_old_rows_and_keeps_recent(tmp_path):
+    path, conn = _setup(tmp_path)
+    _seed(conn)
+    report = run_retention(conn, today=TODAY, ai_chunk=1, db_path=path)
+
+    assert report.components_rows_rolled == 2 and report.components_days == ["2026-05-14"]
+    assert report.social_rows_rolled == 2
+    assert report.ai_responses_pruned == 1
+    assert report.reclaimed_bytes > 0
+
+    day = conn.execute("SELECT * FROM prompt_pulse_daily").fetchone()
+    assert day["scans"] == 2
+    assert day["ai_sampling"] == pytest.approx(0.6)
+    assert day["social_velocity"] == 0.2   # NULL scan ignored in the mean
+    assert conn.execute("SELECT COUNT(*) FROM prompt_pulse_components").fetchone()[0] == 1
+    ai = get_ai_samples_since(conn, "2026-01-01")
+    assert [(r["response_text"], r["tickers_extracted"]) for r in ai] == \
+        [("fresh $ABCD", '["ABCD"]'), ("", '["ABCD"]')]
+
+
+def test_rollup_is_idempotent(tmp_path):
+    _, conn = _setup(tmp_path)
+    _seed(conn)
+    run_retention(conn, today=TODAY)
+    again = run_retention(conn, today=TODAY)
+    assert (again.components_rows_rolled, again.social_rows_rolled, again.ai_responses_pruned) == (0, 0, 0)
+    assert conn.execute("SELECT scans FROM prompt_pulse_daily").fetchone()[0] == 2
+
+
+def test_history_unions_raw_and_rolled_up(tmp_path):
+    _, conn = _setup(tmp_path)
+    _seed(conn)
+    run_retention(conn, today=TODAY)
+
+    comps = get_component_history(conn, "ABCD", since="2026-05-01")
+    assert [(c["granularity"], c["composite"]) for c in comps] == [("scan", 0.5), ("day", 0.5)]
+    social = get_social_history(conn, "ABCD", since="2026-05-01")
+    assert [(s["granularity"], s["mentions"]) for s in social] == [("scan", 50.0), ("day", 20.0)]
+    # Baselines read social_daily, so they survive the raw rows being dropped
+    assert get_social_baseline(conn, "ABCD", as_of="2026-05-15") == 20.0
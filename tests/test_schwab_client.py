@@ -0,0 +1,177 @@
+import asyncio
+import time
+from datetime import datetime
+
+from src.integrations.rate_limit import AdaptiveRateLimiter
+from src.integrations.schwab_client import (
+    SchwabClient, AsyncSchwabClient, PriceBar, prices_5d_from_bars,
+)
+
+
+def _fast_limiter():
+    return AdaptiveRateLimiter(rate_per_minute=60_000, initial_concurrency=16)
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self._payload = payload
+        self.status_code = status_code
+        self.headers = {}
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+def _candles(closes):
+    base = int(datetime(2026, 5, 1).timestamp() * 1000)
+    return {"candles": [
+        {"datetime": base + i * 86_400_000, "open": c, "high": c, "low": c, "close": c, "volume": 100}
+        for i, c in enumerate(closes)
+    ]}
+
+
+class FakeSchwab:
+    def __init__(self, closes_by_ticker, delay=0.0):
+        self.closes_by_ticker = closes_by_ticker
+        self.delay = delay
+        self.calls = []
+
+    def get_price_history_every_day(self, ticker, start_datetime=None, need_previous_close=None):
+        self.calls.append(ticker)
+        time.sleep(self.delay)
+        if ticker not in self.closes_by_ticker:
+            return FakeResponse({}, status_code=404)
+        return FakeResponse(_candles(self.closes_by_ticker[ticker]))
+
+
+def _client(fake, max_workers=4, quotes_chunk_size=500):
+    c = SchwabClient(max_workers=max_workers, quotes_chunk_size=quotes_chunk_size,
+                     limiter=_fast_limiter())
+    c._client = fake
+    return c
+
+
+class FakeQuotes:
+    def __init__(self, fail_symbol=None):
+        self.fail_symbol = fail_symbol
+        self.requests = []
+
+    def get_quotes(self, symbols, fields=None):
+        self.requests.append((list(symbols), fields))
+        if self.fail_symbol in symbols:
+            return FakeResponse({}, status_code=500)
+        return FakeResponse({s: {"quote": {"lastPrice": 1.0, "totalVolume": 10}} for s in symbols})
+
+
+def test_prices_5d_from_bars():
+    bars = [PriceBar(date=str(i), open=0, high=0, low=0, close=float(i), volume=0) for i in range(10)]
+    assert prices_5d_from_bars(bars) == (9.0, 4.0)
+    assert prices_5d_from_bars([]) == (None, None)
+
+
+def test_bulk_history_preserves_order_and_collects_errors():
+    fake = FakeSchwab({"AAPL": [1, 2, 3], "MSFT": [4, 5], "NVDA": [6]})
+    bars, errors = _client(fake).get_price_history_bulk(["NVDA", "BAD", "AAPL", "MSFT", "AAPL"])
+    assert list(bars) == ["NVDA", "AAPL", "MSFT"]
+    assert [b.close for b in bars["AAPL"]] == [1, 2, 3]
+    assert list(errors) == ["BAD"]
+    assert sorted(fake.calls) == ["AAPL", "BAD", "MSFT", "NVDA"]  # deduped
+
+
+def test_bulk_history_runs_concurrently():
+    tickers = [f"T{i}" for i in range(8)]
+    fake = FakeSchwab({t: [1.0] for t in tickers}, delay=0.05)
+    start = time.perf_counter()
+    bars, errors = _client(fake, max_workers=8).get_price_history_bulk(tickers)
+    elapsed = time.perf_counter() - start
+    assert len(bars) == 8 and not errors
+    assert elapsed < 0.05 * 8 / 2
+
+
+def test_get_quotes_chunks_and_selects_quote_fields():
+    fake = FakeQuotes()
+    symbols = [f"S{i}" for i in range(25)]
+    quotes = _client(fake, quotes_chunk_size=10).get_quotes(symbols)
+    assert list(quotes) == symbols
+    assert sorted(len(req[0]) for req in fake.requests) == [5, 10, 10]
+    assert all([f.value for f in req[1]] == ["quote"] for req in fake.requests)
+
+
+def test_get_quotes_returns_partial_results_on_chunk_failure():
+    fake = FakeQuotes(fail_symbol="S12")
+    client = _client(fake, quotes_chunk_size=10)
+    quotes = client.get_quotes([f"S{i}" for i in range(25)])
+    assert len(quotes) == 15
+    assert "S12" not in quotes and "S24" in quotes
+    assert sorted(client.last_quote_errors) == sorted(f"S{i}" for i in range(10, 20))
+
+
+# --- AsyncSchwabClient ---
+
+class FakeAsyncSchwab:
+    def __init__(self, closes_by_ticker, delay=0.0):
+        self.closes_by_ticker = closes_by_ticker
+        self.delay = delay
+        self.account_lookups = 0
+
+    async def get_price_history_every_day(self, ticker, start_datetime=None, need_previous_close=None):
+        await asyncio.sleep(self.delay)
+        if ticker not in self.closes_by_ticker:
+            return FakeResponse({}, status_code=404)
+        return FakeResponse(_candles(self.closes_by_ticker[ticker]))
+
+    async def get_quotes(self, tickers, fields=None):
+        await asyncio.sleep(self.delay)
+        return FakeResponse({t: {"quote": {"lastPrice": 10.0, "totalVolume": 500}} for t in tickers})
+
+    async def get_account_numbers(self):
+        self.account_lookups += 1
+        await asyncio.sleep(self.delay)
+        return FakeResponse([{"hashValue": "abc"}])
+
+    async def get_account(self, account_hash, fields=None):
+        await asyncio.sleep(self.delay)
+        return FakeResponse({"securitiesAccount": {
+            "positions": [{"instrument": {"symbol": "AAPL"}, "longQuantity": 10,
+                           "averagePrice": 100.0, "marketValue": 1100.0}],
+            "currentBalances": {"liquidationValue": 5000.0},
+        }})
+
+
+def test_async_client_matches_sync_outputs():
+    fake = FakeAsyncSchwab({"AAPL": [1, 2, 3, 4, 5, 6, 7]})
+    client = AsyncSchwabClient(limiter=_fast_limiter())
+    client._client = fake
+
+    async def run():
+        return await asyncio.gather(
+            client.get_quotes(["AAPL"]),
+            client.get_positions(),
+            client.get_account_summary(),
+            client.get_5day_prices("AAPL"),
+        )
+
+    quotes, positions, summary, prices = asyncio.run(run())
+    assert quotes["AAPL"].last_price == 10.0
+    assert positions[0].ticker == "AAPL" and positions[0].current_price == 110.0
+    assert summary["account_value"] == 5000.0
+    assert prices == (7, 2)
+    assert fake.account_lookups == 1  # concurrent callers share one lookup
+
+
+def test_async_bulk_history_overlaps_requests():
+    tickers = [f"T{i}" for i in range(10)]
+    fake = FakeAsyncSchwab({t: [1.0] for t in tickers[:-1]}, delay=0.05)
+    client = AsyncSchwabClient(max_concurrency=10, limiter=_fast_limiter())
+    client._client = fake
+
+    start = time.perf_counter()
+    bars, errors = asyncio.run(client.get_price_history_bulk(tickers))
+    elapsed = time.perf_counter() - start
+    assert list(bars) == tickers[:-1]
+    assert list(errors) == ["T9"]
+    assert elapsed < 0.05 * 10 / 2
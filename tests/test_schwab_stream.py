@@ -0,0 +1,68 @@
+import asyncio
+import json
+from pathlib import Path
+
+from src.integrations.schwab_stream import (
+    QuoteStreamer, QuoteTable, ReplayStreamClient, replay_benchmark, streaming_symbols,
+)
+
+FIX = Path(__file__).parent / "fixtures/schwab_stream/level_one_ticks.jsonl"
+
+
+def test_streaming_symbols_union():
+    assert streaming_symbols(["aapl", "MSOX"], ["MSOX", "RKLB"], ["AAPL", " xyz "]) == [
+        "AAPL", "MSOX", "RKLB", "XYZ",
+    ]
+
+
+def test_table_merges_deltas():
+    table = QuoteTable()
+    table.apply_message({"content": [{"key": "AAPL", "LAST_PRICE": 10.0, "BID_PRICE": 9.9, "TOTAL_VOLUME": 5}]})
+    table.apply_message({"content": [{"key": "AAPL", "LAST_PRICE": 10.5}]})
+    q = table.get("AAPL")
+    assert q.last_price == 10.5
+    assert q.bid_price == 9.9
+    assert q.volume == 5
+
+
+def test_replay_populates_table_for_subscribed_symbols_only():
+    streamer = QuoteStreamer(ReplayStreamClient(str(FIX)))
+    asyncio.run(streamer.run(["AAPL", "MSOX"]))
+
+    quotes = streamer.table.get_quotes(["AAPL", "MSOX", "NVDA"])
+    assert set(quotes) == {"AAPL", "MSOX"}
+    assert quotes["AAPL"].last_price == 300.02
+    assert quotes["AAPL"].ask_price == 300.1
+    assert quotes["AAPL"].bid_price == 299.8
+    assert quotes["MSOX"].volume == 361000
+    assert streamer.messages == 3  # NVDA-only message filtered out
+
+
+def test_record_then_replay_roundtrip(tmp_path):
+    out = tmp_path / "ticks.jsonl"
+    streamer = QuoteStreamer(ReplayStreamClient(str(FIX)), record_path=str(out))
+    asyncio.run(streamer.run(["AAPL"]))
+    streamer.close()
+
+    recorded = [json.loads(l) for l in out.read_text().splitlines()]
+    assert len(recorded) == 3
+    again = QuoteStreamer(ReplayStreamClient(str(out)))
+    asyncio.run(again.run(["AAPL"]))
+    assert again.table.get("AAPL") == streamer.table.get("AAPL")
+
+
+def test_replay_benchmark_reports_throughput():
+    stats = replay_benchmark(str(FIX), ["AAPL", "MSOX", "NVDA"])
+    assert stats["messages"] == 4
+    assert stats["updates"] == 6
+    assert stats["symbols"] == 3
+
+
+def test_close_joins_stream_thread_before_closing_record(tmp_path):
+    out = tmp_path / "ticks.jsonl"
+    streamer = QuoteStreamer(ReplayStreamClient(str(FIX), speed=1.0), record_path=str(out))
+    thread = streamer.run_in_thread(["AAPL", "MSOX"])
+    streamer.close(timeout=5.0)
+
+    assert not thread.is_alive()
+    assert all(json.loads(l) for l in out.read_text().splitlines())
@@ -0,0 +1,155 @@
+import threading
+import time
+from datetime import datetime
+
+from src.db import init_db, get_connection
+from src.signals.ai_cache import AiResponseCache
+from src.signals.ai_orchestrator import run_sampling, SamplingRun
+from src.signals.ai_sampling import AiSampleResult, compute_ai_sampling_score
+from src.signals.composite import compose_with_fallback
+from src.signals.prompts import Prompt
+
+PROMPTS = [Prompt(f"p{i}", f"prompt {i}") for i in range(5)]
+
+
+class FakeClient:
+    def __init__(self, delay=0.0, fail=None, hang_on=()):
+        self.delay = delay
+        self.fail = fail
+        self.hang_on = set(hang_on)
+        self.timeouts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def query(self, prompt, prompt_id="", timeout=None):
+        self.timeouts.append(timeout)
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(1.0 if prompt_id in self.hang_on else self.delay)
+            if self.fail:
+                raise self.fail
+            return AiSampleResult(model="vendor-id", prompt_id=prompt_id, prompt_text=prompt,
+                                  response_text=f"1. $ABCD for {prompt_id}")
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+
+def test_fan_out_runs_in_about_one_call_time():
+    clients = {m: FakeClient(delay=0.2) for m in ("grok", "gpt-5", "claude-4.7")}
+    run = run_sampling(clients, PROMPTS, provider_concurrency=5)
+    assert not run.degraded
+    assert len(run.results) == 15
+    assert run.elapsed < 0.6          # sequential would be 3.0s
+    assert [r.model for r in run.results[:5]] == ["grok"] * 5     # canonical names, model × prompt order
+    assert clients["grok"].timeouts == [90.0] * 5                 # per-call timeout passed to the SDK
+
+
+def test_provider_concurrency_cap():
+    client = FakeClient(delay=0.05)
+    run = run_sampling({"grok": client}, PROMPTS, provider_concurrency=2)
+    assert len(run.results) == 5
+    assert client.max_in_flight == 2
+
+
+def test_per_call_timeout_returns_partial_and_degraded():
+    clients = {"grok": FakeClient(delay=0.01), "gpt-5": FakeClient(delay=0.01, hang_on={"p3"})}
+    run = run_sampling(clients, PROMPTS, call_timeout=0.2, deadline=5.0)
+    assert run.elapsed < 0.6
+    assert len(run.results) == 9
+    assert run.failures == {("gpt-5", "p3"): "timeout"}
+    assert run.degraded_models == {"gpt-5"}
+    assert "DEGRADED" in run.summary()
+
+
+def test_overall_deadline_and_errors_recorded():
+    clients = {"grok": FakeClient(delay=1.0), "claude-4.7": FakeClient(fail=RuntimeError("503"))}
+    run = run_sampling(clients, PROMPTS[:2], call_timeout=5.0, deadline=0.2)
+    assert run.elapsed < 0.6
+    assert run.results == []
+    assert run.failures[("grok", "p0")] == "deadline"
+    assert run.failures[("claude-4.7", "p1")] == "RuntimeError: 503"
+
+
+def _result(model, text):
+    return AiSampleResult(model=model, prompt_id="p0", prompt_text="", response_text=text)
+
+
+def test_degraded_run_scores_from_the_responses_that_came_back():
+    ok = [_result("gpt-5", "1. $ABCD\n2. $EFGH"), _result("claude-4.7", "1. $ABCD")]
+    clean = SamplingRun(results=ok)
+    degraded = SamplingRun(results=ok, failures={("grok", "p0"): "timeout"})
+    assert degraded.component_scores(["ABCD", "WXYZ"]) == clean.component_scores(["ABCD", "WXYZ"])
+
+    scores = degraded.component_scores(["ABCD", "WXYZ"])
+    assert scores["ABCD"] == compute_ai_sampling_score("ABCD", degraded.mentions())
+    assert scores["EFGH"] is not None
+    assert scores["WXYZ"] is None           # no successful response named it: neutral fallback
+    assert compose_with_fallback(scores["WXYZ"], 0.5, 0.5) == 0.5
+    assert SamplingRun(failures={("grok", "p0"): "timeout"}).component_scores(["ABCD"]) == {"ABCD": None}
+
+
+def test_sdk_timeout_never_outlives_the_run_deadline():
+    client = FakeClient(delay=0.3)
+    run = run_sampling({"grok": client}, PROMPTS[:2], call_timeout=5.0, deadline=0.2,
+                       provider_concurrency=1)
+    assert run.failures == {("grok", "p0"): "deadline", ("grok", "p1"): "deadline"}
+    assert client.timeouts[0] <= 0.2
+    time.sleep(0.4)
+    assert len(client.timeouts) == 1      # the queued call found the deadline passed and never started
+
+
+# --- Same-day response cache ---
+
+def _conn(tmp_path):
+    db = str(tmp_path / "test.db")
+    init_db(db)
+    return get_connection(db)
+
+
+def test_rerun_same_day_makes_no_calls(tmp_path):
+    conn = _conn(tmp_path)
+    morning = datetime(2026, 10, 17, 6, 0)
+
+    clients = {m: FakeClient() for m in ("grok", "gpt-5")}
+    cache = AiResponseCache(conn, now=morning)
+    first = run_sampling(clients, PROMPTS, cache=cache)
+    assert (cache.hits, cache.misses, first.cached) == (0, 10, 0)
+
+    again = {m: FakeClient() for m in ("grok", "gpt-5")}
+    cache = AiResponseCache(conn, now=datetime(2026, 10, 17, 14, 30))
+    rerun = run_sampling(again, PROMPTS, cache=cache)
+    assert (cache.hits, cache.misses, rerun.cached) == (10, 0, 10)
+    assert all(c.timeouts == [] for c in again.values())
+    assert [(r.model, r.prompt_id, r.response_text) for r in rerun.results] == \
+           [(r.model, r.prompt_id, r.response_text) for r in first.results]
+
+    # Next day, force refresh, and edited prompt text are all misses
+    cache = AiResponseCache(conn, now=datetime(2026, 10, 18, 6, 0))
+    run_sampling({"grok": FakeClient()}, PROMPTS[:1], cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+    cache = AiResponseCache(conn, now=morning, force_refresh=True)
+    run_sampling({"grok": FakeClient()}, PROMPTS[:1], cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+    cache = AiResponseCache(conn, now=morning)
+    run_sampling({"grok": FakeClient()}, [Prompt("p0", "prompt 0, reworded")], cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_failed_calls_are_retried_on_rerun(tmp_path):
+    conn = _conn(tmp_path)
+    now = datetime(2026, 10, 17, 6, 0)
+
+    run = run_sampling({"grok": FakeClient(), "gpt-5": FakeClient(fail=RuntimeError("503"))},
+                       PROMPTS[:2], cache=AiResponseCache(conn, now=now))
+    assert run.degraded
+
+    gpt = FakeClient()
+    cache = AiResponseCache(conn, now=now)
+    run = run_sampling({"grok": FakeClient(), "gpt-5": gpt}, PROMPTS[:2], cache=cache)
+    assert not run.degraded
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert len(gpt.timeouts) == 2
@@ -1,7 +1,13 @@
+import random
+
+import anthropic
+import httpx
+
+from src.integrations import http
 from src.signals.ai_sampling import (
     AiSampleResult, MODEL_WEIGHTS, build_client, extract_tickers,
     compute_rank_weight, extract_ranked_tickers, compute_ai_sampling_score,
-    MentionRecord,
+    MentionRecord, TickerExtractor, TickerMention, score_all_ai_sampling,
 )
 
 def test_model_weights_sum_to_one():
@@ -15,6 +21,15 @@ def test_build_client_returns_callable():
     client = build_client("grok", api_key="fake")
     assert callable(client.query)
 
+def test_sdk_clients_share_the_pooled_http_client_only_when_the_sdk_takes_one():
+    http.close_all()
+    build_client("grok", api_key="fake")
+    build_client("claude-4.7", api_key="fake")
+    assert "api.x.ai" in http._clients
+    shares = issubclass(anthropic.DefaultHttpxClient, httpx.Client)
+    assert ("api.anthropic.com" in http._clients) == shares
+    http.close_all()
+
 # --- Ticker extraction ---
 
 def test_cashtag_extraction():
@@ -79,3 +94,53 @@ def test_clamp_to_one():
     ]
     score = compute_ai_sampling_score("ABCD", mentions)
     assert score == 1.0
+
+def test_score_all_matches_per_ticker_scoring_exactly():
+    rng = random.Random(3)
+    models = list(MODEL_WEIGHTS) + ["unknown-model"]
+    tickers = [f"T{i:03d}" for i in range(200)]
+    mentions = [
+        MentionRecord(ticker=rng.choice(tickers), model=rng.choice(models),
+                      rank=rng.randint(0, 12), is_fresh=rng.random() < 0.1)
+        for _ in range(2000)
+    ]
+    got = score_all_ai_sampling(mentions)
+    assert got == {t: compute_ai_sampling_score(t, mentions) for t in {m.ticker for m in mentions}}
+    assert list(got) == list(dict.fromkeys(m.ticker for m in mentions))
+    assert score_all_ai_sampling([]) == {}
+
+# --- Known-symbol extractor ---
+
+KNOWN = ["AAPL", "NVDA", "AMD", "TSM", "RKLB", "NOW", "F"]
+
+def test_extractor_reports_rank_position_and_cashtag():
+    text = "Picks:\n1. AAPL — iPhone\n2. $NVDA — GPUs, cheaper than AAPL\n3. AMD\nAlso watch $RKLB"
+    got = TickerExtractor(KNOWN).mentions(text)
+    assert got == [
+        TickerMention("AAPL", 0, text.index("AAPL"), False),
+        TickerMention("NVDA", 1, text.index("$NVDA"), True),
+        TickerMention("AMD", 2, text.index("AMD"), False),
+        TickerMention("RKLB", -1, text.index("$RKLB"), True),
+    ]
+
+def test_extractor_rejects_unlisted_and_blocklisted_barewords():
+    text = "MY TOP PICKS NOW: XYZW, $F and NOW again, TSM"
+    assert TickerExtractor(KNOWN).extract(text) == ["F", "TSM"]
+    assert TickerExtractor(KNOWN).extract("$NOW looks good") == ["NOW"]
+
+def test_extractor_matches_legacy_ranking_on_listed_symbols():
+    text = "Here are 5 picks:\n1. AAPL — iPhone\n2. NVDA — GPUs\n3. AMD"
+    assert TickerExtractor(KNOWN).extract_ranked(text) == extract_ranked_tickers(text)
+    flat = "I like $AAPL and TSM here"
+    assert TickerExtractor(KNOWN).extract_ranked(flat) == extract_ranked_tickers(flat)
+
+def test_extractor_ranks_a_lines_cashtag_first_like_legacy():
+    text = "1. Buy now: AMD vs $NVDA\n2. TSM"
+    assert TickerExtractor(KNOWN).extract_ranked(text) == extract_ranked_tickers(text) == [("NVDA", 0), ("TSM", 1)]
+    flat = "I like TSM more than $AAPL"
+    assert TickerExtractor(KNOWN).extract_ranked(flat) == extract_ranked_tickers(flat) == [("AAPL", 0), ("TSM", 1)]
+
+def test_extractor_from_file_reads_listing(tmp_path):
+    listing = tmp_path / "nasdaqlisted.txt"
+    listing.write_text("Symbol|Security Name\nAAPL|Apple Inc.\nNVDA|NVIDIA\nFile Creation Time: 0515\n")
+    assert TickerExtractor.from_file(str(listing)).symbols == {"AAPL", "NVDA"}
@@ -0,0 +1,78 @@
+import math
+
+import numpy as np
+
+from src.signals.batch import (
+    compute_velocity_batch, score_velocity_batch, compute_rvol_batch,
+    score_volume_anomaly_batch, compose_with_fallback_batch,
+)
+from src.signals.composite import compose_with_fallback
+from src.signals.social_velocity import compute_velocity, score_velocity
+from src.signals.volume_anomaly import compute_rvol, score_volume_anomaly
+
+# Every bucket edge, a hair either side of it, and the extremes
+EDGES = [1.5, 2.0, 3.0, 5.0, 10.0]
+PROBES = [v for e in EDGES for v in (np.nextafter(e, 0), e, np.nextafter(e, 100))] + \
+         [-1.0, 0.0, 0.5, 1.0, 4.0, 7.5, 1e9, math.inf]
+
+
+def _same(batch, scalar):
+    """Element-for-element equality, with None ↔ NaN."""
+    assert len(batch) == len(scalar)
+    for b, s in zip(batch.tolist(), scalar):
+        assert (s is None and math.isnan(b)) or b == s, (b, s)
+
+
+def test_score_steps_match_scalar_at_every_edge():
+    _same(score_velocity_batch(PROBES), [score_velocity(v) for v in PROBES])
+    _same(score_volume_anomaly_batch(PROBES), [score_volume_anomaly(v) for v in PROBES])
+    assert math.isnan(score_velocity_batch([np.nan])[0])
+
+
+def test_ratios_match_scalar():
+    rng = np.random.default_rng(1)
+    today = rng.integers(0, 500, 1000).astype(float)
+    avg = rng.integers(-5, 100, 1000).astype(float)
+    _same(compute_velocity_batch(today, avg), [compute_velocity(t, a) for t, a in zip(today, avg)])
+    _same(compute_rvol_batch(today, avg), [compute_rvol(t, a) for t, a in zip(today, avg)])
+    assert math.isnan(compute_rvol_batch([np.nan], [10.0])[0])
+
+
+def test_ratio_missing_input_is_nan_even_with_nonpositive_denominator():
+    got = compute_velocity_batch([np.nan, np.nan, 5.0, 5.0], [0.0, -3.0, np.nan, 0.0])
+    assert np.isnan(got[:3]).all()
+    assert got[3] == 0.0
+
+
+def test_compose_matches_scalar_with_missing_components():
+    rng = np.random.default_rng(2)
+    cols = rng.choice([0.0, 0.3, 0.6, 0.85, 0.9, 1.0, 0.123, np.nan], size=(3, 2000))
+    expected = [
+        compose_with_fallback(*(None if math.isnan(v) else float(v) for v in col))
+        for col in cols.T
+    ]
+    _same(compose_with_fallback_batch(*cols), expected)
+    assert compose_with_fallback_batch([np.nan], [np.nan], [np.nan]).tolist() == [0.5]
+
+
+def test_end_to_end_pipeline_matches_scalar():
+    rng = np.random.default_rng(3)
+    n = 500
+    mentions, mentions_avg = rng.integers(0, 200, n), rng.uniform(0, 40, n)
+    volume, volume_avg = rng.uniform(0, 5e6, n), rng.uniform(0, 2e6, n)
+    ai = np.where(rng.random(n) < 0.2, np.nan, rng.random(n))
+
+    batch = compose_with_fallback_batch(
+        ai,
+        score_velocity_batch(compute_velocity_batch(mentions, mentions_avg)),
+        score_volume_anomaly_batch(compute_rvol_batch(volume, volume_avg)),
+    )
+    scalar = [
+        compose_with_fallback(
+            None if math.isnan(ai[i]) else ai[i],
+            score_velocity(compute_velocity(int(mentions[i]), mentions_avg[i])),
+            score_volume_anomaly(compute_rvol(volume[i], volume_avg[i])),
+        )
+        for i in range(n)
+    ]
+    _same(batch, scalar)
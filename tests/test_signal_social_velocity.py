@@ -1,10 +1,17 @@
 import json
 from pathlib import Path
+
+import httpx
+import pytest
+
+from src.db import init_db, get_connection
 from src.signals.social_velocity import (
     parse_apewisdom_response,
     compute_velocity,
     score_velocity,
     passes_noise_floor,
+    fetch_apewisdom,
+    ApewisdomFetcher,
 )
 
 FIX = Path(__file__).parent / "fixtures/apewisdom/apewisdom_sample.json"
@@ -29,3 +36,89 @@ def test_velocity_scoring_bands():
 def test_noise_floor():
     assert passes_noise_floor(mentions_today=4) is False
     assert passes_noise_floor(mentions_today=5) is True
+
+
+# --- Full-snapshot ingestion ---
+
+def _setup(tmp_path):
+    db = str(tmp_path / "test.db")
+    init_db(db)
+    return get_connection(db)
+
+
+def _apewisdom_transport(pages=3, per_page=2, etag='"v1"'):
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        page = int(request.url.path.rsplit("/", 1)[1])
+        if etag and request.headers.get("If-None-Match") == etag:
+            return httpx.Response(304)
+        results = [{"ticker": f"t{page}{i}", "mentions": page * 10 + i, "sentiment": 0.5}
+                   for i in range(per_page)]
+        return httpx.Response(200, json={"count": pages * per_page, "pages": pages,
+                                         "currentPage": page, "results": results},
+                              headers={"ETag": etag} if etag else {})
+    return httpx.MockTransport(handler), seen
+
+
+def test_fetcher_pulls_every_page_into_the_snapshot_writer(tmp_path):
+    conn = _setup(tmp_path)
+    transport, seen = _apewisdom_transport(pages=3)
+    with httpx.Client(transport=transport) as client:
+        report = ApewisdomFetcher(client).fetch(conn, "2026-10-17T06:00:00")
+    assert (report.pages, report.rows, report.not_modified) == (3, 6, False)
+    assert sorted(r.url.path for r in seen)[-1].endswith("/filter/all-stocks/page/3")
+    got = conn.execute("SELECT ticker, mentions_count FROM social_snapshots ORDER BY ticker").fetchall()
+    assert [tuple(r) for r in got] == [("T10", 10), ("T11", 11), ("T20", 20), ("T21", 21), ("T30", 30), ("T31", 31)]
+
+
+def test_failed_page_stores_nothing(tmp_path):
+    conn = _setup(tmp_path)
+    transport, _ = _apewisdom_transport(pages=3)
+
+    def handler(request):
+        if request.url.path.endswith("/page/3"):
+            return httpx.Response(503)
+        return transport.handle_request(request)
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(httpx.HTTPStatusError):
+            ApewisdomFetcher(client).fetch(conn, "2026-10-17T06:00:00")
+    assert conn.execute("SELECT COUNT(*) FROM social_snapshots").fetchone()[0] == 0
+    assert conn.execute("SELECT COUNT(*) FROM social_daily").fetchone()[0] == 0
+
+
+def test_unchanged_snapshot_costs_one_conditional_request(tmp_path):
+    conn = _setup(tmp_path)
+    transport, seen = _apewisdom_transport(pages=3)
+    state = str(tmp_path / "apewisdom.json")
+    with httpx.Client(transport=transport) as client:
+        ApewisdomFetcher(client, state_path=state).fetch(conn, "2026-10-17T06:00:00")
+        seen.clear()
+        # New process, same day: validators come from state_path
+        again = ApewisdomFetcher(client, state_path=state).fetch(conn, "2026-10-17T14:30:00")
+        assert again.not_modified and again.rows == 0
+        assert len(seen) == 1 and seen[0].headers["If-None-Match"] == '"v1"'
+
+        # First fetch of a new day is unconditional
+        seen.clear()
+        next_day = ApewisdomFetcher(client, state_path=state).fetch(conn, "2026-10-18T06:00:00")
+        assert not next_day.not_modified and next_day.rows == 6
+        assert "If-None-Match" not in seen[0].headers
+
+
+def test_fetch_apewisdom_uses_the_shared_pooled_client(monkeypatch):
+    transport, seen = _apewisdom_transport(pages=1)
+    shared = httpx.Client(transport=transport)
+    monkeypatch.setattr("src.signals.social_velocity.client_for", lambda host: shared)
+    assert [r.ticker for r in fetch_apewisdom()] == ["T10", "T11"]
+    assert [r.ticker for r in fetch_apewisdom()] == ["T10", "T11"]
+    assert len(seen) == 2 and not shared.is_closed
+
+
+def test_fetch_apewisdom_timeout_is_deprecated_but_accepted(monkeypatch):
+    transport, _ = _apewisdom_transport(pages=1)
+    monkeypatch.setattr("src.signals.social_velocity.client_for", lambda host: httpx.Client(transport=transport))
+    with pytest.warns(DeprecationWarning):
+        assert len(fetch_apewisdom(timeout=10.0)) == 2
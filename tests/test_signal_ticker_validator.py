@@ -1,3 +1,7 @@
+from datetime import datetime, timedelta
+
+from src.db import init_db, get_connection
+from src.signals.ai_sampling import TickerExtractor
 from src.signals.ticker_validator import validate_tickers
 
 class FakeClient:
@@ -17,3 +21,60 @@ def test_dedup():
     client = FakeClient({"AAPL"})
     valid, _ = validate_tickers(["AAPL", "AAPL", "aapl"], client)
     assert valid == ["AAPL"]  # dedup + normalize case
+
+
+# --- Batch lookups + validity cache ---
+
+class FakeBatchClient:
+    def __init__(self, valid_symbols, failing=()):
+        self._valid = set(valid_symbols)
+        self._failing = set(failing)
+        self.requested = []
+        self.last_quote_errors = {}
+
+    def get_quotes(self, tickers):
+        self.requested.append(list(tickers))
+        self.last_quote_errors = {t: RuntimeError("chunk failed") for t in tickers if t in self._failing}
+        return {t: object() for t in tickers if t in self._valid and t not in self._failing}
+
+
+def _conn(tmp_path):
+    init_db(str(tmp_path / "t.db"))
+    return get_connection(str(tmp_path / "t.db"))
+
+
+def test_batch_client_validates_in_one_request():
+    client = FakeBatchClient({"AAPL", "XYZ"})
+    valid, rejected = validate_tickers(["AAPL", "FAKE", "xyz", "AAPL"], client)
+    assert (valid, rejected) == (["AAPL", "XYZ"], ["FAKE"])
+    assert client.requested == [["AAPL", "FAKE", "XYZ"]]
+
+
+def test_cache_serves_repeat_runs_with_separate_ttls(tmp_path):
+    conn = _conn(tmp_path)
+    t0 = datetime(2026, 5, 15, 6, 0)
+    client = FakeBatchClient({"AAPL"})
+    validate_tickers(["AAPL", "FAKE"], client, conn=conn, now=t0)
+
+    client.requested.clear()
+    assert validate_tickers(["AAPL", "FAKE"], client, conn=conn, now=t0 + timedelta(hours=12)) == (["AAPL"], ["FAKE"])
+    assert client.requested == []
+    # Two days later the negative entry has expired, the positive one hasn't
+    client = FakeBatchClient({"AAPL", "FAKE"})
+    assert validate_tickers(["AAPL", "FAKE"], client, conn=conn, now=t0 + timedelta(days=2)) == (["AAPL", "FAKE"], [])
+    assert client.requested == [["FAKE"]]
+
+
+def test_failed_lookups_are_rejected_but_not_cached(tmp_path):
+    conn = _conn(tmp_path)
+    now = datetime(2026, 5, 15, 6, 0)
+    assert validate_tickers(["AAPL"], FakeBatchClient({"AAPL"}, failing={"AAPL"}), conn=conn, now=now) == ([], ["AAPL"])
+    client = FakeBatchClient({"AAPL"})
+    assert validate_tickers(["AAPL"], client, conn=conn, now=now) == (["AAPL"], [])
+    assert client.requested == [["AAPL"]]
+
+
+def test_validated_symbols_feed_the_extractor(tmp_path):
+    conn = _conn(tmp_path)
+    validate_tickers(["RKLB", "FAKE"], FakeBatchClient({"RKLB"}), conn=conn)
+    assert TickerExtractor.from_db(conn).extract("1. RKLB\n2. FAKE") == ["RKLB"]
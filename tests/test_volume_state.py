@@ -0,0 +1,78 @@
+from datetime import date, timedelta
+
+from src.db import init_db, get_connection, save_price_bars, get_avg_volumes, get_volume_states
+from src.integrations.bar_cache import BarCache
+from src.integrations.schwab_client import PriceBar
+from src.signals.volume_state import VolumeState, fold_daily_bars, rebuild_volume_state
+
+TODAY = date(2026, 10, 17)
+
+
+def _setup(tmp_path):
+    db = tmp_path / "t.db"
+    init_db(str(db))
+    return get_connection(str(db))
+
+
+def _bars(first: date, n: int, volume=lambda i: 1000 + i):
+    return [PriceBar(date=(first + timedelta(days=i)).isoformat(), open=1.0, high=1.0, low=1.0,
+                     close=1.0, volume=volume(i)) for i in range(n)]
+
+
+def test_ring_keeps_last_window_days_and_running_sum():
+    s = VolumeState("ABCD", window_days=3)
+    for i, v in enumerate([10, 20, 30, 40, 50]):
+        assert s.push(f"2026-10-0{i + 1}", v)
+    assert s.ring == [30, 40, 50] and s.volume_sum == 120 and s.day_count == 3
+    assert s.avg == 40
+    assert not s.push("2026-10-05", 999)       # already folded in
+    assert s.volume_sum == 120
+
+
+def test_incremental_fold_matches_rebuild(tmp_path):
+    conn = _setup(tmp_path)
+    history = _bars(TODAY - timedelta(days=45), 46)     # through today
+    save_price_bars(conn, "ABCD", "daily", history[:40])
+    assert fold_daily_bars(conn, {"ABCD": history[:40]}, today=TODAY - timedelta(days=6)) == 1
+
+    # One new day at a time, as daily scans would
+    for k in range(40, 46):
+        save_price_bars(conn, "ABCD", "daily", history[k - 1:k + 1])
+        fold_daily_bars(conn, {"ABCD": history[k - 1:k + 1]}, today=TODAY - timedelta(days=45 - k))
+    incremental = get_volume_states(conn, ["ABCD"])["ABCD"]
+
+    rebuild_volume_state(conn, today=TODAY)
+    rebuilt = get_volume_states(conn, ["ABCD"])["ABCD"]
+    assert incremental == rebuilt
+    completed = [b.volume for b in history[:-1]][-30:]          # today's bar is still forming
+    assert rebuilt["ring"] == completed and rebuilt["day_count"] == 30
+    assert rebuilt["last_bar_date"] == (TODAY - timedelta(days=1)).isoformat()
+    assert get_avg_volumes(conn) == {"ABCD": sum(completed) / 30}
+
+
+def test_young_listing_averages_available_days(tmp_path):
+    conn = _setup(tmp_path)
+    bars = _bars(TODAY - timedelta(days=5), 6, volume=lambda i: 100)
+    save_price_bars(conn, "NEWCO", "daily", bars)
+    fold_daily_bars(conn, {"NEWCO": bars}, today=TODAY)
+    assert get_volume_states(conn, ["NEWCO"])["NEWCO"]["day_count"] == 5
+    assert get_avg_volumes(conn, ["NEWCO", "NONE"]) == {"NEWCO": 100.0}
+
+
+def test_bar_cache_keeps_volume_state_current(tmp_path):
+    class History:
+        def __init__(self):
+            self.requests = 0
+
+        def get_price_history_bulk(self, tickers, days=10, frequency="daily"):
+            self.requests += 1
+            first = date.today() - timedelta(days=days - 1)
+            return {t: _bars(first, days, volume=lambda i: 500) for t in tickers}, {}
+
+    conn = _setup(tmp_path)
+    history = History()
+    BarCache(history, conn).get_price_history_bulk(["ABCD", "WXYZ"], days=40)
+    assert get_avg_volumes(conn) == {"ABCD": 500.0, "WXYZ": 500.0}
+    state = get_volume_states(conn, ["ABCD"])["ABCD"]
+    assert state["last_bar_date"] == (date.today() - timedelta(days=1)).isoformat()
+    assert history.requests == 1